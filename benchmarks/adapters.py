@@ -0,0 +1,299 @@
+"""Measure latency, request count, and bytes transferred of config/secret adapters.
+
+Each adapter talks to an in-process stand-in backend (see ``benchmarks/backends.py``)
+over HTTP using its real SDK, so the numbers reflect the number and size of requests
+made by adapters, not the performance of real backends. Example:
+
+.. code-block:: sh
+
+    python benchmarks/adapters.py --sizes 10 100 1000 --repeat 5 --output results.json
+    python benchmarks/adapters.py --adapters consul_config vault_secret --sizes 100
+
+The report is printed (or written to ``--output``) as JSON, containing one entry
+per adapter, number of keys, and operation (``get``, ``get_all``, ``set``, ``set_all``).
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backends import AwsSecretsManagerBackend  # noqa: E402
+from backends import ConsulBackend  # noqa: E402
+from backends import GoogleSecretManagerBackend  # noqa: E402
+from backends import KubernetesBackend  # noqa: E402
+from backends import VaultBackend  # noqa: E402
+
+#: Number of ``get`` calls per measurement.
+GET_CALLS = 10
+
+
+@contextlib.contextmanager
+def environ(**values):
+    """Temporarily set environment variables."""
+    orig = {k: os.environ.get(k) for k in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for k, v in orig.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+def _aws_env(backend):
+    return {
+        "GLUU_AWS_SECRETS_ENDPOINT_URL": backend.url,
+        "AWS_ACCESS_KEY_ID": "benchmark",
+        "AWS_SECRET_ACCESS_KEY": "benchmark",
+        "AWS_DEFAULT_REGION": "us-east-1",
+    }
+
+
+def _google_client(backend):
+    from google.auth.credentials import AnonymousCredentials
+    from google.cloud import secretmanager
+
+    return secretmanager.SecretManagerServiceClient(
+        transport="rest",
+        credentials=AnonymousCredentials(),
+        client_options={"api_endpoint": backend.url},
+    )
+
+
+def _kubernetes_client(backend):
+    import kubernetes.client
+
+    config = kubernetes.client.Configuration()
+    config.host = backend.url
+    return kubernetes.client.CoreV1Api(kubernetes.client.ApiClient(config))
+
+
+def consul_config(backend, workdir):  # noqa: D103
+    from pygluu.containerlib.config.consul_config import ConsulConfig
+
+    with environ(
+        GLUU_CONFIG_CONSUL_HOST="127.0.0.1",
+        GLUU_CONFIG_CONSUL_PORT=str(backend.port),
+        GLUU_CONFIG_CONSUL_TOKEN_FILE=os.path.join(workdir, "consul_token"),
+    ):
+        return ConsulConfig()
+
+
+def vault_secret(backend, workdir):  # noqa: D103
+    from pygluu.containerlib.secret.vault_secret import VaultSecret
+
+    role_id_file = os.path.join(workdir, "vault_role_id")
+    secret_id_file = os.path.join(workdir, "vault_secret_id")
+    for path in (role_id_file, secret_id_file):
+        with open(path, "w") as f:
+            f.write("benchmark")
+
+    with environ(
+        GLUU_SECRET_VAULT_HOST="127.0.0.1",
+        GLUU_SECRET_VAULT_PORT=str(backend.port),
+        GLUU_SECRET_VAULT_ROLE_ID_FILE=role_id_file,
+        GLUU_SECRET_VAULT_SECRET_ID_FILE=secret_id_file,
+    ):
+        return VaultSecret()
+
+
+def kubernetes_config(backend, workdir):  # noqa: D103
+    from pygluu.containerlib.config.kubernetes_config import KubernetesConfig
+
+    with environ(GLUU_CONFIG_KUBERNETES_USE_KUBE_CONFIG="false"):
+        adapter = KubernetesConfig()
+    adapter._client = _kubernetes_client(backend)
+    return adapter
+
+
+def kubernetes_secret(backend, workdir):  # noqa: D103
+    from pygluu.containerlib.secret.kubernetes_secret import KubernetesSecret
+
+    with environ(GLUU_SECRET_KUBERNETES_USE_KUBE_CONFIG="false"):
+        adapter = KubernetesSecret()
+    adapter._client = _kubernetes_client(backend)
+    return adapter
+
+
+def aws_config(backend, workdir):  # noqa: D103
+    from pygluu.containerlib.config.aws_config import AwsConfig
+
+    with environ(**_aws_env(backend)):
+        adapter = AwsConfig()
+        # create the client while endpoint is set
+        adapter.client
+    return adapter
+
+
+def aws_secret(backend, workdir):  # noqa: D103
+    from pygluu.containerlib.secret.aws_secret import AwsSecret
+
+    with environ(**_aws_env(backend)):
+        adapter = AwsSecret()
+        adapter.client
+    return adapter
+
+
+def google_config(backend, workdir):  # noqa: D103
+    from pygluu.containerlib.config.google_config import GoogleConfig
+
+    with environ(GOOGLE_PROJECT_ID="benchmark"):
+        adapter = GoogleConfig()
+    adapter.client = _google_client(backend)
+    return adapter
+
+
+def google_secret(backend, workdir):  # noqa: D103
+    from pygluu.containerlib.secret.google_secret import GoogleSecret
+
+    with environ(GOOGLE_PROJECT_ID="benchmark"):
+        adapter = GoogleSecret()
+    adapter.client = _google_client(backend)
+    return adapter
+
+
+#: Mapping of adapter name, its backend class, and its factory.
+ADAPTERS = {
+    "consul_config": (ConsulBackend, consul_config),
+    "vault_secret": (VaultBackend, vault_secret),
+    "kubernetes_config": (KubernetesBackend, kubernetes_config),
+    "kubernetes_secret": (KubernetesBackend, kubernetes_secret),
+    "aws_config": (AwsSecretsManagerBackend, aws_config),
+    "aws_secret": (AwsSecretsManagerBackend, aws_secret),
+    "google_config": (GoogleSecretManagerBackend, google_config),
+    "google_secret": (GoogleSecretManagerBackend, google_secret),
+}
+
+
+def make_data(size, value_size, generation=0):
+    """Generate key-value pairs.
+
+    :param size: Number of keys.
+    :param value_size: Length of each value.
+    :param generation: Number to make values different from previous generation.
+    :returns: A mapping of generated key-value pairs.
+    """
+    return {
+        f"key_{i:05d}": f"{generation}-{i}-".ljust(value_size, "x")
+        for i in range(size)
+    }
+
+
+def measure(backend, func, calls=1):
+    """Run function and collect its latency and traffic to backend.
+
+    :param backend: Backend used by the function.
+    :param func: Function to measure.
+    :param calls: Number of calls made by the function (used to compute per-call numbers).
+    :returns: A tuple of per-call latency (in seconds) and backend stats.
+    """
+    backend.reset_stats()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    stats = backend.stats()
+    return elapsed / calls, {k: v / calls for k, v in stats.items()}
+
+
+def summarize(adapter, size, op, samples):
+    """Aggregate samples of a single operation.
+
+    :param adapter: Name of the adapter.
+    :param size: Number of keys.
+    :param op: Name of the operation.
+    :param samples: List of tuples of latency and backend stats.
+    :returns: A mapping of aggregated results.
+    """
+    latencies = [latency * 1000 for latency, _ in samples]
+    stats = [stat for _, stat in samples]
+    return {
+        "adapter": adapter,
+        "keys": size,
+        "op": op,
+        "runs": len(samples),
+        "latency_ms": {
+            "mean": round(statistics.mean(latencies), 3),
+            "p50": round(statistics.median(latencies), 3),
+            "min": round(min(latencies), 3),
+            "max": round(max(latencies), 3),
+        },
+        "requests": round(statistics.mean(s["requests"] for s in stats), 2),
+        "bytes_sent": round(statistics.mean(s["bytes_received"] for s in stats)),
+        "bytes_received": round(statistics.mean(s["bytes_sent"] for s in stats)),
+    }
+
+
+def run(name, sizes, repeat, value_size):
+    """Benchmark a single adapter.
+
+    Note that ``bytes_sent`` and ``bytes_received`` are reported from the adapter's
+    point of view.
+
+    :param name: Name of the adapter.
+    :param sizes: Number of keys to benchmark.
+    :param repeat: Number of runs of each operation.
+    :param value_size: Length of each value.
+    :returns: List of results.
+    """
+    backend_cls, factory = ADAPTERS[name]
+    results = []
+
+    with backend_cls() as backend, tempfile.TemporaryDirectory() as workdir:
+        adapter = factory(backend, workdir)
+
+        for size in sizes:
+            backend.reset()
+            data = make_data(size, value_size)
+            adapter.set_all(data)
+
+            # consecutive keys spread across the data
+            keys = list(data)[::max(1, size // GET_CALLS)][:GET_CALLS]
+            samples = {"get": [], "get_all": [], "set": [], "set_all": []}
+
+            for generation in range(1, repeat + 1):
+                samples["get_all"].append(measure(backend, adapter.get_all))
+                samples["get"].append(
+                    measure(backend, lambda: [adapter.get(key) for key in keys], calls=len(keys))
+                )
+                samples["set"].append(
+                    measure(backend, lambda: adapter.set(keys[0], f"updated-{generation}"))
+                )
+                new_data = make_data(size, value_size, generation)
+                samples["set_all"].append(measure(backend, lambda: adapter.set_all(new_data)))
+
+            results.extend(summarize(name, size, op, op_samples) for op, op_samples in samples.items())
+    return results
+
+
+def main():  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--adapters", nargs="+", choices=sorted(ADAPTERS), default=sorted(ADAPTERS), help="Adapters to benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Number of keys")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs of each operation")
+    parser.add_argument("--value-size", type=int, default=64, help="Length of each value")
+    parser.add_argument("--output", default="", help="Write JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    results = []
+    for name in args.adapters:
+        results.extend(run(name, args.sizes, max(1, args.repeat), args.value_size))
+
+    report = json.dumps({"python": sys.version.split()[0], "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,440 @@
+"""In-process stand-in HTTP servers of config/secret backends used by benchmarks.
+
+Each backend implements the subset of the HTTP API used by the adapters in
+``pygluu.containerlib.config`` and ``pygluu.containerlib.secret``, keeps its
+state in memory, and counts requests and bytes transferred.
+"""
+
+import base64
+import json
+import re
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from urllib.parse import parse_qs
+from urllib.parse import unquote
+from urllib.parse import urlsplit
+
+
+class Response:
+    """HTTP response returned by backend handlers."""
+
+    def __init__(self, status=200, body=None, headers=None):
+        self.status = status
+        self.headers = headers or {}
+
+        if body is None:
+            self.body = b""
+        elif isinstance(body, bytes):
+            self.body = body
+        else:
+            self.body = json.dumps(body).encode()
+            self.headers.setdefault("Content-Type", "application/json")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        url = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+        resp = self.server.backend.dispatch(self.command, unquote(url.path), query, self.headers, body)
+
+        # approximate size of request and response (request line, headers, and body);
+        # recorded before the response is sent, so the client never sees a response
+        # whose request is not counted yet
+        self.server.backend.record(
+            len(self.requestline) + len(str(self.headers)) + len(body),
+            len(resp.body) + sum(len(k) + len(v) + 4 for k, v in resp.headers.items()),
+        )
+
+        self.send_response(resp.status)
+        for name, value in resp.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(resp.body)))
+        self.end_headers()
+        self.wfile.write(resp.body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_LIST = _handle
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+
+class FakeBackend:
+    """Base class of stand-in backend served over HTTP on a random local port."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.backend = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def record(self, received, sent):
+        with self.lock:
+            self.requests += 1
+            self.bytes_received += received
+            self.bytes_sent += sent
+
+    def stats(self):
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+            }
+
+    def reset_stats(self):
+        with self.lock:
+            self.requests = self.bytes_sent = self.bytes_received = 0
+
+    def reset(self):
+        """Remove all stored data."""
+        raise NotImplementedError
+
+    def dispatch(self, method, path, query, headers, body):
+        with self.lock:
+            return self.handle(method, path, query, headers, body)
+
+    def handle(self, method, path, query, headers, body):
+        raise NotImplementedError
+
+
+class ConsulBackend(FakeBackend):
+    """Consul KV and transaction API."""
+
+    def reset(self):
+        self.index = 1
+        self.kv = {}
+
+    def __init__(self):
+        super().__init__()
+        self.reset()
+
+    def _entry(self, key):
+        value, index = self.kv[key]
+        return {
+            "Key": key,
+            "Value": base64.b64encode(value).decode() if value is not None else None,
+            "Flags": 0,
+            "CreateIndex": index,
+            "ModifyIndex": index,
+            "LockIndex": 0,
+        }
+
+    def _set(self, key, value):
+        self.index += 1
+        self.kv[key] = (value, self.index)
+
+    def handle(self, method, path, query, headers, body):
+        index_header = {"X-Consul-Index": str(self.index)}
+
+        if path.startswith("/v1/kv/"):
+            key = path[len("/v1/kv/"):]
+
+            if method == "GET":
+                if "recurse" in query:
+                    entries = [self._entry(k) for k in sorted(self.kv) if k.startswith(key)]
+                else:
+                    entries = [self._entry(key)] if key in self.kv else []
+
+                if not entries:
+                    return Response(404, headers=index_header)
+                return Response(200, entries, headers=index_header)
+
+            if method == "PUT":
+                self._set(key, body)
+                return Response(200, True, headers={"X-Consul-Index": str(self.index)})
+
+        if path == "/v1/txn" and method == "PUT":
+            results = []
+            for op in json.loads(body):
+                kv = op["KV"]
+                self._set(kv["Key"], base64.b64decode(kv.get("Value") or ""))
+                results.append({"KV": dict(self._entry(kv["Key"]), Value=None)})
+            return Response(200, {"Results": results, "Errors": None}, headers={"X-Consul-Index": str(self.index)})
+        return Response(404)
+
+
+class VaultBackend(FakeBackend):
+    """Vault AppRole login, token lookup, and KV (v1) API."""
+
+    def reset(self):
+        self.kv = {}
+
+    def __init__(self):
+        super().__init__()
+        self.reset()
+        self.token = str(uuid.uuid4())
+
+    def handle(self, method, path, query, headers, body):
+        if path == "/v1/auth/approle/login":
+            return Response(200, {"auth": {"client_token": self.token, "lease_duration": 3600, "renewable": True}})
+
+        if path == "/v1/auth/token/lookup-self":
+            if headers.get("X-Vault-Token") != self.token:
+                return Response(403, {"errors": ["permission denied"]})
+            return Response(200, {"data": {"id": self.token, "ttl": 3600}})
+
+        if not path.startswith("/v1/"):
+            return Response(404, {"errors": []})
+
+        key = path[len("/v1/"):]
+
+        if method == "LIST" or (method == "GET" and query.get("list") == "true"):
+            prefix = key.rstrip("/") + "/"
+            keys = [k[len(prefix):] for k in sorted(self.kv) if k.startswith(prefix)]
+            if not keys:
+                return Response(404, {"errors": []})
+            return Response(200, {"data": {"keys": keys}})
+
+        if method == "GET":
+            if key not in self.kv:
+                return Response(404, {"errors": []})
+            return Response(200, {"data": self.kv[key]})
+
+        if method in ("POST", "PUT"):
+            self.kv[key] = json.loads(body or b"{}")
+            return Response(204)
+        return Response(405, {"errors": []})
+
+
+class KubernetesBackend(FakeBackend):
+    """Kubernetes core/v1 ConfigMap and Secret API."""
+
+    _path_re = re.compile(r"^/api/v1/namespaces/(?P<ns>[^/]+)/(?P<kind>configmaps|secrets)(?:/(?P<name>[^/]+))?$")
+
+    def reset(self):
+        self.version = 1
+        self.objects = {}
+
+    def __init__(self):
+        super().__init__()
+        self.reset()
+
+    def _not_found(self, kind, name):
+        return Response(404, {
+            "kind": "Status",
+            "apiVersion": "v1",
+            "status": "Failure",
+            "reason": "NotFound",
+            "message": f"{kind} {name!r} not found",
+            "code": 404,
+        })
+
+    def _store(self, kind, ns, obj):
+        self.version += 1
+        obj.setdefault("metadata", {})
+        obj["metadata"]["namespace"] = ns
+        obj["metadata"]["resourceVersion"] = str(self.version)
+        obj["kind"] = "ConfigMap" if kind == "configmaps" else "Secret"
+        obj["apiVersion"] = "v1"
+        self.objects[(kind, ns, obj["metadata"]["name"])] = obj
+        return Response(200, obj)
+
+    def handle(self, method, path, query, headers, body):
+        match = self._path_re.match(path)
+        if not match:
+            return Response(404, {"kind": "Status", "code": 404})
+
+        kind, ns, name = match.group("kind"), match.group("ns"), match.group("name")
+
+        if method == "POST" and not name:
+            obj = json.loads(body)
+            if (kind, ns, obj["metadata"]["name"]) in self.objects:
+                return Response(409, {"kind": "Status", "reason": "AlreadyExists", "code": 409})
+            resp = self._store(kind, ns, obj)
+            resp.status = 201
+            return resp
+
+        if (kind, ns, name) not in self.objects:
+            return self._not_found(kind, name)
+
+        obj = self.objects[(kind, ns, name)]
+
+        if method == "GET":
+            return Response(200, obj)
+
+        if method == "PATCH":
+            # strategic merge patch of data (the only field patched by adapters)
+            patch = json.loads(body)
+            data = dict(obj.get("data") or {})
+            data.update(patch.get("data") or {})
+            return self._store(kind, ns, dict(obj, data=data))
+
+        if method == "PUT":
+            return self._store(kind, ns, json.loads(body))
+        return Response(405, {"kind": "Status", "code": 405})
+
+
+class AwsSecretsManagerBackend(FakeBackend):
+    """AWS Secrets Manager JSON (1.1) API."""
+
+    def reset(self):
+        self.secrets = {}
+
+    def __init__(self):
+        super().__init__()
+        self.reset()
+
+    def _error(self, code, message=""):
+        return Response(400, {"__type": code, "message": message}, headers={"Content-Type": "application/x-amz-json-1.1"})
+
+    def _put(self, name, params):
+        version_id = str(uuid.uuid4())
+        secret = {"Name": name, "ARN": f"arn:aws:secretsmanager:us-east-1:000000000000:secret:{name}", "VersionId": version_id}
+        secret.update({k: v for k, v in params.items() if k in ("SecretString", "SecretBinary")})
+        self.secrets[name] = secret
+        return Response(200, {"ARN": secret["ARN"], "Name": name, "VersionId": version_id})
+
+    def handle(self, method, path, query, headers, body):
+        op = (headers.get("X-Amz-Target") or "").rpartition(".")[-1]
+        params = json.loads(body or b"{}")
+
+        if op == "CreateSecret":
+            if params["Name"] in self.secrets:
+                return self._error("ResourceExistsException")
+            return self._put(params["Name"], params)
+
+        if op == "ListSecrets":
+            prefixes = [v for f in params.get("Filters", []) for v in f["Values"]]
+            return Response(200, {
+                "SecretList": [
+                    {
+                        "ARN": secret["ARN"],
+                        "Name": name,
+                        "SecretVersionsToStages": {secret["VersionId"]: ["AWSCURRENT"]},
+                    }
+                    for name, secret in sorted(self.secrets.items())
+                    if not prefixes or any(name.startswith(prefix) for prefix in prefixes)
+                ],
+            })
+
+        name = params.get("SecretId", "")
+        if name not in self.secrets:
+            return self._error("ResourceNotFoundException", "Secrets Manager can't find the specified secret.")
+
+        secret = self.secrets[name]
+
+        if op == "UpdateSecret" or op == "PutSecretValue":
+            return self._put(name, params)
+
+        if op == "DescribeSecret":
+            return Response(200, {
+                "ARN": secret["ARN"],
+                "Name": name,
+                "VersionIdsToStages": {secret["VersionId"]: ["AWSCURRENT"]},
+            })
+
+        if op == "GetSecretValue":
+            return Response(200, dict(secret, VersionStages=["AWSCURRENT"]))
+        return self._error("InvalidRequestException", f"Unsupported operation {op}")
+
+
+class GoogleSecretManagerBackend(FakeBackend):
+    """Google Secret Manager REST (v1) API."""
+
+    _secret_re = re.compile(r"^/v1/projects/(?P<project>[^/]+)/secrets(?:/(?P<secret>[^/:]+))?(?::(?P<action>addVersion))?$")
+    _version_re = re.compile(r"^/v1/projects/(?P<project>[^/]+)/secrets/(?P<secret>[^/]+)/versions/(?P<version>[^/:]+):access$")
+
+    def reset(self):
+        # mapping of secret name and list of payloads (one per version)
+        self.secrets = {}
+
+    def __init__(self):
+        super().__init__()
+        self.reset()
+
+    def _error(self, code, status, message=""):
+        return Response(code, {"error": {"code": code, "message": message, "status": status}})
+
+    def handle(self, method, path, query, headers, body):
+        match = self._version_re.match(path)
+        if match and method == "GET":
+            name = f"projects/{match.group('project')}/secrets/{match.group('secret')}"
+            versions = self.secrets.get(name)
+            if not versions:
+                return self._error(404, "NOT_FOUND", f"Secret [{name}] not found or has no versions.")
+
+            version = match.group("version")
+            number = len(versions) if version == "latest" else int(version)
+            return Response(200, {
+                "name": f"{name}/versions/{number}",
+                "payload": {"data": versions[number - 1]},
+            })
+
+        match = self._secret_re.match(path)
+        if not match:
+            return self._error(404, "NOT_FOUND")
+
+        parent = f"projects/{match.group('project')}"
+
+        if not match.group("secret"):
+            if method == "GET":
+                # only supports ``name:<prefix>`` filter used by adapters
+                prefix = query.get("filter", "").partition("name:")[-1]
+                prefix = prefix.rpartition("/")[-1] if prefix else ""
+                return Response(200, {
+                    "secrets": [
+                        {"name": name}
+                        for name in sorted(self.secrets)
+                        if name.rpartition("/")[-1].startswith(prefix)
+                    ],
+                })
+
+            if method == "POST":
+                name = f"{parent}/secrets/{query['secretId']}"
+                if name in self.secrets:
+                    return self._error(409, "ALREADY_EXISTS", f"Secret [{name}] already exists.")
+                self.secrets[name] = []
+                return Response(200, dict(json.loads(body or b"{}"), name=name))
+
+        name = f"{parent}/secrets/{match.group('secret')}"
+        if name not in self.secrets:
+            return self._error(404, "NOT_FOUND", f"Secret [{name}] not found.")
+
+        if match.group("action") == "addVersion" and method == "POST":
+            payload = json.loads(body)["payload"]
+            self.secrets[name].append(payload.get("data", ""))
+            return Response(200, {"name": f"{name}/versions/{len(self.secrets[name])}", "state": "ENABLED"})
+
+        if method == "GET":
+            return Response(200, {"name": name})
+
+        if method == "DELETE":
+            del self.secrets[name]
+            return Response(200, {})
+        return self._error(405, "INVALID_ARGUMENT")
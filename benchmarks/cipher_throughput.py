@@ -0,0 +1,72 @@
+"""Compare throughput of text encoding modes supported by ``pygluu.containerlib.utils.Codec``.
+
+Example:
+
+.. code-block:: sh
+
+    python benchmarks/cipher_throughput.py --sizes 1024 65536 1048576 --duration 1
+
+The report is printed as JSON, containing throughput (in MB/s) of encoding and decoding
+for each mode and input size.
+"""
+
+import argparse
+import json
+import os
+import time
+
+from pygluu.containerlib.utils import TEXT_ENCODE_MODES
+from pygluu.containerlib.utils import Codec
+
+
+def measure(func, duration):
+    """Call function repeatedly for given duration.
+
+    :param func: Function to call.
+    :param duration: Min. duration (in seconds).
+    :returns: Number of calls per second.
+    """
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+
+    while elapsed < duration:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - start
+    return calls / elapsed
+
+
+def main():  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1024, 65536, 1048576], help="Input sizes (in bytes)")
+    parser.add_argument("--duration", type=float, default=1.0, help="Min. duration of each measurement (in seconds)")
+    args = parser.parse_args()
+
+    salt = os.urandom(12).hex()
+    results = []
+
+    for mode in TEXT_ENCODE_MODES:
+        codec = Codec(salt, mode=mode)
+
+        for size in args.sizes:
+            data = os.urandom(size)
+            encoded = codec.encode(data)
+            assert codec.decode(encoded) == data
+
+            encode_rate = measure(lambda: codec.encode(data), args.duration)
+            decode_rate = measure(lambda: codec.decode(encoded), args.duration)
+
+            results.append({
+                "mode": mode,
+                "size": size,
+                "encode_mb_per_sec": round(encode_rate * size / 1e6, 2),
+                "decode_mb_per_sec": round(decode_rate * size / 1e6, 2),
+                "encoded_size": len(encoded),
+            })
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Measure import time of ``pygluu.containerlib`` using ``python -X importtime``.
+
+Each run is executed in a fresh interpreter, so results are not affected by
+modules already imported by this script. Example:
+
+.. code-block:: sh
+
+    python benchmarks/import_time.py --runs 10 --max-ms 300
+    GLUU_CONFIG_ADAPTER=kubernetes python benchmarks/import_time.py --stmt "import pygluu.containerlib as c; c.get_manager()"
+
+The report is printed as JSON; when ``--max-ms`` is given, the script exits with
+non-zero code if median import time exceeds the threshold.
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+#: Top-level modules of backend SDKs that should only be imported when needed.
+HEAVY_MODULES = (
+    "boto3",
+    "botocore",
+    "consul",
+    "docker",
+    "google.cloud.secretmanager",
+    "google.cloud.spanner",
+    "hvac",
+    "kubernetes",
+    "ldap3",
+    "sqlalchemy",
+)
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)$")
+
+
+def measure(stmt, env=None):
+    """Run statement in a fresh interpreter and parse ``-X importtime`` output.
+
+    :param stmt: Python statement to execute.
+    :param env: Environment variables passed to the interpreter.
+    :returns: A mapping of module name and its cumulative import time (in microseconds).
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", stmt],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+        check=True,
+        universal_newlines=True,
+    )
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            _, cumulative, _, name = match.groups()
+            modules[name] = int(cumulative)
+    return modules
+
+
+def main():  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stmt", default="import pygluu.containerlib", help="Statement to benchmark")
+    parser.add_argument("--module", default="pygluu.containerlib", help="Module whose cumulative time is reported")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest modules to report")
+    parser.add_argument("--max-ms", type=float, default=0, help="Fail if median time exceeds this value")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    timings = []
+    modules = {}
+
+    for _ in range(max(1, args.runs)):
+        modules = measure(args.stmt, env=env)
+        timings.append(modules.get(args.module, 0) / 1000)
+
+    median_ms = statistics.median(timings)
+    report = {
+        "stmt": args.stmt,
+        "module": args.module,
+        "runs": len(timings),
+        "median_ms": round(median_ms, 2),
+        "min_ms": round(min(timings), 2),
+        "max_ms": round(max(timings), 2),
+        "heavy_modules": [name for name in HEAVY_MODULES if name in modules],
+        "slowest": [
+            {"module": name, "cumulative_ms": round(us / 1000, 2)}
+            for name, us in sorted(modules.items(), key=lambda item: item[1], reverse=True)[:args.top]
+        ],
+    }
+    print(json.dumps(report, indent=2))
+
+    if args.max_ms and median_ms > args.max_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
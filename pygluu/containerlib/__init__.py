@@ -1,6 +1,7 @@
 """Utilities for Gluu Cloud Native deployment."""
 
 from pygluu.containerlib.manager import get_manager  # noqa: F401
+from pygluu.containerlib.manager import get_async_manager  # noqa: F401
 from pygluu.containerlib.wait import wait_for  # noqa: F401
 from pygluu.containerlib.constants import (  # noqa: F401
     PERSISTENCE_TYPES,
@@ -1,5 +1,42 @@
 # noqa: D104
-from pygluu.containerlib.config.consul_config import ConsulConfig  # noqa: F401
-from pygluu.containerlib.config.kubernetes_config import KubernetesConfig  # noqa: F401
-from pygluu.containerlib.config.aws_config import AwsConfig  # noqa: F401
-from pygluu.containerlib.config.google_config import GoogleConfig  # noqa: F401
+# Adapters are imported lazily (on first attribute access), so importing
+# this package won't pull in SDKs of backends that are not in use.
+import importlib
+import typing as _t
+
+_ADAPTERS = {
+    "ConsulConfig": "pygluu.containerlib.config.consul_config",
+    "AsyncConsulConfig": "pygluu.containerlib.config.consul_config",
+    "KubernetesConfig": "pygluu.containerlib.config.kubernetes_config",
+    "AwsConfig": "pygluu.containerlib.config.aws_config",
+    "GoogleConfig": "pygluu.containerlib.config.google_config",
+    "AsyncGoogleConfig": "pygluu.containerlib.config.google_config",
+    "FileConfig": "pygluu.containerlib.config.file_config",
+}
+
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from pygluu.containerlib.config.consul_config import ConsulConfig  # noqa: F401
+    from pygluu.containerlib.config.consul_config import AsyncConsulConfig  # noqa: F401
+    from pygluu.containerlib.config.kubernetes_config import KubernetesConfig  # noqa: F401
+    from pygluu.containerlib.config.aws_config import AwsConfig  # noqa: F401
+    from pygluu.containerlib.config.google_config import GoogleConfig  # noqa: F401
+    from pygluu.containerlib.config.google_config import AsyncGoogleConfig  # noqa: F401
+    from pygluu.containerlib.config.file_config import FileConfig  # noqa: F401
+
+__all__ = list(_ADAPTERS)
+
+
+def __getattr__(name: str) -> _t.Any:
+    try:
+        module_name = _ADAPTERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    attr = getattr(importlib.import_module(module_name), name)
+    # cache the attribute so subsequent access won't go through this function
+    globals()[name] = attr
+    return attr
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_ADAPTERS))
@@ -17,6 +17,10 @@ from botocore.exceptions import NoCredentialsError
 from botocore.exceptions import NoRegionError
 
 from pygluu.containerlib.config.base_config import BaseConfig
+from pygluu.containerlib.metrics import instrument
+from pygluu.containerlib.metrics import record_bytes
+from pygluu.containerlib.registry import aws_current_version_id
+from pygluu.containerlib.registry import aws_secrets_client
 from pygluu.containerlib.utils import safe_value
 
 logger = logging.getLogger(__name__)
@@ -107,15 +111,16 @@ class AwsConfig(BaseConfig):
         # flag to determine whether AWS secrets already created
         self.basepath_exists = False
 
+        # last fetched configs and their version ID; the payload is only downloaded
+        # if current version ID (checked via cheap `DescribeSecret` call) is changed
+        self._data: _t.Optional[dict[str, _t.Any]] = None
+        self._version_id = ""
+
     @cached_property
     def client(self) -> boto3.session.Session.client:
-        """Create the Secret Manager client."""
+        """Get the Secret Manager client (shared by instances with the same endpoint and credentials)."""
         try:
-            client = boto3.client(
-                "secretsmanager",
-                endpoint_url=os.environ.get("GLUU_AWS_SECRETS_ENDPOINT_URL") or None,
-            )
-            return client
+            return aws_secrets_client()
         except NoRegionError:
             raise RuntimeError(
                 "AWS region is not specified. Please specify the region in a file "
@@ -127,6 +132,7 @@ class AwsConfig(BaseConfig):
     def all(self) -> dict[str, _t.Any]:
         return self.get_all()
 
+    @instrument
     def get_all(self) -> dict[str, _t.Any]:
         """Get all key-value pairs.
 
@@ -134,12 +140,23 @@ class AwsConfig(BaseConfig):
             A mapping of configs (if any).
         """
         self._prepare_secret()
+
+        if self._data is not None and self._version_id:
+            resp = self.client.describe_secret(SecretId=self.basepath)
+
+            # secret is unchanged since last fetch, hence return the last known configs
+            if aws_current_version_id(resp.get("VersionIdsToStages", {})) == self._version_id:
+                return dict(self._data)
+
         resp = self.client.get_secret_value(SecretId=self.basepath)
+        record_bytes(received=len(resp["SecretString"]))
 
         # SecretString is a `dict` data type
         data: dict[str, _t.Any] = _load_value(resp["SecretString"])
-        return data
+        self._remember(data, resp)
+        return dict(data)
 
+    @instrument
     def get(self, key: str, default: _t.Any = "") -> _t.Any:
         """Get value based on given key.
 
@@ -153,6 +170,7 @@ class AwsConfig(BaseConfig):
         data = self.get_all()
         return data.get(key) or default
 
+    @instrument
     def set(self, key: str, value: _t.Any) -> bool:
         """Set key with given value.
 
@@ -166,12 +184,17 @@ class AwsConfig(BaseConfig):
         data = self.get_all()
         data[key] = safe_value(value)
 
+        payload = _dump_value(data)
+        record_bytes(sent=len(payload))
+
         resp = self.client.update_secret(
             SecretId=self.basepath,
-            SecretString=_dump_value(data),
+            SecretString=payload,
         )
+        self._remember(data, resp)
         return bool(resp)
 
+    @instrument
     def set_all(self, data: dict[str, _t.Any]) -> bool:
         """Set all key-value pairs.
 
@@ -183,15 +206,37 @@ class AwsConfig(BaseConfig):
         """
         self._prepare_secret()
 
+        # ensure key-value that has bytes is converted to text
+        data = {k: safe_value(v) for k, v in data.items()}
+
+        payload = _dump_value(data)
+        record_bytes(sent=len(payload))
+
         resp = self.client.update_secret(
             SecretId=self.basepath,
-            SecretString=_dump_value(
-                # ensure key-value that has bytes is converted to text
-                {k: safe_value(v) for k, v in data.items()}
-            ),
+            SecretString=payload,
         )
+        self._remember(data, resp)
         return bool(resp)
 
+    def _remember(self, data: dict[str, _t.Any], resp: dict[str, _t.Any]) -> None:
+        """Keep a copy of configs and their version ID for subsequent reads.
+
+        Args:
+            data: Configs stored in the secret.
+            resp: Response of `GetSecretValue` or `UpdateSecret` call.
+        """
+        version_id = (resp or {}).get("VersionId", "")
+
+        if not version_id:
+            # unknown version, forget the last known configs
+            self._data = None
+            self._version_id = ""
+            return
+
+        self._data = dict(data)
+        self._version_id = version_id
+
     def _prepare_secret(self) -> None:
         """Prepare (create if missing) secrets with empty value."""
         # check whether secrets already exists
@@ -199,8 +244,8 @@ class AwsConfig(BaseConfig):
             return
 
         try:
-            # get the secret
-            self.client.get_secret_value(SecretId=self.basepath)
+            # check the secret metadata (cheaper than downloading the payload)
+            self.client.describe_secret(SecretId=self.basepath)
 
             # mark the secret as exists so subsequent checks made by
             # client instance won't need to make requests to AWS service
@@ -55,3 +55,17 @@ class BaseConfig:
         :param data: Key-value pairs.
         """
         raise NotImplementedError
+
+    def wait_for_key(self, key: str, timeout: float, default: Any = "") -> Any:
+        """Wait until given key has non-empty value.
+
+        Adapters that support change notifications override this method to block
+        until the key is set (or ``timeout`` elapses). This implementation
+        checks the key once, hence the caller must poll.
+
+        :param key: Key name.
+        :param timeout: Max. time to wait (in seconds).
+        :param default: Default value if key is not set.
+        :returns: Value of the key or default one.
+        """
+        return self.get(key, default) or default
@@ -2,26 +2,42 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
 import logging
+import math
 import os
+import ssl
+import threading
+import time
 from typing import (
     Any,
+    Optional,
     Tuple,
     Union,
 )
 
 from consul import Consul
+from consul import ConsulException
+from consul import base as consul_base
 
 from pygluu.containerlib.config.base_config import BaseConfig
+from pygluu.containerlib.metrics import instrument
+from pygluu.containerlib.metrics import record_bytes
+from pygluu.containerlib.metrics import record_response_bytes
+from pygluu.containerlib.registry import clients
+from pygluu.containerlib.registry import credentials_digest
 from pygluu.containerlib.utils import (
     as_boolean,
     safe_value,
 )
+from pygluu.containerlib.watch import WatchMixin
 
 logger = logging.getLogger(__name__)
 
 
-class ConsulConfig(BaseConfig):
+class ConsulConfig(WatchMixin, BaseConfig):
     """This class interacts with Consul backend.
 
     The following environment variables are used to instantiate the client:
@@ -35,8 +51,19 @@ class ConsulConfig(BaseConfig):
     - ``GLUU_CONFIG_CONSUL_CERT_FILE``
     - ``GLUU_CONFIG_CONSUL_KEY_FILE``
     - ``GLUU_CONFIG_CONSUL_TOKEN_FILE``
+    - ``GLUU_CONFIG_CONSUL_WATCH``
+    - ``GLUU_CONFIG_CONSUL_WATCH_WAIT``
+    - ``GLUU_CONFIG_CONSUL_TXN_MAX_OPS``
+    - ``GLUU_CONFIG_CONSUL_TXN_MAX_BYTES``
+
+    If ``GLUU_CONFIG_CONSUL_WATCH`` is set to ``true``, a background watcher
+    is started on first read (see :meth:`watch`).
     """
 
+    watch_setting = "GLUU_CONFIG_CONSUL_WATCH"
+    watch_thread_name = "consul-config-watcher"
+    watch_label = "Consul KV"
+
     def __init__(self):
         self.settings = {
             k: v
@@ -80,6 +107,22 @@ class ConsulConfig(BaseConfig):
             "GLUU_CONFIG_CONSUL_TOKEN_FILE", "/etc/certs/consul_token",
         )
 
+        self.settings.setdefault(
+            "GLUU_CONFIG_CONSUL_WATCH", False,
+        )
+
+        self.settings.setdefault(
+            "GLUU_CONFIG_CONSUL_WATCH_WAIT", "5m",
+        )
+
+        self.settings.setdefault(
+            "GLUU_CONFIG_CONSUL_TXN_MAX_OPS", 64,
+        )
+
+        self.settings.setdefault(
+            "GLUU_CONFIG_CONSUL_TXN_MAX_BYTES", 524288,
+        )
+
         self.prefix = "gluu/config/"
         cert, verify = self._verify_cert(
             self.settings["GLUU_CONFIG_CONSUL_SCHEME"],
@@ -91,15 +134,32 @@ class ConsulConfig(BaseConfig):
 
         self._request_warning(self.settings["GLUU_CONFIG_CONSUL_SCHEME"], verify)
 
-        self.client = Consul(
-            host=self.settings["GLUU_CONFIG_CONSUL_HOST"],
-            port=self.settings["GLUU_CONFIG_CONSUL_PORT"],
-            token=self._token_from_file(self.settings["GLUU_CONFIG_CONSUL_TOKEN_FILE"]),
-            scheme=self.settings["GLUU_CONFIG_CONSUL_SCHEME"],
-            consistency=self.settings["GLUU_CONFIG_CONSUL_CONSISTENCY"],
-            verify=verify,
-            cert=cert,
-        )
+        #: Keyword arguments used to create the client (also used by :class:`AsyncConsulConfig`).
+        self.client_kwargs = client_kwargs = {
+            "host": self.settings["GLUU_CONFIG_CONSUL_HOST"],
+            "port": self.settings["GLUU_CONFIG_CONSUL_PORT"],
+            "token": self._token_from_file(self.settings["GLUU_CONFIG_CONSUL_TOKEN_FILE"]),
+            "scheme": self.settings["GLUU_CONFIG_CONSUL_SCHEME"],
+            "consistency": self.settings["GLUU_CONFIG_CONSUL_CONSISTENCY"],
+            "verify": verify,
+            "cert": cert,
+        }
+
+        def create_client():
+            client = Consul(**client_kwargs)
+            # count bytes transferred by the underlying HTTP session (if metrics are enabled)
+            client.http.session.hooks["response"].append(record_response_bytes)
+            return client
+
+        # instances with identical address and credentials share a single client (and its connection pool);
+        # the token is not kept in the registry key as plaintext
+        client_key = ("consul",) + tuple(sorted(
+            (k, credentials_digest(v) if k == "token" else v) for k, v in client_kwargs.items()
+        ))
+        self.client = clients.get(client_key, create_client)
+
+        self._mirror_index = None
+        self._init_watch()
 
     def _merge_path(self, key: str) -> str:
         """Add prefix to the key.
@@ -123,6 +183,7 @@ class ConsulConfig(BaseConfig):
         """
         return key[len(self.prefix):]
 
+    @instrument
     def get(self, key: str, default: Any = "") -> Any:
         """Get value based on given key.
 
@@ -130,12 +191,17 @@ class ConsulConfig(BaseConfig):
         :param default: Default value if key is not exist.
         :returns: Value based on given key or default one.
         """
+        mirror = self._get_mirror()
+        if mirror is not None:
+            return mirror.get(key, default)
+
         _, result = self.client.kv.get(self._merge_path(key))
         if not result:
             return default
         # this is a bytes
         return result["Value"].decode()
 
+    @instrument
     def set(self, key: str, value: Any) -> bool:
         """Set key with given value.
 
@@ -143,36 +209,246 @@ class ConsulConfig(BaseConfig):
         :param value: Value of the key.
         :returns: A ``bool`` to mark whether config is set or not.
         """
-        return self.client.kv.put(self._merge_path(key), safe_value(value))
+        value = safe_value(value)
+        result = self.client.kv.put(self._merge_path(key), value)
+
+        if result:
+            self._update_mirror({key: value})
+        return result
 
     def all(self) -> dict[str, Any]:  # pragma: no cover
         return self.get_all()
 
+    @instrument
     def get_all(self) -> dict[str, Any]:
         """Get all key-value pairs.
 
         :returns: A ``dict`` of key-value pairs (if any).
         """
+        mirror = self._get_mirror()
+        if mirror is not None:
+            return dict(mirror)
+
         _, resultset = self.client.kv.get(self._merge_path(""), recurse=True)
 
-        if not resultset:
-            return {}
+        return self._decode_items(resultset)
 
+    def _decode_items(self, resultset: Optional[list[dict[str, Any]]]) -> dict[str, str]:
+        """Convert KV entries into key-value pairs.
+
+        :param resultset: List of KV entries (if any).
+        :returns: A ``dict`` of key-value pairs.
+        """
         return {
-            self._unmerge_path(item["Key"]): item["Value"].decode()
-            for item in resultset
+            self._unmerge_path(item["Key"]): (item["Value"] or b"").decode()
+            for item in resultset or []
         }
 
+    @instrument
     def set_all(self, data: dict[str, Any]) -> bool:
         """Set key-value pairs.
 
+        Key-value pairs are written using Consul transaction API in batches; each batch
+        contains at most ``GLUU_CONFIG_CONSUL_TXN_MAX_OPS`` operations (default to 64)
+        and its request body is at most ``GLUU_CONFIG_CONSUL_TXN_MAX_BYTES`` bytes (default to 524288),
+        matching the default limits of Consul server.
+
+        Each batch is atomic, but the whole call is not: if a batch is rolled back,
+        key-value pairs written by previous batches are kept and this method returns ``False``.
+
         :param data: Key-value pairs.
         :returns: A boolean to mark whether config is set or not.
         """
-        for k, v in data.items():
-            self.set(k, v)
+        data = {k: safe_value(v) for k, v in data.items()}
+
+        for batch in self._txn_batches(data):
+            try:
+                result = self.client.txn.put([op for _, op in batch])
+            except ConsulException as exc:
+                # rolled back transaction is reported as HTTP 409 response
+                errors = self._txn_errors(exc, [key for key, _ in batch])
+                logger.warning(f"Unable to set config in Consul transaction; reason={errors}")
+                return False
+
+            if not result:
+                logger.warning("Unable to set config in Consul transaction; reason=empty response")
+                return False
+
+            self._update_mirror({key: data[key] for key, _ in batch})
         return True
 
+    def _txn_batches(self, data: dict[str, str]) -> list[list[Tuple[str, dict[str, Any]]]]:
+        """Split key-value pairs into batches of transaction operations.
+
+        A single key-value pair that exceeds the max. bytes is put into its own batch
+        (and rejected by Consul server).
+
+        :param data: Key-value pairs.
+        :returns: List of batches; each batch is a list of key name and its operation.
+        """
+        max_ops, max_bytes = self.txn_max_ops, self.txn_max_bytes
+        batches: list[list[Tuple[str, dict[str, Any]]]] = []
+        # request body is a JSON array, hence the enclosing brackets
+        batch, size = [], 2
+
+        for key, value in data.items():
+            op = {
+                "KV": {
+                    "Verb": "set",
+                    "Key": self._merge_path(key),
+                    "Value": base64.b64encode(value.encode()).decode(),
+                },
+            }
+            # operations are serialized by ``json.dumps`` (separated by ", ")
+            op_size = len(json.dumps(op)) + 2
+
+            if batch and (len(batch) >= max_ops or size + op_size > max_bytes):
+                batches.append(batch)
+                batch, size = [], 2
+
+            batch.append((key, op))
+            size += op_size
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @staticmethod
+    def _txn_errors(exc: ConsulException, keys: list[str]) -> Any:
+        """Get errors of rolled back transaction.
+
+        :param exc: Exception raised by python-consul; its message is formatted as ``<code> <body>``.
+        :param keys: Key names of the transaction operations.
+        :returns: List of key name and its error (or the message itself if the body is not parsable).
+        """
+        _, _, body = str(exc).partition(" ")
+        try:
+            return [
+                (keys[error["OpIndex"]], error["What"])
+                for error in json.loads(body)["Errors"]
+            ]
+        except (ValueError, TypeError, KeyError, IndexError):
+            return str(exc)
+
+    @property
+    def txn_max_ops(self) -> int:
+        """Get max. number of operations in a single Consul transaction.
+
+        The value is determined by ``GLUU_CONFIG_CONSUL_TXN_MAX_OPS`` environment variable.
+        """
+        try:
+            max_ops = int(self.settings["GLUU_CONFIG_CONSUL_TXN_MAX_OPS"])
+        except ValueError:
+            max_ops = 64
+        return max(1, max_ops)
+
+    @property
+    def txn_max_bytes(self) -> int:
+        """Get max. size of request body of a single Consul transaction (in bytes).
+
+        The value is determined by ``GLUU_CONFIG_CONSUL_TXN_MAX_BYTES`` environment variable.
+        """
+        try:
+            max_bytes = int(self.settings["GLUU_CONFIG_CONSUL_TXN_MAX_BYTES"])
+        except ValueError:
+            max_bytes = 524288
+        return max(1, max_bytes)
+
+    def wait_for_key(self, key: str, timeout: float, default: Any = "") -> Any:
+        """Wait until given key has non-empty value using Consul blocking queries.
+
+        The call returns as soon as the key is set, instead of polling it periodically.
+
+        :param key: Key name.
+        :param timeout: Max. time to wait (in seconds).
+        :param default: Default value if key is not set.
+        :returns: Value of the key or default one.
+        """
+        deadline = time.monotonic() + timeout
+        path = self._merge_path(key)
+        index = None
+
+        while True:
+            kwargs = {}
+            if index is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return default
+                kwargs = {"index": index, "wait": f"{max(1, math.ceil(remaining))}s"}
+
+            new_index, result = self.client.kv.get(path, **kwargs)
+            if result and result["Value"]:
+                return result["Value"].decode()
+            index = self._next_wait_index(index, new_index)
+
+    @staticmethod
+    def _next_wait_index(index: Optional[int], new_index: Any) -> Optional[int]:
+        """Get index of the next blocking query made by :meth:`wait_for_key`.
+
+        :param index: Index of the previous blocking query (if any).
+        :param new_index: Value of ``X-Consul-Index`` header of the previous response.
+        :returns: Index of the next blocking query or ``None`` to read the key again.
+        """
+        try:
+            new_index = int(new_index)
+        except (TypeError, ValueError):
+            new_index = 0
+
+        if index is not None and new_index < index:
+            # index goes backward (i.e. Consul snapshot is restored), read the key again
+            return None
+        # blocking query with index 0 returns immediately
+        return max(1, new_index)
+
+    def _reset_watch(self) -> None:
+        self._mirror_index = None
+
+    def _relist(self, stop: threading.Event) -> None:
+        """Fetch all key-value pairs and remember the index of the result.
+
+        :param stop: Stop event of the watcher.
+        """
+        index, resultset = self.client.kv.get(self._merge_path(""), recurse=True)
+        self._sync_mirror(index, resultset, stop)
+
+    def _watch_once(self, stop: threading.Event) -> None:
+        """Run a single blocking query.
+
+        :param stop: Stop event of the watcher.
+        """
+        index, resultset = self.client.kv.get(
+            self._merge_path(""),
+            recurse=True,
+            index=self._mirror_index,
+            wait=self.settings["GLUU_CONFIG_CONSUL_WATCH_WAIT"],
+        )
+        self._sync_mirror(index, resultset, stop)
+
+    def _sync_mirror(
+        self,
+        index: Any,
+        resultset: Optional[list[dict[str, Any]]],
+        stop: Optional[threading.Event] = None,
+    ) -> None:
+        """Replace local mirror with key-value pairs from blocking query result.
+
+        :param index: Value of ``X-Consul-Index`` header.
+        :param resultset: List of KV entries.
+        :param stop: Stop event of the watcher.
+        """
+        try:
+            index = int(index)
+        except (TypeError, ValueError):
+            index = 0
+
+        # index must be reset if it goes backward, i.e. Consul snapshot is restored
+        if self._mirror_index is not None and index < self._mirror_index:
+            index = 0
+
+        replaced = self._replace_mirror(self._decode_items(resultset), stop)
+        if replaced:
+            self._mirror_index = index
+
     def _request_warning(self, scheme: str, verify: bool) -> None:
         """Emit warning about unverified request to unsecure Consul address.
 
@@ -224,3 +500,223 @@ class ConsulConfig(BaseConfig):
             if all([os.path.isfile(cert_file), os.path.isfile(key_file)]):
                 cert = (cert_file, key_file)
         return cert, verify
+
+
+class _AsyncHTTPClient(consul_base.HTTPClient):
+    """HTTP client of python-consul that sends requests via ``aiohttp`` on the running event loop.
+
+    ``consul.aio`` shipped by python-consul is not used as it can't be imported
+    on Python 3.11+ (it relies on removed ``asyncio.coroutine``) and it ignores client cert.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        import aiohttp
+
+        super().__init__(*args, **kwargs)
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(ssl=self._ssl_context()),
+            # blocking queries may take longer than the default timeout
+            timeout=aiohttp.ClientTimeout(total=None),
+        )
+
+    def _ssl_context(self) -> Union[bool, ssl.SSLContext]:
+        """Get SSL context that honors ``verify`` and ``cert`` options.
+
+        :returns: Instance of ``ssl.SSLContext``, ``False`` to skip verification, or ``True`` for defaults.
+        """
+        if self.scheme != "https":
+            return True
+        if self.verify is False:
+            return False
+
+        context = ssl.create_default_context(
+            cafile=self.verify if isinstance(self.verify, str) else None,
+        )
+        if self.cert:
+            context.load_cert_chain(*self.cert)
+        return context
+
+    async def _request(self, callback: Any, method: str, uri: str, data: Any = None) -> Any:
+        async with self._session.request(method, uri, data=data) as resp:
+            body = await resp.read()
+
+        if isinstance(data, str):
+            data = data.encode()
+        record_bytes(sent=len(data or b""), received=len(body))
+
+        if resp.status == 599:
+            raise consul_base.Timeout
+        return callback(consul_base.Response(resp.status, resp.headers, body.decode("utf-8")))
+
+    def get(self, callback: Any, path: str, params: Any = None) -> Any:  # noqa: D102
+        return self._request(callback, "GET", self.uri(path, params))
+
+    def put(self, callback: Any, path: str, params: Any = None, data: Any = "") -> Any:  # noqa: D102
+        return self._request(callback, "PUT", self.uri(path, params), data=data)
+
+    def delete(self, callback: Any, path: str, params: Any = None) -> Any:  # noqa: D102
+        return self._request(callback, "DELETE", self.uri(path, params))
+
+    def post(self, callback: Any, path: str, params: Any = None, data: Any = "") -> Any:  # noqa: D102
+        return self._request(callback, "POST", self.uri(path, params), data=data)
+
+    async def close(self) -> None:
+        """Close the underlying session."""
+        await self._session.close()
+
+
+class _AsyncConsul(consul_base.Consul):
+    """Consul client whose methods return coroutines."""
+
+    def connect(self, host: str, port: int, scheme: str, verify: Any = True, cert: Any = None) -> _AsyncHTTPClient:  # noqa: D102
+        return _AsyncHTTPClient(host, port, scheme, verify=verify, cert=cert)
+
+
+class AsyncConsulConfig:
+    """Native asyncio counterpart of :class:`ConsulConfig`.
+
+    Requests are sent via ``aiohttp`` (installed by ``async`` extra) on the running event loop,
+    using the settings of the wrapped adapter. Local mirror of the wrapped adapter is shared,
+    hence reads are answered from the mirror once the watcher is running.
+
+    .. code-block:: python
+
+        config = AsyncConsulConfig(ConsulConfig())
+        hostname = await config.get("hostname")
+        await config.close()
+
+    :param config: Synchronous adapter to take settings (and local mirror) from.
+    """
+
+    def __init__(self, config: Optional[ConsulConfig] = None) -> None:
+        # fail early (so managers fallback to executor) if ``aiohttp`` is not installed
+        import aiohttp  # noqa: F401
+
+        self.config = config or ConsulConfig()
+        self._client: Optional[_AsyncConsul] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def client(self) -> _AsyncConsul:
+        """Get the client bound to the running event loop (created on first access)."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = _AsyncConsul(**self.config.client_kwargs)
+            self._client_loop = loop
+        return self._client
+
+    async def close(self) -> None:
+        """Close connections of the client; must be called on the event loop that uses the client."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.http.close()
+
+    async def _get_mirror(self) -> Optional[dict[str, str]]:
+        """Get local mirror of the wrapped adapter (if any).
+
+        The watcher is started (in executor, as its initial synchronization is blocking)
+        if ``GLUU_CONFIG_CONSUL_WATCH`` is enabled.
+
+        :returns: A ``dict`` of key-value pairs or ``None`` if watcher is not running.
+        """
+        config = self.config
+        if config._mirror is None and as_boolean(config.settings[config.watch_setting]):
+            await asyncio.get_running_loop().run_in_executor(None, config.watch)
+        return config._mirror
+
+    @instrument
+    async def get(self, key: str, default: Any = "") -> Any:
+        """Get value based on given key.
+
+        :param key: Key name.
+        :param default: Default value if key is not exist.
+        :returns: Value based on given key or default one.
+        """
+        mirror = await self._get_mirror()
+        if mirror is not None:
+            return mirror.get(key, default)
+
+        _, result = await self.client.kv.get(self.config._merge_path(key))
+        if not result:
+            return default
+        return result["Value"].decode()
+
+    @instrument
+    async def set(self, key: str, value: Any) -> bool:
+        """Set key with given value.
+
+        :param key: Key name.
+        :param value: Value of the key.
+        :returns: A ``bool`` to mark whether config is set or not.
+        """
+        value = safe_value(value)
+        result = await self.client.kv.put(self.config._merge_path(key), value)
+
+        if result:
+            self.config._update_mirror({key: value})
+        return result
+
+    @instrument
+    async def get_all(self) -> dict[str, Any]:
+        """Get all key-value pairs.
+
+        :returns: A ``dict`` of key-value pairs (if any).
+        """
+        mirror = await self._get_mirror()
+        if mirror is not None:
+            return dict(mirror)
+
+        _, resultset = await self.client.kv.get(self.config._merge_path(""), recurse=True)
+        return self.config._decode_items(resultset)
+
+    @instrument
+    async def set_all(self, data: dict[str, Any]) -> bool:
+        """Set key-value pairs using Consul transaction API in batches.
+
+        See :meth:`ConsulConfig.set_all` for details.
+
+        :param data: Key-value pairs.
+        :returns: A boolean to mark whether config is set or not.
+        """
+        data = {k: safe_value(v) for k, v in data.items()}
+
+        for batch in self.config._txn_batches(data):
+            try:
+                result = await self.client.txn.put([op for _, op in batch])
+            except ConsulException as exc:
+                # rolled back transaction is reported as HTTP 409 response
+                errors = self.config._txn_errors(exc, [key for key, _ in batch])
+                logger.warning(f"Unable to set config in Consul transaction; reason={errors}")
+                return False
+
+            if not result:
+                logger.warning("Unable to set config in Consul transaction; reason=empty response")
+                return False
+
+            self.config._update_mirror({key: data[key] for key, _ in batch})
+        return True
+
+    async def wait_for_key(self, key: str, timeout: float, default: Any = "") -> Any:
+        """Wait until given key has non-empty value using Consul blocking queries.
+
+        :param key: Key name.
+        :param timeout: Max. time to wait (in seconds).
+        :param default: Default value if key is not set.
+        :returns: Value of the key or default one.
+        """
+        deadline = time.monotonic() + timeout
+        path = self.config._merge_path(key)
+        index = None
+
+        while True:
+            kwargs = {}
+            if index is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return default
+                kwargs = {"index": index, "wait": f"{max(1, math.ceil(remaining))}s"}
+
+            new_index, result = await self.client.kv.get(path, **kwargs)
+            if result and result["Value"]:
+                return result["Value"].decode()
+            index = self.config._next_wait_index(index, new_index)
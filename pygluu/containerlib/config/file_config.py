@@ -0,0 +1,25 @@
+"""This module contains config adapter class to interact with local files."""
+
+from __future__ import annotations
+
+from pygluu.containerlib.config.base_config import BaseConfig
+from pygluu.containerlib.filestore import FileStoreAdapter
+
+
+class FileConfig(FileStoreAdapter, BaseConfig):
+    """This class interacts with config stored in local files.
+
+    The instance of this class is configured via environment variables.
+
+    Supported environment variables:
+
+    - ``GLUU_CONFIG_FILE_PATH``: path to a JSON file contains key-value pairs, or a directory
+      where each file is a key and its contents is the value, i.e. mounted Kubernetes ConfigMap
+      (default to ``/etc/gluu/conf/config.json``).
+
+    Files are parsed once and re-read only when they are changed.
+    See :class:`~pygluu.containerlib.filestore.FileStore` for details.
+    """
+
+    setting_prefix = "GLUU_CONFIG_FILE_"
+    default_path = "/etc/gluu/conf/config.json"
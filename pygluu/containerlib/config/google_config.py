@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-import sys
 import os
 import typing as _t
 from functools import cached_property
@@ -13,6 +12,12 @@ from google.cloud import secretmanager
 from google.api_core.exceptions import AlreadyExists, NotFound
 
 from pygluu.containerlib.config.base_config import BaseConfig
+from pygluu.containerlib.metrics import instrument
+from pygluu.containerlib.metrics import record_bytes
+from pygluu.containerlib.registry import google_secrets_client
+from pygluu.containerlib.utils import dump_payload
+from pygluu.containerlib.utils import get_payload_compression
+from pygluu.containerlib.utils import load_payload
 from pygluu.containerlib.utils import safe_value
 
 logger = logging.getLogger(__name__)
@@ -29,6 +34,7 @@ class GoogleConfig(BaseConfig):
     - `GOOGLE_PROJECT_ID`: ID of Google project.
     - `GLUU_GOOGLE_SECRET_VERSION_ID`: Gluu secret version ID in Google Secret Manager. Defaults to `latest`, which is recommended.
     - `GLUU_GOOGLE_SECRET_NAME_PREFIX`: Prefix for Gluu secret in Google Secret Manager. Defaults to `gluu`. If left `gluu-configuration` secret will be created.
+    - `GLUU_PAYLOAD_COMPRESSION`: Compression of configs payload, either `none` (default), `zlib`, or `lzma`.
     """
 
     def __init__(self) -> None:  # noqa: D107
@@ -43,12 +49,13 @@ class GoogleConfig(BaseConfig):
 
     @cached_property
     def client(self) -> secretmanager.SecretManagerServiceClient:
-        """Create the Secret Manager client."""
-        return secretmanager.SecretManagerServiceClient()
+        """Get the Secret Manager client (shared by instances with the same credentials)."""
+        return google_secrets_client()
 
     def all(self) -> dict[str, _t.Any]:  # noqa: D102
         return self.get_all()
 
+    @instrument
     def get_all(self) -> dict[str, _t.Any]:
         """Access the payload for the given secret version if one exists.
 
@@ -66,7 +73,7 @@ class GoogleConfig(BaseConfig):
         except NotFound:
             logger.warning("Secret may not exist or have any versions created yet")
             self.create_secret()
-            self.add_secret_version(safe_value({}))
+            self.add_secret_version(dump_payload({}, get_payload_compression()))
 
         # Build the resource name of the secret version.
         name = f"projects/{self.project_id}/secrets/{self.google_secret_name}/versions/{self.version_id}"
@@ -76,18 +83,37 @@ class GoogleConfig(BaseConfig):
             # Access the secret version.
             response = self.client.access_secret_version(request={"name": name})
             # logger.info(f"Secret {self.google_secret_name} has been found. Accessing version {self.version_id}.")
-            payload = response.payload.data.decode("UTF-8")
-            data = json.loads(payload)
+            data = self._load_response(response)
         except NotFound:
-            logger.warning(
-                "Secret may not exist or have any versions created. Make sure "
-                "GLUU_GOOGLE_SECRET_VERSION_ID and GLUU_GOOGLE_SECRET_NAME_PREFIX "
-                "environment variables are set correctly. In Google secrets manager, "
-                "a secret with the name gluu-secret would have "
-                "GLUU_GOOGLE_SECRET_NAME_PREFIX set to gluu."
-            )
+            self._version_warning()
         return data
 
+    @staticmethod
+    def _load_response(response: _t.Any) -> dict[str, _t.Any]:
+        """Decode payload of accessed secret version.
+
+        Args:
+            response: Response of `access_secret_version` call.
+
+        Returns:
+            A mapping of configs.
+        """
+        record_bytes(received=len(response.payload.data))
+        # compression (if any) is detected from payload header
+        return load_payload(response.payload.data)
+
+    @staticmethod
+    def _version_warning() -> None:
+        """Emit warning about missing secret version."""
+        logger.warning(
+            "Secret may not exist or have any versions created. Make sure "
+            "GLUU_GOOGLE_SECRET_VERSION_ID and GLUU_GOOGLE_SECRET_NAME_PREFIX "
+            "environment variables are set correctly. In Google secrets manager, "
+            "a secret with the name gluu-secret would have "
+            "GLUU_GOOGLE_SECRET_NAME_PREFIX set to gluu."
+        )
+
+    @instrument
     def get(self, key: str, default: _t.Any = "") -> _t.Any:
         """Get value based on given key.
 
@@ -101,6 +127,7 @@ class GoogleConfig(BaseConfig):
         result = self.get_all()
         return result.get(key) or default
 
+    @instrument
     def set(self, key: str, value: _t.Any) -> bool:
         """Set key with given value.
 
@@ -117,10 +144,12 @@ class GoogleConfig(BaseConfig):
         self.create_secret()
 
         logger.info(f'Adding key {key} to google secret manager')
-        logger.info(f'Size of secret payload : {sys.getsizeof(safe_value(all_))} bytes')
-        secret_version_bool = self.add_secret_version(safe_value(all_))
+        payload = dump_payload(all_, get_payload_compression())
+        logger.info(f'Size of secret payload : {len(payload)} bytes')
+        secret_version_bool = self.add_secret_version(payload)
         return secret_version_bool
 
+    @instrument
     def set_all(self, data: dict[str, _t.Any]) -> bool:
         """Push a full dictionary to secrets.
 
@@ -139,8 +168,9 @@ class GoogleConfig(BaseConfig):
 
         self.create_secret()
 
-        logger.info(f'Size of secret payload : {sys.getsizeof(safe_value(all_))} bytes')
-        secret_version_bool = self.add_secret_version(safe_value(all_))
+        payload = dump_payload(all_, get_payload_compression())
+        logger.info(f'Size of secret payload : {len(payload)} bytes')
+        secret_version_bool = self.add_secret_version(payload)
         return secret_version_bool
 
     def create_secret(self) -> None:
@@ -149,30 +179,50 @@ class GoogleConfig(BaseConfig):
         A secret is a logical wrapper around a collection of secret versions.
         Secret versions hold the actual secret material.
         """
-        # Build the resource name of the parent project.
-        parent = f"projects/{self.project_id}"
-
         try:
             # Create the secret.
-            response = self.client.create_secret(
-                request={
-                    "parent": parent,
-                    "secret_id": self.google_secret_name,
-                    "secret": {"replication": {"automatic": {}}},
-                }
-            )
+            response = self.client.create_secret(request=self._create_secret_request())
             logger.info(f"Created secret: {response.name}")
         except AlreadyExists:
             logger.warning(f'Secret {self.google_secret_name} already exists. A new version will be created.')
 
+    def _create_secret_request(self) -> dict[str, _t.Any]:
+        """Build request to create the secret.
+
+        Returns:
+            Request of `create_secret` call.
+        """
+        return {
+            # Build the resource name of the parent project.
+            "parent": f"projects/{self.project_id}",
+            "secret_id": self.google_secret_name,
+            "secret": {"replication": {"automatic": {}}},
+        }
+
+    @instrument
     def add_secret_version(self, payload: _t.AnyStr) -> bool:
         """Add a new secret version to the given secret with the provided payload.
 
         Args:
             payload: Payload string or bytes.
         """
+        # Add the secret version.
+        response = self.client.add_secret_version(request=self._add_secret_version_request(payload))
+
+        logger.info("Added secret version: {}".format(response.name))
+        return bool(response)
+
+    def _add_secret_version_request(self, payload: _t.AnyStr) -> dict[str, _t.Any]:
+        """Build request to add a new secret version.
+
+        Args:
+            payload: Payload string or bytes.
+
+        Returns:
+            Request of `add_secret_version` call.
+        """
         # Build the resource name of the parent secret.
-        parent = self.client.secret_path(self.project_id, self.google_secret_name)
+        parent = f"projects/{self.project_id}/secrets/{self.google_secret_name}"
 
         if isinstance(payload, str):
             # Convert the string payload into a bytes. This step can be omitted if you
@@ -180,10 +230,153 @@ class GoogleConfig(BaseConfig):
             payload_bytes = payload.encode("UTF-8")
         else:
             payload_bytes = payload
+        record_bytes(sent=len(payload_bytes))
+        return {"parent": parent, "payload": {"data": payload_bytes}}
 
-        # Add the secret version.
-        response = self.client.add_secret_version(
-            request={"parent": parent, "payload": {"data": payload_bytes}}
+
+class AsyncGoogleConfig:
+    """Native asyncio counterpart of `GoogleConfig`.
+
+    Requests are sent by `SecretManagerServiceAsyncClient` on the running event loop,
+    using the settings of the wrapped adapter.
+
+    Args:
+        config: Synchronous adapter to take settings from.
+    """
+
+    def __init__(self, config: _t.Optional[GoogleConfig] = None) -> None:  # noqa: D107
+        # fail early (so managers fallback to executor) if the installed SDK has no asyncio client
+        self.client_class = secretmanager.SecretManagerServiceAsyncClient
+
+        self.config = config or GoogleConfig()
+        self._client: _t.Any = None
+        self._client_loop: _t.Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def client(self) -> _t.Any:
+        """Get the asyncio client bound to the running event loop (created on first access)."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = self.client_class()
+            self._client_loop = loop
+        return self._client
+
+    async def close(self) -> None:
+        """Close the client; must be called on the event loop that uses the client."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.transport.close()
+
+    @instrument
+    async def get_all(self) -> dict[str, _t.Any]:
+        """Access the payload for the given secret version if one exists.
+
+        See `GoogleConfig.get_all` for details.
+
+        Returns:
+            A mapping of configs (if any)
+        """
+        config = self.config
+        name = f"projects/{config.project_id}/secrets/{config.google_secret_name}/versions/latest"
+
+        try:
+            response = await self.client.access_secret_version(request={"name": name})
+        except NotFound:
+            logger.warning("Secret may not exist or have any versions created yet")
+            response = None
+            await self.create_secret()
+            await self.add_secret_version(dump_payload({}, get_payload_compression()))
+
+        # the latest version has been accessed already
+        if response is not None and config.version_id == "latest":
+            return config._load_response(response)
+
+        name = f"projects/{config.project_id}/secrets/{config.google_secret_name}/versions/{config.version_id}"
+        try:
+            response = await self.client.access_secret_version(request={"name": name})
+        except NotFound:
+            config._version_warning()
+            return {}
+        return config._load_response(response)
+
+    @instrument
+    async def get(self, key: str, default: _t.Any = "") -> _t.Any:
+        """Get value based on given key.
+
+        Args:
+            key: Key name.
+            default: Default value if key is not exist.
+
+        Returns:
+            Value based on given key or default one.
+        """
+        result = await self.get_all()
+        return result.get(key) or default
+
+    @instrument
+    async def set(self, key: str, value: _t.Any) -> bool:
+        """Set key with given value.
+
+        Args:
+            key: Key name.
+            value: Value of the key.
+
+        Returns:
+            A boolean to mark whether config is set or not.
+        """
+        return await self.set_all({key: value})
+
+    @instrument
+    async def set_all(self, data: dict[str, _t.Any]) -> bool:
+        """Push a full dictionary to secrets.
+
+        Args:
+            data: full dictionary to push (merged with existing configs).
+
+        Returns:
+            A boolean to mark whether config is set or not.
+        """
+        all_ = await self.get_all()
+
+        for k, v in data.items():
+            all_[k] = safe_value(v)
+
+        await self.create_secret()
+
+        payload = dump_payload(all_, get_payload_compression())
+        logger.info(f'Size of secret payload : {len(payload)} bytes')
+        return await self.add_secret_version(payload)
+
+    async def wait_for_key(self, key: str, timeout: float, default: _t.Any = "") -> _t.Any:
+        """Check the key once (Google Secret Manager has no change notifications).
+
+        Args:
+            key: Key name.
+            timeout: Max. time to wait (in seconds); unused.
+            default: Default value if key is not set.
+
+        Returns:
+            Value of the key or default one.
+        """
+        return await self.get(key, default) or default
+
+    async def create_secret(self) -> None:
+        """Create a new secret with the given name (if not exist)."""
+        try:
+            response = await self.client.create_secret(request=self.config._create_secret_request())
+            logger.info(f"Created secret: {response.name}")
+        except AlreadyExists:
+            logger.warning(f'Secret {self.config.google_secret_name} already exists. A new version will be created.')
+
+    @instrument
+    async def add_secret_version(self, payload: _t.AnyStr) -> bool:
+        """Add a new secret version to the given secret with the provided payload.
+
+        Args:
+            payload: Payload string or bytes.
+        """
+        response = await self.client.add_secret_version(
+            request=self.config._add_secret_version_request(payload),
         )
 
         logger.info("Added secret version: {}".format(response.name))
@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
+import logging
 import os
 from typing import Any
 
 import kubernetes.client
-import kubernetes.config
 
 from pygluu.containerlib.config.base_config import BaseConfig
+from pygluu.containerlib.metrics import instrument
+from pygluu.containerlib.registry import get_kubernetes_api_client
 from pygluu.containerlib.utils import (
     as_boolean,
     safe_value,
 )
+from pygluu.containerlib.watch import KubernetesWatchMixin
 
+logger = logging.getLogger(__name__)
 
-class KubernetesConfig(BaseConfig):
+
+class KubernetesConfig(KubernetesWatchMixin, BaseConfig):
     """This class interacts with Kubernetes ConfigMap backend.
 
     The following environment variables are used to instantiate the client:
@@ -23,8 +28,19 @@ class KubernetesConfig(BaseConfig):
     - ``GLUU_CONFIG_KUBERNETES_NAMESPACE``
     - ``GLUU_CONFIG_KUBERNETES_CONFIGMAP``
     - ``GLUU_CONFIG_KUBERNETES_USE_KUBE_CONFIG``
+    - ``GLUU_CONFIG_KUBERNETES_WATCH``
+
+    If ``GLUU_CONFIG_KUBERNETES_WATCH`` is set to ``true``, a background watcher
+    is started on first read (see :meth:`watch`).
     """
 
+    resource_api = "config_map"
+    name_setting = "GLUU_CONFIG_KUBERNETES_CONFIGMAP"
+    namespace_setting = "GLUU_CONFIG_KUBERNETES_NAMESPACE"
+    watch_setting = "GLUU_CONFIG_KUBERNETES_WATCH"
+    watch_thread_name = "kubernetes-config-watcher"
+    watch_label = "ConfigMap"
+
     def __init__(self):
         self.settings = {
             k: v
@@ -40,11 +56,14 @@ class KubernetesConfig(BaseConfig):
         )
 
         self.settings.setdefault("GLUU_CONFIG_KUBERNETES_USE_KUBE_CONFIG", False)
+        self.settings.setdefault("GLUU_CONFIG_KUBERNETES_WATCH", False)
 
         self._client = None
         self.name_exists = False
         self.kubeconfig_file = os.path.expanduser("~/.kube/config")
+        self._init_watch()
 
+    @instrument
     def get(self, key: str, default: Any = "") -> Any:
         """Get value based on given key.
 
@@ -59,11 +78,11 @@ class KubernetesConfig(BaseConfig):
     def client(self):
         """Lazy-loaded client to interact with Kubernetes API."""
         if not self._client:
-            if as_boolean(self.settings["GLUU_CONFIG_KUBERNETES_USE_KUBE_CONFIG"]):
-                kubernetes.config.load_kube_config(self.kubeconfig_file)
-            else:
-                kubernetes.config.load_incluster_config()
-            self._client = kubernetes.client.CoreV1Api()
+            api_client = get_kubernetes_api_client(
+                self.kubeconfig_file,
+                use_kube_config=as_boolean(self.settings["GLUU_CONFIG_KUBERNETES_USE_KUBE_CONFIG"]),
+            )
+            self._client = kubernetes.client.CoreV1Api(api_client)
         return self._client
 
     def _prepare_configmap(self) -> None:
@@ -94,6 +113,10 @@ class KubernetesConfig(BaseConfig):
                 else:
                     raise
 
+    def _prepare_resource(self) -> None:
+        self._prepare_configmap()
+
+    @instrument
     def set(self, key: str, value: Any) -> bool:
         """Set key with given value.
 
@@ -113,16 +136,24 @@ class KubernetesConfig(BaseConfig):
             self.settings["GLUU_CONFIG_KUBERNETES_NAMESPACE"],
             body=body,
         )
+
+        if ret:
+            self._update_mirror({key: safe_value(value)})
         return bool(ret)
 
     def all(self) -> dict[str, Any]:  # pragma: no cover
         return self.get_all()
 
+    @instrument
     def get_all(self) -> dict[str, Any]:
         """Get all key-value pairs.
 
         :returns: A ``dict`` of key-value pairs (if any).
         """
+        mirror = self._get_mirror()
+        if mirror is not None:
+            return dict(mirror)
+
         self._prepare_configmap()
         result = self.client.read_namespaced_config_map(
             self.settings["GLUU_CONFIG_KUBERNETES_CONFIGMAP"],
@@ -130,6 +161,7 @@ class KubernetesConfig(BaseConfig):
         )
         return result.data or {}
 
+    @instrument
     def set_all(self, data: dict[str, Any]) -> bool:
         """Set all key-value pairs.
         Returns:
@@ -147,4 +179,7 @@ class KubernetesConfig(BaseConfig):
             self.settings["GLUU_CONFIG_KUBERNETES_NAMESPACE"],
             body=body,
         )
+
+        if ret:
+            self._update_mirror(body["data"])
         return bool(ret)
@@ -0,0 +1,245 @@
+"""This module contains key-value store backed by local files, used by file-based config/secret adapters."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import (
+    Any,
+    Optional,
+    Tuple,
+)
+
+from pygluu.containerlib.metrics import instrument
+from pygluu.containerlib.utils import safe_value
+from pygluu.containerlib.utils import write_file_atomic
+
+# name of symlink swapped by kubelet when contents of projected volume
+# (ConfigMap, Secret, etc.) are updated
+_KUBERNETES_DATA_DIR = "..data"
+
+
+class FileStore:
+    """Key-value pairs stored in local files.
+
+    The store has 2 layouts, determined by the given path:
+
+    - directory: each regular (non-hidden) file is a key, and its contents is the value;
+      this is the layout of Kubernetes projected volume (ConfigMap/Secret) and Docker secrets.
+    - JSON document: a single file contains a JSON object of key-value pairs;
+      used when path is not a directory.
+
+    Files are parsed once and the result is reused until modification time (or inode)
+    of the path changes, hence reading key-value pairs won't re-read the files
+    unless they are changed. Note that in directory layout, only changes that replace
+    files (e.g. atomic rename or Kubernetes ``..data`` symlink swap) are detected.
+
+    :param path: Path to directory or JSON file.
+    :param mode: Permission of newly created files, i.e. ``0o600`` for secrets.
+    """
+
+    def __init__(self, path: str, mode: int = 0o644) -> None:
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple[Any, ...]] = None
+        self._data: dict[str, Any] = {}
+
+    @property
+    def is_dir(self) -> bool:
+        """Check whether the store uses directory layout."""
+        return os.path.isdir(self.path)
+
+    def _stat_signature(self) -> Optional[Tuple[Any, ...]]:
+        """Get signature of the files to determine whether they are changed.
+
+        :returns: A tuple of file attributes or ``None`` if path is missing.
+        """
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+
+        signature: Tuple[Any, ...] = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+        # contents of Kubernetes projected volume are swapped atomically by replacing
+        # the ``..data`` symlink, which doesn't always change mtime of the directory
+        data_dir = os.path.join(self.path, _KUBERNETES_DATA_DIR)
+        if os.path.islink(data_dir):
+            signature += (os.readlink(data_dir),)
+        return signature
+
+    def _read_dir(self) -> dict[str, Any]:
+        data = {}
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                # hidden files include temporary files and Kubernetes ``..data`` entries
+                if entry.name.startswith(".") or not entry.is_file():
+                    continue
+                with open(entry.path, "rb") as f:
+                    contents = f.read()
+                try:
+                    data[entry.name] = contents.decode()
+                except UnicodeDecodeError:
+                    # likely bytes from a binary
+                    data[entry.name] = contents.decode("ISO-8859-1")
+        return data
+
+    def _read_json(self) -> dict[str, Any]:
+        with open(self.path, "rb") as f:
+            contents = f.read()
+
+        if not contents.strip():
+            return {}
+
+        data = json.loads(contents)
+        if not isinstance(data, dict):
+            raise ValueError(f"Expected a JSON object in {self.path}")
+        return data
+
+    def _load(self) -> dict[str, Any]:
+        """Load key-value pairs if the files are changed since last read.
+
+        Must be called while holding the lock.
+        """
+        signature = self._stat_signature()
+        if signature is not None and signature == self._signature:
+            return self._data
+
+        if signature is None:
+            data = {}
+        elif self.is_dir:
+            data = self._read_dir()
+        else:
+            data = self._read_json()
+
+        self._data = data
+        self._signature = signature
+        return data
+
+    def get_all(self) -> dict[str, Any]:
+        """Get all key-value pairs.
+
+        :returns: A mapping of key-value pairs.
+        """
+        with self._lock:
+            return dict(self._load())
+
+    def get(self, key: str, default: Any = "") -> Any:
+        """Get value based on given key.
+
+        :param key: Key name.
+        :param default: Default value if key is not exist.
+        :returns: Value based on given key or default one.
+        """
+        with self._lock:
+            return self._load().get(key) or default
+
+    def set_all(self, data: dict[str, Any]) -> bool:
+        """Set key-value pairs (merged with existing ones).
+
+        In directory layout, each key is written to its own file; otherwise the whole
+        JSON document is rewritten. Files are written atomically via rename.
+
+        :param data: Key-value pairs.
+        :returns: A boolean to mark whether key-value pairs are written.
+        """
+        data = {k: safe_value(v) for k, v in data.items()}
+
+        with self._lock:
+            if self.is_dir:
+                for key, value in data.items():
+                    if not key or key.startswith(".") or os.sep in key:
+                        raise ValueError(f"Invalid key {key!r} for file in {self.path}")
+                    write_file_atomic(os.path.join(self.path, key), value.encode(), mode=self.mode)
+            else:
+                merged = dict(self._load())
+                merged.update(data)
+                dirname = os.path.dirname(self.path)
+                if dirname:
+                    os.makedirs(dirname, exist_ok=True)
+                write_file_atomic(self.path, json.dumps(merged).encode(), mode=self.mode)
+
+            # force reload on next read, so changes made by other writers are not lost
+            self._signature = None
+        return True
+
+    def set(self, key: str, value: Any) -> bool:
+        """Set key with given value.
+
+        :param key: Key name.
+        :param value: Value of the key.
+        :returns: A boolean to mark whether key-value pair is written.
+        """
+        return self.set_all({key: value})
+
+
+class FileStoreAdapter:
+    """Base class of config/secret adapters backed by :class:`FileStore`.
+
+    Subclass only declares its settings and the permission of newly created files;
+    it must also inherit from the base config/secret class (after this class).
+
+    .. code-block:: python
+
+        class FileConfig(FileStoreAdapter, BaseConfig):
+            setting_prefix = "GLUU_CONFIG_FILE_"
+            default_path = "/etc/gluu/conf/config.json"
+    """
+
+    #: Prefix of environment variables used by the adapter, i.e. ``GLUU_CONFIG_FILE_``.
+    setting_prefix = ""
+
+    #: Default path to directory or JSON file (used if ``<setting_prefix>PATH`` is not set).
+    default_path = ""
+
+    #: Permission of newly created files.
+    mode = 0o644
+
+    def __init__(self) -> None:
+        self.settings = {
+            k: v
+            for k, v in os.environ.items()
+            if k.isupper() and k.startswith(self.setting_prefix)
+        }
+        path_setting = f"{self.setting_prefix}PATH"
+        self.settings.setdefault(path_setting, self.default_path)
+        self.store = FileStore(self.settings[path_setting], mode=self.mode)
+
+    @instrument
+    def get(self, key: str, default: Any = "") -> Any:
+        """Get value based on given key.
+
+        :param key: Key name.
+        :param default: Default value if key is not exist.
+        :returns: Value based on given key or default one.
+        """
+        return self.store.get(key, default)
+
+    @instrument
+    def set(self, key: str, value: Any) -> bool:
+        """Set key with given value.
+
+        :param key: Key name.
+        :param value: Value of the key.
+        :returns: A ``bool`` to mark whether key-value pair is set or not.
+        """
+        return self.store.set(key, value)
+
+    @instrument
+    def get_all(self) -> dict[str, Any]:
+        """Get all key-value pairs.
+
+        :returns: A ``dict`` of key-value pairs (if any).
+        """
+        return self.store.get_all()
+
+    @instrument
+    def set_all(self, data: dict[str, Any]) -> bool:
+        """Set key-value pairs.
+
+        :param data: Key-value pairs.
+        :returns: A ``bool`` to mark whether key-value pairs are set or not.
+        """
+        return self.store.set_all(data)
@@ -0,0 +1,307 @@
+"""This module contains long-running health monitor that serves cached status of dependencies.
+
+The monitor runs each ``wait_for_*`` probe (without its retry loop) on a schedule,
+keeping clients to the backends across runs, and serves the last results over HTTP
+(TCP or Unix socket), so liveness/readiness probes don't need to start a Python process
+nor connect to the backends.
+
+.. code-block:: sh
+
+    python -m pygluu.containerlib.health --deps config,secret,ldap --address 127.0.0.1:9099
+    curl http://127.0.0.1:9099/health
+
+    python -m pygluu.containerlib.health --deps config,secret --address unix:/run/gluu/health.sock
+    curl --unix-socket /run/gluu/health.sock http://localhost/health
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import socketserver
+import stat
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import (
+    Any,
+    Callable,
+    Optional,
+)
+
+from pygluu.containerlib.wait import get_wait_callbacks
+from pygluu.containerlib.wait import run_once
+from pygluu.containerlib.wait import wait_deadline
+
+logger = logging.getLogger(__name__)
+
+#: Result of a single probe.
+HealthStatus = namedtuple(
+    "HealthStatus",
+    ["ok", "error", "checked_at", "duration"],
+)
+
+
+class HealthMonitor:
+    """Probe dependencies on a schedule and keep their last results.
+
+    Each dependency is probed in its own thread, so a slow dependency doesn't delay
+    the others. Probes are the ``wait_for_*`` functions (see
+    :func:`~pygluu.containerlib.wait.get_wait_callbacks`) called once per run,
+    bounded by ``timeout``: HTTP requests use the remaining time as their timeout,
+    and a probe that doesn't finish in time (i.e. LDAP or SQL connection hangs)
+    is reported as failed while it keeps running in a worker thread; no new probe
+    of the same dependency is started until it finishes.
+
+    A result older than ``max_age`` seconds (i.e. the probe hangs) is reported as failed.
+
+    :param manager: An instance of :class:`~pygluu.containerlib.manager._Manager`.
+    :param deps: Names of dependencies to probe, i.e. ``["config", "secret", "ldap"]``.
+    :param interval: Interval between probes of each dependency (in seconds).
+    :param timeout: Max. time of each probe (in seconds).
+    :param max_age: Max. age of a result (in seconds); default to 3 times ``interval`` plus ``timeout``.
+    :param timer: Callable to get current time (in seconds since epoch).
+    """
+
+    def __init__(
+        self,
+        manager: Any,
+        deps: list[str],
+        interval: float = 10,
+        timeout: float = 5,
+        max_age: Optional[float] = None,
+        timer: Callable[[], float] = time.time,
+    ) -> None:
+        callbacks = get_wait_callbacks()
+
+        self.manager = manager
+        self.interval = max(0.1, interval)
+        self.timeout = max(0.1, timeout)
+        self.max_age = max_age if max_age is not None else self.interval * 3 + self.timeout
+        self.timer = timer
+
+        self.probes: dict[str, dict[str, Any]] = {}
+        for dep in deps:
+            if dep not in callbacks:
+                logger.warning(f"Unsupported callback for {dep} dependency")
+                continue
+            self.probes[dep] = callbacks[dep]
+
+        self._results: dict[str, HealthStatus] = {}
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+        # a single in-flight probe per dependency
+        self._futures: dict[str, Future] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self.probes)), thread_name_prefix="gluu-health-probe",
+        )
+
+    def check(self, dep: str) -> HealthStatus:
+        """Probe a dependency once and store the result.
+
+        :param dep: Name of the dependency.
+        :returns: Result of the probe.
+        """
+        callback = self.probes[dep]
+        start = time.monotonic()
+        deadline = start + self.timeout
+
+        future = self._futures.get(dep)
+        if future is None or future.done():
+            future = self._executor.submit(self._probe, callback, deadline)
+            self._futures[dep] = future
+
+        error = None
+        try:
+            future.result(timeout=max(0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            error = f"Timed out after {self.timeout:g} seconds"
+        except Exception as exc:  # noqa: B902
+            error = str(exc) or exc.__class__.__name__
+
+        result = HealthStatus(error is None, error, self.timer(), time.monotonic() - start)
+        previous = self._results.get(dep)
+        if previous is None or previous.ok != result.ok:
+            label = callback["kwargs"].get("label", dep)
+            if result.ok:
+                logger.info(f"{label} is healthy")
+            else:
+                logger.warning(f"{label} is unhealthy; reason={error}")
+
+        self._results[dep] = result
+        return result
+
+    def _probe(self, callback: dict[str, Any], deadline: float) -> None:
+        """Run a probe (in a worker thread) bounded by the given deadline."""
+        # skip the retry loop of the decorated ``wait_for_*`` function
+        with wait_deadline(deadline):
+            run_once(callback["func"], self.manager, **callback["kwargs"])
+
+    def check_all(self) -> dict[str, HealthStatus]:
+        """Probe all dependencies once (sequentially).
+
+        :returns: A mapping of dependency name and its result.
+        """
+        return {dep: self.check(dep) for dep in self.probes}
+
+    def _run(self, dep: str) -> None:
+        while not self._stop.is_set():
+            self.check(dep)
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        """Start probing dependencies in background threads."""
+        if self._threads:
+            return
+
+        self._stop.clear()
+        for dep in self.probes:
+            thread = threading.Thread(target=self._run, args=(dep,), name=f"gluu-health-{dep}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        """Stop background threads."""
+        self._stop.set()
+        self._threads = []
+        # don't wait for hanging probes
+        self._executor.shutdown(wait=False)
+
+    def status(self, deps: Optional[list[str]] = None) -> dict[str, Any]:
+        """Get last results of dependencies.
+
+        :param deps: Names of dependencies; if omitted, all dependencies are included.
+        :returns: A ``dict`` contains overall status (``ok`` or ``fail``) and results of each dependency.
+        """
+        now = self.timer()
+        checks = {}
+
+        for dep in deps or list(self.probes):
+            result = self._results.get(dep)
+            if result is None:
+                checks[dep] = {"ok": False, "error": "Not checked yet", "checked_at": None, "duration": None}
+                continue
+
+            check = result._asdict()
+            if result.ok and now - result.checked_at > self.max_age:
+                check.update(ok=False, error=f"Last result is older than {self.max_age:.0f} seconds")
+            checks[dep] = check
+
+        healthy = all(check["ok"] for check in checks.values())
+        return {"status": "ok" if healthy else "fail", "checks": checks}
+
+
+class _HealthRequestHandler(BaseHTTPRequestHandler):
+    """Serve ``GET /health`` and ``GET /health/<dep>`` from :class:`HealthMonitor` results."""
+
+    monitor: HealthMonitor
+
+    def do_GET(self):  # noqa: N802
+        path = self.path.split("?", 1)[0].rstrip("/")
+
+        if path == "/health":
+            deps = None
+        elif path.startswith("/health/") and path[len("/health/"):] in self.monitor.probes:
+            deps = [path[len("/health/"):]]
+        else:
+            self._send(404, {"error": "Not found"})
+            return
+
+        status = self.monitor.status(deps)
+        self._send(200 if status["status"] == "ok" else 503, status)
+
+    def _send(self, code: int, data: dict[str, Any]) -> None:
+        body = json.dumps(data).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # client address of Unix socket is an empty string
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):  # noqa: A002
+        logger.debug(format % args)
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        # remove socket file left by previous process (but never a regular file)
+        try:
+            if stat.S_ISSOCK(os.stat(self.server_address).st_mode):
+                os.unlink(self.server_address)
+        except FileNotFoundError:
+            pass
+        super().server_bind()
+        self.server_name = "localhost"
+        self.server_port = 0
+
+
+def make_server(monitor: HealthMonitor, address: str) -> socketserver.BaseServer:
+    """Create HTTP server that serves results of the monitor.
+
+    :param monitor: An instance of :class:`HealthMonitor`.
+    :param address: Either ``host:port`` or ``unix:/path/to/socket``.
+    :returns: Server instance (not started yet).
+    """
+    handler = type("HealthRequestHandler", (_HealthRequestHandler,), {"monitor": monitor})
+
+    if address.startswith("unix:"):
+        return _UnixHTTPServer(address[len("unix:"):], handler)
+
+    host, _, port = address.rpartition(":")
+    return ThreadingHTTPServer((host or "127.0.0.1", int(port)), handler)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Run health monitor and serve its results until interrupted.
+
+    Options default to the following environment variables:
+
+    - ``GLUU_HEALTH_DEPS``: comma-separated dependencies (default to ``config,secret``)
+    - ``GLUU_HEALTH_ADDRESS``: ``host:port`` or ``unix:/path/to/socket`` (default to ``127.0.0.1:9099``)
+    - ``GLUU_HEALTH_INTERVAL``: interval between probes in seconds (default to ``10``)
+    - ``GLUU_HEALTH_TIMEOUT``: max. time of each probe in seconds (default to ``5``)
+
+    :param argv: Command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Serve health status of Gluu dependencies.")
+    parser.add_argument("--deps", default=os.environ.get("GLUU_HEALTH_DEPS", "config,secret"))
+    parser.add_argument("--address", default=os.environ.get("GLUU_HEALTH_ADDRESS", "127.0.0.1:9099"))
+    parser.add_argument("--interval", type=float, default=float(os.environ.get("GLUU_HEALTH_INTERVAL", 10)))
+    parser.add_argument("--timeout", type=float, default=float(os.environ.get("GLUU_HEALTH_TIMEOUT", 5)))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    from pygluu.containerlib.manager import get_manager
+
+    deps = [dep.strip() for dep in args.deps.split(",") if dep.strip()]
+    monitor = HealthMonitor(get_manager(), deps, interval=args.interval, timeout=args.timeout)
+    monitor.start()
+
+    server = make_server(monitor, args.address)
+    logger.info(f"Serving health status of {', '.join(monitor.probes)} at {args.address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:  # pragma: no cover
+        pass
+    finally:
+        server.server_close()
+        monitor.stop()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -2,53 +2,362 @@
 
 from __future__ import annotations
 
+import importlib
+import logging
 import os
+import threading
+import time
 from collections import namedtuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import (
     Any,
+    AnyStr,
+    Callable,
     NamedTuple,
+    Optional,
+    Tuple,
+    Union,
 )
 
-from pygluu.containerlib.config import (
-    ConsulConfig,
-    KubernetesConfig,
-    AwsConfig,
-    GoogleConfig,
-)
-from pygluu.containerlib.secret import (
-    KubernetesSecret,
-    VaultSecret,
-    AwsSecret,
-    GoogleSecret,
-)
+from pygluu.containerlib.registry import clients
+from pygluu.containerlib.snapshot import Snapshot
 from pygluu.containerlib.utils import (
+    AES_GCM_PREFIX,
+    Codec,
     decode_text,
     encode_text,
+    safe_value,
+    write_file_atomic,
 )
 
+logger = logging.getLogger(__name__)
 
-class ConfigManager:
-    """This class acts as a proxy to specific config adapter class.
+# marks that native adapter of async manager has not been created yet
+_UNSET = object()
 
-    Supported config adapter class:
 
-    - :class:`~pygluu.containerlib.config.consul_config.ConsulConfig`
-    - :class:`~pygluu.containerlib.config.kubernetes_config.KubernetesConfig`
-    - :class:`~pygluu.containerlib.config.aws_config.AwsConfig`
+def _decoded_text(value: bytes) -> str:
+    """Convert decoded secret value into text.
+
+    :param value: Decoded value.
+    :returns: Text of the value.
     """
+    try:
+        return value.decode()
+    except UnicodeDecodeError:
+        # likely bytes from a binary
+        return value.decode("ISO-8859-1")
 
-    def __init__(self):  # noqa: D107
-        _adapter = os.environ.get("GLUU_CONFIG_ADAPTER", "consul",)
-        if _adapter == "consul":
-            self.adapter = ConsulConfig()
-        elif _adapter == "kubernetes":
-            self.adapter = KubernetesConfig()
-        elif _adapter == "aws":
-            self.adapter = AwsConfig()
-        elif _adapter == "google":
-            self.adapter = GoogleConfig()
+
+class AdapterCache:
+    """Thread-safe cache of key-value pairs fetched from config/secret adapter.
+
+    The cache holds a snapshot of key-value pairs that expires after ``ttl`` seconds.
+    Number of entries is capped by ``maxsize``; when the cap is reached,
+    least recently used entries are evicted.
+
+    :param ttl: Lifetime of cached entries (in seconds); set to ``0`` to disable the cache.
+    :param maxsize: Maximum number of entries; set to ``0`` for unlimited entries.
+    :param timer: Callable to get current time (in seconds).
+    """
+
+    def __init__(self, ttl: float = 0, maxsize: int = 0, timer: Callable[[], float] = time.monotonic):
+        self.ttl = max(0, ttl)
+        self.maxsize = max(0, maxsize)
+        self.timer = timer
+
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.RLock()
+
+        # time when snapshot is loaded
+        self._loaded_at: Optional[float] = None
+
+        # whether cached entries contain all key-value pairs from the adapter
+        self._complete = False
+
+    @property
+    def enabled(self) -> bool:
+        """Check whether cache is enabled."""
+        return self.ttl > 0
+
+    @property
+    def fresh(self) -> bool:
+        """Check whether cached snapshot has not expired yet."""
+        with self._lock:
+            if self._loaded_at is None:
+                return False
+            return self.timer() - self._loaded_at < self.ttl
+
+    @property
+    def complete(self) -> bool:
+        """Check whether cached snapshot is fresh and contains all key-value pairs."""
+        with self._lock:
+            return self._complete and self.fresh
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Get cached value of given key.
+
+        :param key: Key name.
+        :returns: A pair of flag to mark whether the key is cached and its value.
+        """
+        with self._lock:
+            if not self.fresh or key not in self._entries:
+                return False, None
+
+            # mark as recently used
+            self._entries.move_to_end(key)
+            return True, self._entries[key]
+
+    def get_all(self) -> dict[str, Any]:
+        """Get all cached key-value pairs.
+
+        :returns: A copy of cached key-value pairs.
+        """
+        with self._lock:
+            return dict(self._entries)
+
+    def load(self, data: dict[str, Any]) -> None:
+        """Replace cached entries with a snapshot of all key-value pairs.
+
+        :param data: All key-value pairs from the adapter.
+        """
+        with self._lock:
+            self._entries = OrderedDict(data)
+            self._loaded_at = self.timer()
+            self._complete = True
+            self._evict()
+
+    def update(self, data: dict[str, Any]) -> None:
+        """Add or replace cached entries.
+
+        Entries are only updated when there is a fresh snapshot; otherwise the next
+        read will load a new snapshot from the adapter anyway.
+
+        :param data: Key-value pairs.
+        """
+        with self._lock:
+            if not self.fresh:
+                return
+
+            for key, value in data.items():
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+            self._evict()
+
+    def invalidate(self, keys: Optional[list[str]] = None) -> None:
+        """Remove cached entries.
+
+        :param keys: Key names to remove; if omitted, all entries are removed.
+        """
+        with self._lock:
+            if keys is None:
+                self._entries.clear()
+                self._loaded_at = None
+                self._complete = False
+                return
+
+            for key in keys:
+                self._entries.pop(key, None)
+
+            # explicitly invalidated keys (cached or not) may have been changed in the adapter,
+            # hence the snapshot is no longer complete
+            if keys:
+                self._complete = False
+
+    def _evict(self) -> None:
+        """Evict least recently used entries that exceed the max. size."""
+        if not self.maxsize:
+            return
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._complete = False
+
+
+def _get_cache_setting(name: str, default: float) -> float:
+    """Get numeric cache setting from environment variable.
+
+    :param name: Environment variable name.
+    :param default: Default value if environment variable is missing or invalid.
+    :returns: Numeric value of the setting.
+    """
+    try:
+        val = float(os.environ.get(name, default))
+    except ValueError:
+        val = default
+    return max(0, val)
+
+
+class BaseManager:
+    """Base class for manager that acts as a proxy to specific adapter class.
+
+    Read-through caching is disabled by default. To enable the cache, set
+    ``GLUU_<TYPE>_CACHE_TTL`` environment variable (in seconds) where ``<TYPE>``
+    is either ``CONFIG`` or ``SECRET``. The max. number of cached entries
+    is controlled by ``GLUU_<TYPE>_CACHE_MAXSIZE`` environment variable
+    (default to ``1000``, set to ``0`` for unlimited entries).
+
+    When cache is enabled, the first read loads all key-value pairs from the adapter
+    and subsequent reads are served from the cache until it expires.
+
+    When ``GLUU_MANAGER_SNAPSHOT_DIR`` environment variable is set, loaded key-value pairs
+    are also persisted as encrypted snapshot (see :class:`~pygluu.containerlib.snapshot.Snapshot`)
+    and the cache is enabled by default (with 60 seconds TTL). On the next start, the first read
+    is served from the snapshot immediately while the adapter is revalidated in background.
+    If the adapter is unreachable, reads fallback to the snapshot as long as it is not older than
+    ``GLUU_MANAGER_SNAPSHOT_MAX_STALENESS`` seconds.
+    """
+
+    #: Name used as part of environment variable names, i.e. ``config`` or ``secret``.
+    type = ""
+
+    def __init__(self, adapter: Any = None):
+        self.adapter = adapter
+
+        # serializes loading snapshot into cache when accessed by multiple threads
+        self._load_lock = threading.Lock()
+
+        self.snapshot = Snapshot.from_env(self.type) if self.type else None
+
+        prefix = f"GLUU_{self.type.upper()}_CACHE"
+        self.cache = AdapterCache(
+            ttl=_get_cache_setting(f"{prefix}_TTL", 60 if self.snapshot else 0),
+            maxsize=int(_get_cache_setting(f"{prefix}_MAXSIZE", 1000)),
+        )
+
+        # whether the first load (possibly from snapshot) has been attempted
+        self._booted = False
+
+    def _get(self, key: str, default: Any) -> Any:
+        """Get value based on given key (from cache if possible).
+
+        :param key: Key name.
+        :param default: Default value if key is not exist.
+        :returns: Value based on given key or default one.
+        """
+        if not self.cache.enabled:
+            return self.adapter.get(key, default)
+
+        if not self.cache.fresh:
+            self._refresh_cache()
+
+        cached, value = self.cache.get(key)
+        if cached:
+            return value
+
+        # key is missing from a complete snapshot, hence it doesn't exist
+        if self.cache.complete:
+            return default
+
+        # some entries have been evicted, fallback to fetching a single key
+        value = self.adapter.get(key, default)
+        if value != default:
+            self.cache.update({key: value})
+        return value
+
+    def _refresh_cache(self) -> dict[str, Any]:
+        """Load all key-value pairs into cache unless other thread has done it.
+
+        :returns: A mapping of all key-value pairs.
+        """
+        with self._load_lock:
+            # other thread may have loaded the snapshot while waiting for the lock
+            if self.cache.complete:
+                return self.cache.get_all()
+
+            if not self._booted:
+                self._booted = True
+                data = self._boot_from_snapshot()
+                if data is not None:
+                    return data
+            return self._load_cache()
+
+    def _boot_from_snapshot(self) -> Optional[dict[str, Any]]:
+        """Load key-value pairs from snapshot into cache and revalidate them in background.
+
+        :returns: A mapping of all key-value pairs or ``None`` if snapshot is not usable.
+        """
+        if not self.snapshot:
+            return None
+
+        snapshot = self.snapshot.load()
+        if not snapshot or self.snapshot.is_stale(snapshot):
+            return None
+
+        self.cache.load(snapshot.data)
+        threading.Thread(
+            target=self._revalidate, name=f"gluu-{self.type}-revalidate", daemon=True,
+        ).start()
+        return dict(snapshot.data)
+
+    def _revalidate(self) -> None:
+        """Reload key-value pairs from adapter, replacing the ones loaded from snapshot."""
+        try:
+            self._load_cache()
+        except Exception as exc:  # noqa: B902
+            logger.warning(f"Unable to revalidate {self.type} snapshot; reason={exc}")
+
+    def _load_cache(self) -> dict[str, Any]:
+        """Load all key-value pairs from adapter into cache.
+
+        If the adapter is unreachable, key-value pairs are loaded from snapshot (if any)
+        as long as it is not stale.
+
+        :returns: A mapping of all key-value pairs.
+        """
+        try:
+            data = self.adapter.get_all()
+        except Exception as exc:  # noqa: B902
+            data = self._snapshot_fallback(exc)
+            if data is None:
+                raise
+        else:
+            self._save_snapshot(data)
+
+        self.cache.load(data)
+        return dict(data)
+
+    def _snapshot_fallback(self, exc: Exception) -> Optional[dict[str, Any]]:
+        """Get key-value pairs from snapshot when the adapter is unreachable.
+
+        :param exc: Error raised by the adapter.
+        :returns: A mapping of all key-value pairs or ``None`` if snapshot is not usable.
+        """
+        snapshot = self.snapshot.load() if self.snapshot else None
+        if not snapshot or self.snapshot.is_stale(snapshot):
+            return None
+
+        logger.warning(
+            f"Unable to load {self.type} from adapter; using snapshot created "
+            f"{self.snapshot.age(snapshot):.0f} seconds ago; reason={exc}"
+        )
+        return snapshot.data
+
+    def _save_snapshot(self, data: dict[str, Any]) -> None:
+        """Persist key-value pairs loaded from the adapter as snapshot (if enabled).
+
+        :param data: A mapping of all key-value pairs.
+        """
+        if not self.snapshot:
+            return
+
+        try:
+            self.snapshot.save(data)
+        except OSError as exc:
+            logger.warning(f"Unable to save {self.type} snapshot; reason={exc}")
+
+    def _cache_written(self, data: dict[str, Any], result: bool) -> None:
+        """Update cached entries after key-value pairs are written to the adapter.
+
+        :param data: Key-value pairs.
+        :param result: Whether the adapter has written the key-value pairs.
+        """
+        if result:
+            self.cache.update({k: safe_value(v) for k, v in data.items()})
         else:
-            self.adapter = None
+            self.cache.invalidate(list(data))
 
     def get(self, key: str, default: Any = "") -> Any:
         """Get value based on given key.
@@ -57,7 +366,7 @@ class ConfigManager:
         :param default: Default value if key is not exist.
         :returns: Value based on given key or default one.
         """
-        return self.adapter.get(key, default)
+        return self._get(key, default)
 
     def set(self, key: str, value: Any) -> bool:
         """Set key with given value.
@@ -66,7 +375,9 @@ class ConfigManager:
         :param value: Value of the key.
         :returns: A ``bool`` to mark whether config is set or not.
         """
-        return self.adapter.set(key, value)
+        result = self.adapter.set(key, value)
+        self._cache_written({key: value}, result)
+        return result
 
     def all(self) -> dict[str, Any]:
         """Get all key-value pairs.
@@ -80,20 +391,91 @@ class ConfigManager:
     def get_all(self) -> dict[str, Any]:
         """Get all key-value pairs.
 
-        :returns: A mapping of configuration (if any).
+        :returns: A mapping of key-value pairs (if any).
         """
-        return self.adapter.get_all()
+        if not self.cache.enabled:
+            return self.adapter.get_all()
+
+        if self.cache.complete:
+            return self.cache.get_all()
+        return self._refresh_cache()
 
     def set_all(self, data: dict[str, Any]) -> bool:
         """Set all key-value pairs.
 
         :param data: Key-value pairs.
-        :returns: A boolean to mark whether configuration is set or not.
+        :returns: A boolean to mark whether key-value pairs are set or not.
+        """
+        result = self.adapter.set_all(data)
+        self._cache_written(data, result)
+        return result
+
+    def invalidate(self, keys: Optional[list[str]] = None) -> None:
+        """Invalidate cached entries, forcing subsequent reads to hit the adapter.
+
+        :param keys: Key names to invalidate; if omitted, all entries are invalidated.
         """
-        return self.adapter.set_all(data)
+        self.cache.invalidate(keys)
+
+    def wait_for_key(self, key: str, timeout: float, default: Any = "") -> Any:
+        """Wait until given key has non-empty value.
 
+        Adapters that support change notifications (i.e. Consul and Kubernetes)
+        block until the key is set; other adapters check the key once.
 
-class SecretManager:
+        :param key: Key name.
+        :param timeout: Max. time to wait (in seconds).
+        :param default: Default value if key is not set.
+        :returns: Value of the key or default one.
+        """
+        cached, value = self.cache.get(key)
+        if cached and value:
+            return value
+
+        value = self.adapter.wait_for_key(key, timeout, default)
+        if value != default:
+            self.cache.update({key: value})
+        return value
+
+
+class ConfigManager(BaseManager):
+    """This class acts as a proxy to specific config adapter class.
+
+    Supported config adapter class:
+
+    - :class:`~pygluu.containerlib.config.consul_config.ConsulConfig`
+    - :class:`~pygluu.containerlib.config.kubernetes_config.KubernetesConfig`
+    - :class:`~pygluu.containerlib.config.aws_config.AwsConfig`
+    - :class:`~pygluu.containerlib.config.google_config.GoogleConfig`
+    - :class:`~pygluu.containerlib.config.file_config.FileConfig`
+    """
+
+    type = "config"
+
+    def __init__(self):  # noqa: D107
+        # adapters are imported on demand to avoid loading SDKs of unused backends
+        _adapter = os.environ.get("GLUU_CONFIG_ADAPTER", "consul",)
+        if _adapter == "consul":
+            from pygluu.containerlib.config.consul_config import ConsulConfig
+            adapter = ConsulConfig()
+        elif _adapter == "kubernetes":
+            from pygluu.containerlib.config.kubernetes_config import KubernetesConfig
+            adapter = KubernetesConfig()
+        elif _adapter == "aws":
+            from pygluu.containerlib.config.aws_config import AwsConfig
+            adapter = AwsConfig()
+        elif _adapter == "google":
+            from pygluu.containerlib.config.google_config import GoogleConfig
+            adapter = GoogleConfig()
+        elif _adapter == "file":
+            from pygluu.containerlib.config.file_config import FileConfig
+            adapter = FileConfig()
+        else:
+            adapter = None
+        super().__init__(adapter)
+
+
+class SecretManager(BaseManager):
     """This class acts as a proxy to specific secret adapter class.
 
     Supported secret adapter class:
@@ -101,20 +483,39 @@ class SecretManager:
     - :class:`~pygluu.containerlib.secret.vault_secret.VaultSecret`
     - :class:`~pygluu.containerlib.secret.kubernetes_secret.KubernetesSecret`
     - :class:`~pygluu.containerlib.secret.aws_secret.AwsSecret`
+    - :class:`~pygluu.containerlib.secret.google_secret.GoogleSecret`
+    - :class:`~pygluu.containerlib.secret.file_secret.FileSecret`
+
+    Values stored by :meth:`from_file` and :meth:`from_files` (with encoding enabled)
+    are encoded using mode specified by ``GLUU_SECRET_ENCODE_MODE`` environment variable,
+    either ``3des`` (default) or ``aes-gcm``. Decoding auto-detects the mode.
     """
 
+    type = "secret"
+
     def __init__(self):  # noqa: D107
+        self.encode_mode = os.environ.get("GLUU_SECRET_ENCODE_MODE", "3des")
+
+        # adapters are imported on demand to avoid loading SDKs of unused backends
         _adapter = os.environ.get("GLUU_SECRET_ADAPTER", "vault",)
         if _adapter == "vault":
-            self.adapter = VaultSecret()
+            from pygluu.containerlib.secret.vault_secret import VaultSecret
+            adapter = VaultSecret()
         elif _adapter == "kubernetes":
-            self.adapter = KubernetesSecret()
+            from pygluu.containerlib.secret.kubernetes_secret import KubernetesSecret
+            adapter = KubernetesSecret()
         elif _adapter == "aws":
-            self.adapter = AwsSecret()
+            from pygluu.containerlib.secret.aws_secret import AwsSecret
+            adapter = AwsSecret()
         elif _adapter == "google":
-            self.adapter = GoogleSecret()
+            from pygluu.containerlib.secret.google_secret import GoogleSecret
+            adapter = GoogleSecret()
+        elif _adapter == "file":
+            from pygluu.containerlib.secret.file_secret import FileSecret
+            adapter = FileSecret()
         else:
-            self.adapter = None
+            adapter = None
+        super().__init__(adapter)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get value based on given key.
@@ -123,43 +524,10 @@ class SecretManager:
         :param default: Default value if key is not exist.
         :returns: Value based on given key or default one.
         """
-        return self.adapter.get(key, default)
-
-    def set(self, key: str, value: Any) -> bool:  # noqa: A003
-        """Set key with given value.
-
-        :param key: Key name.
-        :param value: Value of the key.
-        :returns: A ``bool`` to mark whether config is set or not.
-        """
-        return self.adapter.set(key, value)
-
-    def all(self) -> dict[str, Any]:
-        """Get all key-value pairs.
-
-        This method is deprecated in favor of ``get_all`` method.
-
-        :returns: A ``dict`` of key-value pairs (if any).
-        """
-        return self.get_all()
-
-    def get_all(self) -> dict[str, Any]:
-        """Get all key-value pairs.
-
-        :returns: A ``dict`` of key-value pairs (if any).
-        """
-        return self.adapter.get_all()
-
-    def set_all(self, data: dict[str, Any]) -> bool:
-        """Set all key-value pairs.
-
-        :param data: Key-value pairs.
-        :returns: A boolean to mark whether configuration is set or not.
-        """
-        return self.adapter.set_all(data)
+        return self._get(key, default)
 
     def to_file(
-        self, key: str, dest: str, decode: bool = False, binary_mode: bool = False
+        self, key: str, dest: str, decode: bool = False, binary_mode: bool = False, mode: int = 0o600,
     ) -> None:  # noqa: D412
         """Pull secret and write to a file.
 
@@ -186,27 +554,99 @@ class SecretManager:
         :param dest: Absolute path to file to write the secret to.
         :param decode: Decode the content of the secret.
         :param binary_mode: Write the file as binary.
+        :param mode: Permission of the file if it doesn't exist yet (readable by owner only by default).
         """
-        mode = "w"
         if binary_mode:
-            mode = "wb"
             # always decodes the bytes
             decode = True
 
-        value = self.adapter.get(key)
+        value = self.get(key, "")
         if decode:
-            salt = self.adapter.get("encoded_salt")
-            try:
-                value = decode_text(value, salt).decode()
-            except UnicodeDecodeError:
-                # likely bytes from a binary
-                value = decode_text(value, salt).decode("ISO-8859-1")
+            salt = self.get("encoded_salt", "")
+            value = _decoded_text(decode_text(value, salt))
+        write_file_atomic(dest, self._file_contents(value, binary_mode), mode=mode)
+
+    def _file_contents(self, value: str, binary_mode: bool) -> bytes:
+        """Convert secret value into contents of a file.
+
+        :param value: Value of the secret.
+        :param binary_mode: Write the file as binary.
+        :returns: Contents of the file.
+        """
+        if binary_mode:
+            # convert to bytes
+            return value.encode("ISO-8859-1")
+        return value.encode()
+
+    def to_files(self, mapping: dict[str, Union[str, dict[str, Any]]]) -> None:  # noqa: D412
+        """Pull multiple secrets and write them to files.
+
+        All secrets are fetched at once, then written (atomically) in parallel.
+
+        Example:
+
+        .. code-block:: python
+
+            SecretManager().to_files({
+                "server_cert": "/etc/certs/server.crt",
+                "server_jks": {
+                    "dest": "/etc/certs/server.jks",
+                    "decode": True,
+                    "binary_mode": True,
+                },
+            })
+
+        :param mapping: A mapping of key name in secret backend and either absolute path to
+                        file or ``dict`` of :meth:`to_file` keyword arguments (``dest``,
+                        ``decode``, ``binary_mode``, and ``mode``).
+        """
+        specs = self._file_specs(mapping)
+        if not specs:
+            return
+        self._write_files(specs, self.get_all())
+
+    @staticmethod
+    def _file_specs(mapping: dict[str, Union[str, dict[str, Any]]]) -> dict[str, dict[str, Any]]:
+        """Normalize mapping passed to :meth:`to_files`.
+
+        :param mapping: A mapping of key name and either absolute path to file or ``dict`` of options.
+        :returns: A mapping of key name and ``dict`` of all options.
+        """
+        specs = {}
+        for key, spec in mapping.items():
+            if isinstance(spec, str):
+                spec = {"dest": spec}
+            spec = {"decode": False, "binary_mode": False, "mode": 0o600, **spec}
+            if spec["binary_mode"]:
+                # always decodes the bytes
+                spec["decode"] = True
+            specs[key] = spec
+        return specs
+
+    def _write_files(self, specs: dict[str, dict[str, Any]], data: dict[str, Any]) -> None:
+        """Decode secrets (if needed) and write them to files in parallel.
+
+        :param specs: A mapping of key name and ``dict`` of options (see :meth:`_file_specs`).
+        :param data: All key-value pairs fetched from secret backend.
+        """
+        values = {key: data.get(key) or "" for key in specs}
+
+        # decode all values at once using a single codec
+        decoded_keys = [key for key, spec in specs.items() if spec["decode"]]
+        if decoded_keys:
+            codec = Codec(data.get("encoded_salt") or "")
+            decoded = codec.decode_many([values[key] for key in decoded_keys])
+            values.update({key: _decoded_text(value) for key, value in zip(decoded_keys, decoded)})
+
+        def write(key):
+            spec = specs[key]
+            write_file_atomic(
+                spec["dest"], self._file_contents(values[key], spec["binary_mode"]), mode=spec["mode"],
+            )
 
-        with open(dest, mode) as f:
-            if binary_mode:
-                # convert to bytes
-                value = value.encode("ISO-8859-1")
-            f.write(value)
+        with ThreadPoolExecutor(max_workers=min(8, len(specs))) as executor:
+            # consume results to propagate errors (if any)
+            list(executor.map(write, specs))
 
     def from_file(
         self, key: str, src: str, encode: bool = False, binary_mode: bool = False
@@ -235,21 +675,129 @@ class SecretManager:
         :param encode: Encode the content of the file.
         :param binary_mode: Read the file as binary.
         """
-        mode = "r"
         if binary_mode:
-            mode = "rb"
             encode = True
 
+        value = self._read_file(src, binary_mode)
+        if encode:
+            salt = self.get("encoded_salt", "")
+            value = encode_text(value, salt, mode=self.encode_mode).decode()
+        self.set(key, value)
+
+    def _read_file(self, src: str, binary_mode: bool) -> AnyStr:
+        """Read contents of a file.
+
+        :param src: Absolute path to file to read the secret from.
+        :param binary_mode: Read the file as binary.
+        :returns: Contents of the file.
+        """
+        mode = "rb" if binary_mode else "r"
+
         with open(src, mode) as f:
             try:
-                value = f.read()
+                return f.read()
             except UnicodeDecodeError:
                 raise ValueError(f"Looks like you're trying to read binary file {src}")
 
-        if encode:
-            salt = self.adapter.get("encoded_salt")
-            value = encode_text(value, salt).decode()
-        self.adapter.set(key, value)
+    def from_files(self, mapping: dict[str, Union[str, dict[str, Any]]]) -> bool:  # noqa: D412
+        """Put multiple secrets from files.
+
+        All files are read first, then pushed to secret backend at once.
+
+        Example:
+
+        .. code-block:: python
+
+            SecretManager().from_files({
+                "server_cert": "/etc/certs/server.crt",
+                "server_jks": {
+                    "src": "/etc/certs/server.jks",
+                    "encode": True,
+                    "binary_mode": True,
+                },
+            })
+
+        :param mapping: A mapping of key name in secret backend and either absolute path to
+                        file or ``dict`` of :meth:`from_file` keyword arguments (``src``,
+                        ``encode``, and ``binary_mode``).
+        :returns: A boolean to mark whether secrets are set or not.
+        """
+        values, encoded_keys = self._read_files(mapping)
+        if not values:
+            return True
+
+        if encoded_keys:
+            values = self._encode_values(values, encoded_keys, self.get("encoded_salt", ""))
+        return self.set_all(values)
+
+    def _read_files(self, mapping: dict[str, Union[str, dict[str, Any]]]) -> Tuple[dict[str, AnyStr], list[str]]:
+        """Read files passed to :meth:`from_files`.
+
+        :param mapping: A mapping of key name and either absolute path to file or ``dict`` of options.
+        :returns: A pair of mapping of key name and contents of the file, and key names to encode.
+        """
+        values = {}
+        encoded_keys = []
+
+        for key, spec in mapping.items():
+            if isinstance(spec, str):
+                spec = {"src": spec}
+
+            binary_mode = spec.get("binary_mode", False)
+            values[key] = self._read_file(spec["src"], binary_mode)
+
+            if spec.get("encode", False) or binary_mode:
+                encoded_keys.append(key)
+        return values, encoded_keys
+
+    def _encode_values(self, values: dict[str, AnyStr], encoded_keys: list[str], salt: str) -> dict[str, AnyStr]:
+        """Encode values of given keys at once using a single codec.
+
+        :param values: A mapping of key name and its value.
+        :param encoded_keys: Key names to encode.
+        :param salt: Salt used to encode the values.
+        :returns: A new mapping with encoded values.
+        """
+        codec = Codec(salt, mode=self.encode_mode)
+        encoded = codec.encode_many([values[key] for key in encoded_keys])
+        return {**values, **{key: value.decode() for key, value in zip(encoded_keys, encoded)}}
+
+    def reencode_secrets(self, keys: list[str], mode: str = "aes-gcm") -> list[str]:
+        """Re-encode existing encoded secrets using given mode.
+
+        Values that can't be decoded (i.e. not encoded at all) or already encoded
+        using the given mode are skipped. All re-encoded values are pushed at once.
+
+        .. warning::
+            Values consumed by Java-based Gluu Server components (i.e. ``encoded_ox_ldap_pw``)
+            must stay in ``3des`` mode, hence keys must be selected explicitly.
+            As decoding auto-detects the mode, migration can be reverted by calling
+            this method with ``mode="3des"``.
+
+        :param keys: Key names to re-encode (only read by Python-based components).
+        :param mode: Target mode, either ``3des`` or ``aes-gcm``.
+        :returns: List of re-encoded key names.
+        """
+        data = self.get_all()
+        salt = data.get("encoded_salt") or ""
+        codec = Codec(salt, mode=mode)
+
+        values = {}
+        for key in keys:
+            value = data.get(key)
+            if not value or value.startswith(AES_GCM_PREFIX.decode()) == (mode == "aes-gcm"):
+                continue
+
+            try:
+                decoded = codec.decode(value)
+            except ValueError:
+                logger.warning(f"Unable to decode secret {key}; skipping re-encoding")
+                continue
+            values[key] = codec.encode(decoded).decode()
+
+        if values and not self.set_all(values):
+            raise RuntimeError(f"Unable to save re-encoded secrets {sorted(values)}")
+        return sorted(values)
 
 
 #: Object as a placeholder of config and secret manager.
@@ -258,13 +806,459 @@ class SecretManager:
 _Manager = namedtuple("_Manager", ["config", "secret"])
 
 
+def _settings_key() -> tuple:
+    """Get a hashable snapshot of ``GLUU_*`` environment variables used to memoize managers."""
+    return tuple(sorted((k, v) for k, v in os.environ.items() if k.startswith("GLUU_")))
+
+
 def get_manager() -> NamedTuple:
     """
-    Create an instance of :class:`~pygluu.containerlib.manager._Manager` object.
+    Get an instance of :class:`~pygluu.containerlib.manager._Manager` object.
+
+    The instance is memoized per process (and per ``GLUU_*`` environment variables),
+    so subsequent calls reuse the same adapters and their clients. Call
+    :meth:`pygluu.containerlib.registry.clients.close() <pygluu.containerlib.registry.ClientRegistry.close>`
+    to discard memoized instances.
 
     :returns: A ``namedtuple`` consists of :class:`~pygluu.containerlib.manager.ConfigManager`
               and :class:`~pygluu.containerlib.manager.SecretManager` instances.
     """
-    config_mgr = ConfigManager()
-    secret_mgr = SecretManager()
-    return _Manager(config=config_mgr, secret=secret_mgr)
+    def create():
+        return _Manager(config=ConfigManager(), secret=SecretManager())
+    return clients.get(("manager",) + _settings_key(), create)
+
+
+#: Executor shared by async managers (created on first use).
+_async_executor: Optional[ThreadPoolExecutor] = None
+
+_async_executor_lock = threading.Lock()
+
+
+def _get_async_executor() -> ThreadPoolExecutor:
+    """Get executor shared by async managers to run blocking adapter calls.
+
+    The max. number of workers is controlled by ``GLUU_ASYNC_MANAGER_WORKERS``
+    environment variable (default to ``10``).
+
+    :returns: Instance of ``ThreadPoolExecutor``.
+    """
+    global _async_executor
+
+    with _async_executor_lock:
+        if _async_executor is None:
+            workers = int(_get_cache_setting("GLUU_ASYNC_MANAGER_WORKERS", 10)) or 10
+            _async_executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="gluu-manager",
+            )
+    return _async_executor
+
+
+def _reset_async_executor() -> None:
+    """Discard executor inherited from parent process (its threads don't exist after ``os.fork``)."""
+    global _async_executor, _async_executor_lock
+
+    _async_executor = None
+    _async_executor_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_async_executor)
+
+
+class AsyncBaseManager:
+    """Base class for asyncio-friendly manager.
+
+    Adapters that have a native asyncio counterpart (listed in :attr:`async_adapters`)
+    are called directly on the running event loop. Other adapters are blocking, hence each
+    call is offloaded to a bounded executor shared by all async managers. Either way,
+    independent calls awaited concurrently (i.e. via ``asyncio.gather``) don't block
+    the event loop nor each other. Cache (and snapshot) is shared with the wrapped manager.
+
+    If the native adapter can't be created (i.e. ``aiohttp`` is not installed, see
+    the ``async`` extra), calls fallback to the executor.
+
+    .. code-block:: python
+
+        manager = AsyncConfigManager()
+        hostname, orgname = await asyncio.gather(
+            manager.get("hostname"),
+            manager.get("orgName"),
+        )
+    """
+
+    #: Synchronous manager class wrapped by this class.
+    manager_class: Callable[[], BaseManager] = BaseManager
+
+    #: Mapping of synchronous adapter class name and import path of its native asyncio counterpart.
+    async_adapters: dict[str, str] = {}
+
+    def __init__(self, manager: Optional[BaseManager] = None, executor: Optional[ThreadPoolExecutor] = None):
+        self.manager = manager or self.manager_class()
+        self.executor = executor or _get_async_executor()
+
+        # native adapter is created on first use for the current adapter of the wrapped manager
+        self._native_adapter: Any = None
+        self._native_source: Any = _UNSET
+
+        # serializes loading snapshot into cache when accessed by multiple tasks of the same event loop
+        self._load_lock: Any = None
+        self._load_lock_loop: Any = None
+
+    @property
+    def adapter(self) -> Any:
+        """Get adapter used by the wrapped manager."""
+        return self.manager.adapter
+
+    @property
+    def native_adapter(self) -> Any:
+        """Get native asyncio adapter wrapping the adapter of the wrapped manager.
+
+        :returns: Instance of native adapter or ``None`` if calls are offloaded to the executor.
+        """
+        adapter = self.manager.adapter
+        if self._native_source is not adapter:
+            self._native_adapter = self._create_native_adapter(adapter)
+            self._native_source = adapter
+        return self._native_adapter
+
+    def _create_native_adapter(self, adapter: Any) -> Any:
+        """Create native asyncio adapter (if any) for given adapter.
+
+        :param adapter: Synchronous adapter.
+        :returns: Instance of native adapter or ``None``.
+        """
+        path = self.async_adapters.get(type(adapter).__name__)
+        if not path:
+            return None
+
+        module_name, _, class_name = path.rpartition(".")
+        try:
+            adapter_class = getattr(importlib.import_module(module_name), class_name)
+            return adapter_class(adapter)
+        except (ImportError, AttributeError) as exc:
+            logger.warning(
+                f"Unable to use native asyncio adapter {class_name}; "
+                f"calls are offloaded to executor; reason={exc}"
+            )
+            return None
+
+    async def _run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run blocking function in executor.
+
+        :param func: Blocking function.
+        :returns: Result of the function.
+        """
+        # imported on demand as ``asyncio`` is not needed by synchronous managers
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    async def _get(self, key: str, default: Any) -> Any:
+        """Get value based on given key (from cache if possible).
+
+        :param key: Key name.
+        :param default: Default value if key is not exist.
+        :returns: Value based on given key or default one.
+        """
+        adapter = self.native_adapter
+        if adapter is None:
+            return await self._run(self.manager._get, key, default)
+
+        cache = self.manager.cache
+        if not cache.enabled:
+            return await adapter.get(key, default)
+
+        if not cache.fresh:
+            await self._refresh_cache()
+
+        cached, value = cache.get(key)
+        if cached:
+            return value
+
+        # key is missing from a complete snapshot, hence it doesn't exist
+        if cache.complete:
+            return default
+
+        # some entries have been evicted, fallback to fetching a single key
+        value = await adapter.get(key, default)
+        if value != default:
+            cache.update({key: value})
+        return value
+
+    def _get_load_lock(self) -> Any:
+        """Get ``asyncio.Lock`` bound to the running event loop."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        if self._load_lock_loop is not loop:
+            self._load_lock = asyncio.Lock()
+            self._load_lock_loop = loop
+        return self._load_lock
+
+    async def _refresh_cache(self) -> dict[str, Any]:
+        """Load all key-value pairs into cache using native adapter unless other task has done it.
+
+        :returns: A mapping of all key-value pairs.
+        """
+        async with self._get_load_lock():
+            # other task may have loaded the snapshot while waiting for the lock
+            if self.manager.cache.complete:
+                return self.manager.cache.get_all()
+
+            if not self.manager._booted:
+                self.manager._booted = True
+                data = await self._run(self.manager._boot_from_snapshot)
+                if data is not None:
+                    return data
+            return await self._load_cache()
+
+    async def _load_cache(self) -> dict[str, Any]:
+        """Load all key-value pairs from native adapter into cache.
+
+        See :meth:`~pygluu.containerlib.manager.BaseManager._load_cache` for details.
+
+        :returns: A mapping of all key-value pairs.
+        """
+        try:
+            data = await self.native_adapter.get_all()
+        except Exception as exc:  # noqa: B902
+            data = await self._run(self.manager._snapshot_fallback, exc)
+            if data is None:
+                raise
+        else:
+            if self.manager.snapshot:
+                await self._run(self.manager._save_snapshot, data)
+
+        self.manager.cache.load(data)
+        return dict(data)
+
+    async def get(self, key: str, default: Any = "") -> Any:
+        """Get value based on given key.
+
+        :param key: Key name.
+        :param default: Default value if key is not exist.
+        :returns: Value based on given key or default one.
+        """
+        return await self._get(key, default)
+
+    async def set(self, key: str, value: Any) -> bool:
+        """Set key with given value.
+
+        :param key: Key name.
+        :param value: Value of the key.
+        :returns: A ``bool`` to mark whether config is set or not.
+        """
+        adapter = self.native_adapter
+        if adapter is None:
+            return await self._run(self.manager.set, key, value)
+
+        result = await adapter.set(key, value)
+        self.manager._cache_written({key: value}, result)
+        return result
+
+    async def all(self) -> dict[str, Any]:
+        """Get all key-value pairs.
+
+        This method is deprecated in favor of ``get_all`` method.
+
+        :returns: A ``dict`` of key-value pairs (if any).
+        """
+        return await self.get_all()
+
+    async def get_all(self) -> dict[str, Any]:
+        """Get all key-value pairs.
+
+        :returns: A mapping of key-value pairs (if any).
+        """
+        adapter = self.native_adapter
+        if adapter is None:
+            return await self._run(self.manager.get_all)
+
+        if not self.manager.cache.enabled:
+            return await adapter.get_all()
+
+        if self.manager.cache.complete:
+            return self.manager.cache.get_all()
+        return await self._refresh_cache()
+
+    async def set_all(self, data: dict[str, Any]) -> bool:
+        """Set all key-value pairs.
+
+        :param data: Key-value pairs.
+        :returns: A boolean to mark whether key-value pairs are set or not.
+        """
+        adapter = self.native_adapter
+        if adapter is None:
+            return await self._run(self.manager.set_all, data)
+
+        result = await adapter.set_all(data)
+        self.manager._cache_written(data, result)
+        return result
+
+    def invalidate(self, keys: Optional[list[str]] = None) -> None:
+        """Invalidate cached entries, forcing subsequent reads to hit the adapter.
+
+        :param keys: Key names to invalidate; if omitted, all entries are invalidated.
+        """
+        self.manager.invalidate(keys)
+
+    async def wait_for_key(self, key: str, timeout: float, default: Any = "") -> Any:
+        """Wait until given key has non-empty value.
+
+        Note that when calls are offloaded to the executor, the wait occupies
+        a worker of the executor until it returns.
+
+        :param key: Key name.
+        :param timeout: Max. time to wait (in seconds).
+        :param default: Default value if key is not set.
+        :returns: Value of the key or default one.
+        """
+        adapter = self.native_adapter
+        if adapter is None:
+            return await self._run(self.manager.wait_for_key, key, timeout, default)
+
+        cached, value = self.manager.cache.get(key)
+        if cached and value:
+            return value
+
+        value = await adapter.wait_for_key(key, timeout, default)
+        if value != default:
+            self.manager.cache.update({key: value})
+        return value
+
+    async def close(self) -> None:
+        """Close connections opened by native adapter (if any) on the running event loop."""
+        if self._native_adapter is not None:
+            await self._native_adapter.close()
+
+
+class AsyncConfigManager(AsyncBaseManager):
+    """Asyncio-friendly counterpart of :class:`~pygluu.containerlib.manager.ConfigManager`.
+
+    Native asyncio adapter class:
+
+    - :class:`~pygluu.containerlib.config.consul_config.AsyncConsulConfig`
+    - :class:`~pygluu.containerlib.config.google_config.AsyncGoogleConfig`
+    """
+
+    manager_class = ConfigManager
+
+    async_adapters = {
+        "ConsulConfig": "pygluu.containerlib.config.consul_config.AsyncConsulConfig",
+        "GoogleConfig": "pygluu.containerlib.config.google_config.AsyncGoogleConfig",
+    }
+
+
+class AsyncSecretManager(AsyncBaseManager):
+    """Asyncio-friendly counterpart of :class:`~pygluu.containerlib.manager.SecretManager`.
+
+    Native asyncio adapter class:
+
+    - :class:`~pygluu.containerlib.secret.google_secret.AsyncGoogleSecret`
+    """
+
+    manager_class = SecretManager
+
+    async_adapters = {
+        "GoogleSecret": "pygluu.containerlib.secret.google_secret.AsyncGoogleSecret",
+    }
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        """Get value based on given key.
+
+        :param key: Key name.
+        :param default: Default value if key is not exist.
+        :returns: Value based on given key or default one.
+        """
+        return await self._get(key, default)
+
+    async def to_file(
+        self, key: str, dest: str, decode: bool = False, binary_mode: bool = False, mode: int = 0o600,
+    ) -> None:
+        """Pull secret and write to a file.
+
+        See :meth:`~pygluu.containerlib.manager.SecretManager.to_file` for details.
+        """
+        if self.native_adapter is None:
+            await self._run(
+                self.manager.to_file, key, dest, decode=decode, binary_mode=binary_mode, mode=mode,
+            )
+            return
+
+        await self.to_files({
+            key: {"dest": dest, "decode": decode, "binary_mode": binary_mode, "mode": mode},
+        })
+
+    async def from_file(
+        self, key: str, src: str, encode: bool = False, binary_mode: bool = False
+    ) -> None:
+        """Put secret from a file.
+
+        See :meth:`~pygluu.containerlib.manager.SecretManager.from_file` for details.
+        """
+        if self.native_adapter is None:
+            await self._run(self.manager.from_file, key, src, encode=encode, binary_mode=binary_mode)
+            return
+
+        await self.from_files({key: {"src": src, "encode": encode, "binary_mode": binary_mode}})
+
+    async def to_files(self, mapping: dict[str, Union[str, dict[str, Any]]]) -> None:
+        """Pull multiple secrets and write them to files.
+
+        See :meth:`~pygluu.containerlib.manager.SecretManager.to_files` for details.
+        """
+        if self.native_adapter is None:
+            await self._run(self.manager.to_files, mapping)
+            return
+
+        specs = self.manager._file_specs(mapping)
+        if not specs:
+            return
+
+        data = await self.get_all()
+        await self._run(self.manager._write_files, specs, data)
+
+    async def from_files(self, mapping: dict[str, Union[str, dict[str, Any]]]) -> bool:
+        """Put multiple secrets from files.
+
+        See :meth:`~pygluu.containerlib.manager.SecretManager.from_files` for details.
+        """
+        if self.native_adapter is None:
+            return await self._run(self.manager.from_files, mapping)
+
+        values, encoded_keys = await self._run(self.manager._read_files, mapping)
+        if not values:
+            return True
+
+        if encoded_keys:
+            salt = await self.get("encoded_salt", "")
+            values = await self._run(self.manager._encode_values, values, encoded_keys, salt)
+        return await self.set_all(values)
+
+
+#: Object as a placeholder of async config and secret manager.
+#: This object is not intended for direct use, use ``get_async_manager``
+#: function instead.
+_AsyncManager = namedtuple("_AsyncManager", ["config", "secret"])
+
+
+def get_async_manager() -> NamedTuple:
+    """
+    Get an instance of :class:`~pygluu.containerlib.manager._AsyncManager` object.
+
+    The async managers wrap managers returned by :func:`get_manager`, hence they share
+    the same adapters, clients, and cache. Consul and Google adapters are called via their
+    native asyncio counterparts (see :attr:`AsyncBaseManager.async_adapters`); calls to other
+    adapters are offloaded to the executor.
+
+    :returns: A ``namedtuple`` consists of :class:`~pygluu.containerlib.manager.AsyncConfigManager`
+              and :class:`~pygluu.containerlib.manager.AsyncSecretManager` instances.
+    """
+    def create():
+        manager = get_manager()
+        return _AsyncManager(
+            config=AsyncConfigManager(manager.config),
+            secret=AsyncSecretManager(manager.secret),
+        )
+    return clients.get(("async_manager",) + _settings_key(), create)
@@ -1,3 +1,32 @@
 # noqa: D104
-from pygluu.containerlib.meta.docker_meta import DockerMeta  # noqa: F401
-from pygluu.containerlib.meta.kubernetes_meta import KubernetesMeta  # noqa: F401
+# Meta classes are imported lazily (on first attribute access), so importing
+# this package won't pull in SDKs of orchestrators that are not in use.
+import importlib
+import typing as _t
+
+_ADAPTERS = {
+    "DockerMeta": "pygluu.containerlib.meta.docker_meta",
+    "KubernetesMeta": "pygluu.containerlib.meta.kubernetes_meta",
+}
+
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from pygluu.containerlib.meta.docker_meta import DockerMeta  # noqa: F401
+    from pygluu.containerlib.meta.kubernetes_meta import KubernetesMeta  # noqa: F401
+
+__all__ = list(_ADAPTERS)
+
+
+def __getattr__(name: str) -> _t.Any:
+    try:
+        module_name = _ADAPTERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    attr = getattr(importlib.import_module(module_name), name)
+    # cache the attribute so subsequent access won't go through this function
+    globals()[name] = attr
+    return attr
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_ADAPTERS))
@@ -7,6 +7,7 @@ import tarfile
 import docker
 
 from pygluu.containerlib.meta.base_meta import BaseMeta
+from pygluu.containerlib.registry import clients
 
 
 class DockerMeta(BaseMeta):
@@ -16,7 +17,7 @@ class DockerMeta(BaseMeta):
     """
 
     def __init__(self, base_url="unix://var/run/docker.sock"):
-        self.client = docker.DockerClient(base_url=base_url)
+        self.client = clients.get(("docker", base_url), lambda: docker.DockerClient(base_url=base_url))
 
     def get_containers(self, label: str) -> list:
         """Get list of containers based on label.
@@ -7,10 +7,10 @@ import tarfile
 from tempfile import TemporaryFile
 
 import kubernetes.client
-import kubernetes.config
 from kubernetes.stream import stream
 
 from pygluu.containerlib.meta.base_meta import BaseMeta
+from pygluu.containerlib.registry import get_kubernetes_api_client
 
 logger = logging.getLogger(__name__)
 
@@ -26,13 +26,10 @@ class KubernetesMeta(BaseMeta):
     def client(self):
         """Get kubernetes client instance."""
         if not self._client:
-            # config loading priority
-            try:
-                kubernetes.config.load_incluster_config()
-            except kubernetes.config.config_exception.ConfigException:
-                kubernetes.config.load_kube_config(self.kubeconfig_file)
-            self._client = kubernetes.client.CoreV1Api()
-            self._client.api_client.configuration.assert_hostname = False
+            # in-cluster config takes precedence over kube config file
+            # hostname is not verified, hence the client is not shared with config/secret adapters
+            api_client = get_kubernetes_api_client(self.kubeconfig_file, assert_hostname=False)
+            self._client = kubernetes.client.CoreV1Api(api_client)
         return self._client
 
     def get_containers(self, label: str) -> list:
@@ -0,0 +1,369 @@
+"""This module contains instrumentation of calls made to config/secret/persistence backends."""
+
+from __future__ import annotations
+
+import bisect
+import contextvars
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    TypeVar,
+)
+
+logger = logging.getLogger(__name__)
+
+#: Default upper bounds (in seconds) of latency histogram buckets.
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+#: A single instrumented call passed to sinks.
+Observation = namedtuple(
+    "Observation",
+    ["operation", "duration", "error", "bytes_sent", "bytes_received"],
+)
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# bytes counter ([sent, received]) of the instrumented call running in current context
+_current_bytes: contextvars.ContextVar[Optional[list[int]]] = contextvars.ContextVar(
+    "gluu_metrics_bytes", default=None,
+)
+
+# guards bytes counter shared by worker threads of a single instrumented call
+_bytes_lock = threading.Lock()
+
+
+class _Histogram:
+    """Cumulative latency histogram of a single operation."""
+
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        # the last slot counts observations above the largest bucket
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """Registry of counters, byte counts, and latency histograms of backend calls.
+
+    Each metric is labeled by operation name, i.e. ``ConsulConfig.get`` or
+    ``SQLClient.get``. When the registry is disabled, instrumented calls bypass
+    the registry entirely.
+
+    :param enabled: Whether to collect metrics.
+    :param buckets: Upper bounds (in seconds) of latency histogram buckets.
+    """
+
+    def __init__(self, enabled: bool = False, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.enabled = enabled
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._sinks: list[Callable[[Observation], None]] = []
+        self.reset()
+
+    def reset(self) -> None:
+        """Remove all collected metrics."""
+        with self._lock:
+            self._calls: dict[tuple[str, str], int] = {}
+            self._bytes: dict[tuple[str, str], int] = {}
+            self._histograms: dict[str, _Histogram] = {}
+
+    def add_sink(self, sink: Callable[[Observation], None]) -> None:
+        """Register a callback called with :class:`Observation` of each instrumented call.
+
+        Sinks are called synchronously in the thread that made the call,
+        hence they should return quickly.
+
+        :param sink: Callback that accepts an instance of :class:`Observation`.
+        """
+        with self._lock:
+            self._sinks = self._sinks + [sink]
+
+    def remove_sink(self, sink: Callable[[Observation], None]) -> None:
+        """Unregister a callback previously added by :meth:`add_sink`.
+
+        :param sink: Registered callback.
+        """
+        with self._lock:
+            self._sinks = [s for s in self._sinks if s != sink]
+
+    def observe(
+        self,
+        operation: str,
+        duration: float,
+        error: bool = False,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        """Record a single call.
+
+        :param operation: Name of the operation, i.e. ``ConsulConfig.get``.
+        :param duration: Duration of the call (in seconds).
+        :param error: Whether the call raised an exception.
+        :param bytes_sent: Number of bytes sent to backend.
+        :param bytes_received: Number of bytes received from backend.
+        """
+        status = "error" if error else "ok"
+
+        with self._lock:
+            self._calls[(operation, status)] = self._calls.get((operation, status), 0) + 1
+
+            if bytes_sent:
+                key = (operation, "sent")
+                self._bytes[key] = self._bytes.get(key, 0) + bytes_sent
+            if bytes_received:
+                key = (operation, "received")
+                self._bytes[key] = self._bytes.get(key, 0) + bytes_received
+
+            histogram = self._histograms.get(operation)
+            if histogram is None:
+                histogram = self._histograms[operation] = _Histogram(self.buckets)
+            histogram.observe(duration)
+            sinks = self._sinks
+
+        if not sinks:
+            return
+
+        observation = Observation(operation, duration, error, bytes_sent, bytes_received)
+        for sink in sinks:
+            try:
+                sink(observation)
+            except Exception as exc:  # noqa: B902
+                logger.warning(f"Unable to send metrics to sink {sink!r}; reason={exc}")
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Get collected metrics grouped by operation.
+
+        :returns: A mapping of operation name and its metrics (``calls``, ``errors``,
+                  ``bytes_sent``, ``bytes_received``, ``duration_sum``, and ``duration_count``).
+        """
+        with self._lock:
+            result: dict[str, dict[str, Any]] = {}
+            for operation, histogram in self._histograms.items():
+                result[operation] = {
+                    "calls": self._calls.get((operation, "ok"), 0) + self._calls.get((operation, "error"), 0),
+                    "errors": self._calls.get((operation, "error"), 0),
+                    "bytes_sent": self._bytes.get((operation, "sent"), 0),
+                    "bytes_received": self._bytes.get((operation, "received"), 0),
+                    "duration_sum": histogram.total,
+                    "duration_count": histogram.count,
+                }
+            return result
+
+    def render_prometheus(self, namespace: str = "gluu") -> str:
+        """Render collected metrics in Prometheus text exposition format.
+
+        :param namespace: Prefix of metric names.
+        :returns: Metrics as text.
+        """
+        lines = []
+
+        with self._lock:
+            lines.append(f"# HELP {namespace}_backend_calls_total Number of calls made to backends.")
+            lines.append(f"# TYPE {namespace}_backend_calls_total counter")
+            for (operation, status), value in sorted(self._calls.items()):
+                lines.append(
+                    f'{namespace}_backend_calls_total{{operation="{operation}",status="{status}"}} {value}'
+                )
+
+            lines.append(f"# HELP {namespace}_backend_bytes_total Number of bytes transferred to/from backends.")
+            lines.append(f"# TYPE {namespace}_backend_bytes_total counter")
+            for (operation, direction), value in sorted(self._bytes.items()):
+                lines.append(
+                    f'{namespace}_backend_bytes_total{{operation="{operation}",direction="{direction}"}} {value}'
+                )
+
+            name = f"{namespace}_backend_call_duration_seconds"
+            lines.append(f"# HELP {name} Latency of calls made to backends.")
+            lines.append(f"# TYPE {name} histogram")
+            for operation, histogram in sorted(self._histograms.items()):
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{operation="{operation}",le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{operation="{operation}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{name}_sum{{operation="{operation}"}} {histogram.total}')
+                lines.append(f'{name}_count{{operation="{operation}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+
+def _enabled_from_env() -> bool:
+    return os.environ.get("GLUU_METRICS_ENABLED", "false").lower() in ("t", "true", "1")
+
+
+#: Default registry, enabled by ``GLUU_METRICS_ENABLED`` environment variable.
+registry = MetricsRegistry(enabled=_enabled_from_env())
+
+
+def _operation_name(func: Callable[..., Any], args: tuple[Any, ...]) -> str:
+    """Get operation name of a call, i.e. ``ConsulConfig.get``.
+
+    The class name is taken from the instance (if any), so methods
+    inherited by subclasses are labeled by the subclass name.
+    """
+    if args and "." in func.__qualname__:
+        return f"{type(args[0]).__name__}.{func.__name__}"
+    return func.__qualname__
+
+
+def instrument(func: _F) -> _F:
+    """Decorate a function or method to record its calls in the default registry.
+
+    .. code-block:: python
+
+        from pygluu.containerlib.metrics import instrument
+
+        class ConsulConfig(BaseConfig):
+            @instrument
+            def get(self, key, default=""):
+                ...
+
+    Instrumented calls made by another instrumented call (i.e. ``get`` calling ``get_all``,
+    or helpers called by an operation) are folded into the outermost call: their bytes are
+    added to it and they are not recorded as separate calls.
+
+    Coroutine functions are instrumented as well; the call is measured until the coroutine
+    completes, including tasks it spawns (i.e. via ``asyncio.gather``) as they inherit the context.
+
+    :param func: Function or method to instrument.
+    """
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if not registry.enabled or _current_bytes.get() is not None:
+                return await func(*args, **kwargs)
+
+            counter = [0, 0]
+            token = _current_bytes.set(counter)
+            error = False
+            start = time.perf_counter()
+
+            try:
+                return await func(*args, **kwargs)
+            except BaseException:
+                error = True
+                raise
+            finally:
+                duration = time.perf_counter() - start
+                _current_bytes.reset(token)
+                registry.observe(_operation_name(func, args), duration, error, counter[0], counter[1])
+        return async_wrapper  # type: ignore
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # nested call reports bytes to the outermost call (if any)
+        if not registry.enabled or _current_bytes.get() is not None:
+            return func(*args, **kwargs)
+
+        counter = [0, 0]
+        token = _current_bytes.set(counter)
+        error = False
+        start = time.perf_counter()
+
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            error = True
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            _current_bytes.reset(token)
+            registry.observe(_operation_name(func, args), duration, error, counter[0], counter[1])
+    return wrapper  # type: ignore
+
+
+def record_bytes(sent: int = 0, received: int = 0) -> None:
+    """Add number of bytes transferred by the instrumented call running in current context.
+
+    The call is a no-op when the default registry is disabled or when it's not made
+    (directly or indirectly) by an instrumented function in the same thread
+    (or in a worker thread running a function wrapped by :func:`in_current_context`).
+
+    :param sent: Number of bytes sent to backend.
+    :param received: Number of bytes received from backend.
+    """
+    counter = _current_bytes.get()
+    if counter is not None:
+        with _bytes_lock:
+            counter[0] += sent
+            counter[1] += received
+
+
+def in_current_context(func: _F) -> _F:
+    """Wrap a function to run in a copy of the current context.
+
+    Worker threads (i.e. of ``ThreadPoolExecutor``) don't inherit context variables,
+    hence bytes recorded by functions submitted to them are not counted
+    by the instrumented call that submits them, unless the functions are wrapped.
+
+    .. code-block:: python
+
+        with ThreadPoolExecutor() as executor:
+            values = list(executor.map(in_current_context(self._read), keys))
+
+    :param func: Function to wrap.
+    """
+    context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # a context can't be entered by multiple threads at once, hence each call runs in its own copy
+        return context.copy().run(func, *args, **kwargs)
+    return wrapper  # type: ignore
+
+
+def _body_size(body: Any, headers: Any) -> int:
+    """Get size of HTTP body (in bytes) without reading streamed body.
+
+    :param body: Body as ``bytes``, ``str``, or file-like/iterable object (streamed body).
+    :param headers: Headers of the request or response.
+    :returns: Number of bytes.
+    """
+    if isinstance(body, str):
+        return len(body.encode())
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+
+    length = (headers or {}).get("Content-Length", "")
+    return int(length) if length.isdigit() else 0
+
+
+def record_response_bytes(resp: Any, *args: Any, **kwargs: Any) -> None:
+    """Record size of request and response bodies; meant to be registered as ``requests`` response hook.
+
+    The size is taken from ``Content-Length`` header (if any), so streamed response body
+    is not read just to be measured.
+
+    .. code-block:: python
+
+        session = requests.Session()
+        session.hooks["response"].append(record_response_bytes)
+
+    :param resp: An instance of ``requests.models.Response``.
+    :param kwargs: Keyword arguments of the request (i.e. ``stream``) passed by ``requests``.
+    """
+    if _current_bytes.get() is None:
+        return
+
+    sent = _body_size(resp.request.body, resp.request.headers)
+
+    body = None
+    if "Content-Length" not in resp.headers and not kwargs.get("stream", False):
+        # body of non-streamed response is read by ``requests`` right after the hooks anyway
+        body = resp.content
+    record_bytes(sent=sent, received=_body_size(body, resp.headers))
@@ -1,17 +1,48 @@
 # noqa: D104
+import importlib
 import os
+import typing as _t
 
-from pygluu.containerlib.persistence.couchbase import (  # noqa: F401
-    render_couchbase_properties,
-    sync_couchbase_truststore,
-)
-from pygluu.containerlib.persistence.hybrid import render_hybrid_properties  # noqa: F401
-from pygluu.containerlib.persistence.ldap import (  # noqa: F401
-    render_ldap_properties,
-    sync_ldap_truststore,
-)
-from pygluu.containerlib.persistence.sql import render_sql_properties  # noqa: F401
-from pygluu.containerlib.persistence.spanner import render_spanner_properties  # noqa: F401
+# Helpers are imported lazily (on first attribute access), so importing
+# this package won't pull in drivers of persistence backends that are not in use.
+_HELPERS = {
+    "render_couchbase_properties": "pygluu.containerlib.persistence.couchbase",
+    "sync_couchbase_truststore": "pygluu.containerlib.persistence.couchbase",
+    "render_hybrid_properties": "pygluu.containerlib.persistence.hybrid",
+    "render_ldap_properties": "pygluu.containerlib.persistence.ldap",
+    "sync_ldap_truststore": "pygluu.containerlib.persistence.ldap",
+    "render_sql_properties": "pygluu.containerlib.persistence.sql",
+    "render_spanner_properties": "pygluu.containerlib.persistence.spanner",
+}
+
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from pygluu.containerlib.persistence.couchbase import (  # noqa: F401
+        render_couchbase_properties,
+        sync_couchbase_truststore,
+    )
+    from pygluu.containerlib.persistence.hybrid import render_hybrid_properties  # noqa: F401
+    from pygluu.containerlib.persistence.ldap import (  # noqa: F401
+        render_ldap_properties,
+        sync_ldap_truststore,
+    )
+    from pygluu.containerlib.persistence.sql import render_sql_properties  # noqa: F401
+    from pygluu.containerlib.persistence.spanner import render_spanner_properties  # noqa: F401
+
+
+def __getattr__(name: str) -> _t.Any:
+    try:
+        module_name = _HELPERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    attr = getattr(importlib.import_module(module_name), name)
+    # cache the attribute so subsequent access won't go through this function
+    globals()[name] = attr
+    return attr
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_HELPERS))
 
 
 def render_salt(manager, src: str, dest: str) -> None:
@@ -9,6 +9,8 @@ from typing import NoReturn
 import requests
 from requests_toolbelt.adapters.host_header_ssl import HostHeaderSSLAdapter
 
+from pygluu.containerlib.metrics import instrument
+from pygluu.containerlib.metrics import record_response_bytes
 from pygluu.containerlib.utils import (
     encode_text,
     cert_to_truststore,
@@ -310,6 +312,7 @@ class BaseClient:
         if not self._session:
             self._session = requests.Session()
             self._session.verify = False
+            self._session.hooks["response"].append(record_response_bytes)
 
             verify = as_boolean(os.environ.get("GLUU_COUCHBASE_VERIFY", False))
             if verify:
@@ -483,26 +486,31 @@ class CouchbaseClient:
     def rest_client(self):
         """Get instance of :class:`~pygluu.containerlib.persistence.couchbase.RestClient`."""
         if not self._rest_client:
-            self._rest_client = RestClient(
+            client = RestClient(
                 self.hosts, self.user, self.password,
             )
-            self._rest_client.resolve_host()
-            if not self._rest_client.host:
+            client.resolve_host()
+            if not client.host:
                 raise ValueError(f"Unable to resolve host for data service from {self.hosts} list")
+            # only keep client with resolved host, so next access will retry the resolution
+            self._rest_client = client
         return self._rest_client
 
     @property
     def n1ql_client(self):
         """Get instance of :class:`~pygluu.containerlib.persistence.couchbase.N1qlClient`."""
         if not self._n1ql_client:
-            self._n1ql_client = N1qlClient(
+            client = N1qlClient(
                 self.hosts, self.user, self.password,
             )
-            self._n1ql_client.resolve_host()
-            if not self._n1ql_client.host:
+            client.resolve_host()
+            if not client.host:
                 raise ValueError(f"Unable to resolve host for query service from {self.hosts} list")
+            # only keep client with resolved host, so next access will retry the resolution
+            self._n1ql_client = client
         return self._n1ql_client
 
+    @instrument
     def get_buckets(self):
         """Get all buckets.
 
@@ -510,6 +518,7 @@ class CouchbaseClient:
         """
         return self.rest_client.exec_api("pools/default/buckets", method="GET",)
 
+    @instrument
     def add_bucket(self, name: str, memsize: int = 100, type_: str = "couchbase"):
         r"""Add new bucket.
 
@@ -529,6 +538,7 @@ class CouchbaseClient:
             method="POST",
         )
 
+    @instrument
     def get_system_info(self) -> dict:
         """Get system info of Couchbase server.
 
@@ -541,6 +551,7 @@ class CouchbaseClient:
             sys_info = resp.json()
         return sys_info
 
+    @instrument
     def exec_query(self, query: str, *args, **kwargs):
         """Execute N1QL query.
 
@@ -551,6 +562,7 @@ class CouchbaseClient:
         data = build_n1ql_request_body(query, *args, **kwargs)
         return self.n1ql_client.exec_api("query/service", data=data, timeout=timeout)
 
+    @instrument
     def create_user(self, username, password, fullname, roles):
         """Create user by making request to REST API."""
         data = {
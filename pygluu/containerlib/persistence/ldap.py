@@ -9,6 +9,7 @@ from ldap3 import SUBTREE
 from ldap3 import MODIFY_REPLACE
 from ldap3 import MODIFY_DELETE
 
+from pygluu.containerlib.metrics import instrument
 from pygluu.containerlib.utils import as_boolean
 from pygluu.containerlib.utils import decode_text
 
@@ -108,6 +109,7 @@ class LdapClient:
         """Check whether client is connected by getting a simple entry."""
         return bool(self.get("", attributes=["1.1"]))
 
+    @instrument
     def get(self, dn, filter_="(objectClass=*)", attributes=None):
         """Get a single entry.
 
@@ -120,6 +122,7 @@ class LdapClient:
             return None
         return entries[0]
 
+    @instrument
     def search(self, dn, filter_="(objectClass=*)", attributes=None, limit=0, scope=""):
         """Search for entries.
 
@@ -142,6 +145,7 @@ class LdapClient:
                 return []
             return conn.entries
 
+    @instrument
     def delete(self, dn) -> tuple:
         """Delete entry.
 
@@ -153,6 +157,7 @@ class LdapClient:
             message = conn.result["message"]
             return deleted, message
 
+    @instrument
     def add(self, dn, attributes) -> tuple:
         """Add new entry.
 
@@ -165,6 +170,7 @@ class LdapClient:
             message = conn.result["message"]
             return added, message
 
+    @instrument
     def modify(self, dn, changes) -> tuple:
         """Modify entry.
 
@@ -9,6 +9,8 @@ from google.api_core.exceptions import NotFound
 from google.api_core.exceptions import FailedPrecondition
 from google.cloud import spanner
 
+from pygluu.containerlib.metrics import instrument
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +46,7 @@ class SpannerClient:
                 cntr = row[0]
         return cntr > 0
 
+    @instrument
     def create_table(self, table_name: str, column_mapping: dict, pk_column: str):
         """Create table with its columns."""
         columns = []
@@ -85,6 +88,7 @@ class SpannerClient:
                 table_mapping[table.table_id] = dict(result)
         return table_mapping
 
+    @instrument
     def insert_into(self, table_name, column_mapping):
         """Insert a row into a table."""
         # TODO: handle ARRAY<STRING(MAX)> ?
@@ -98,6 +102,7 @@ class SpannerClient:
         with suppress(AlreadyExists):
             self.database.run_in_transaction(insert_rows)
 
+    @instrument
     def row_exists(self, table_name, id_):
         """Check whether a row is exist."""
         exists = False
@@ -116,6 +121,7 @@ class SpannerClient:
                     exists = True
         return exists
 
+    @instrument
     def create_index(self, query):
         """Create index using raw query."""
         try:
@@ -127,6 +133,7 @@ class SpannerClient:
             else:
                 raise
 
+    @instrument
     def create_subtable(self, table_name: str, sub_table_name: str, column_mapping: dict, pk_column: str, sub_pk_column: str):
         """Create sub table with its columns."""
         columns = []
@@ -153,6 +160,7 @@ class SpannerClient:
             else:
                 raise
 
+    @instrument
     def get(self, table_name, id_, column_names=None) -> dict:
         """Get a row from a table with matching ID."""
         if not column_names:
@@ -175,6 +183,7 @@ class SpannerClient:
                 entry = dict(zip(column_names, row))
         return entry
 
+    @instrument
     def update(self, table_name, id_, column_mapping) -> bool:
         """Update a table row with matching ID."""
         # TODO: handle ARRAY<STRING(MAX)> ?
@@ -193,6 +202,7 @@ class SpannerClient:
             modified = True
         return modified
 
+    @instrument
     def search(self, table_name, column_names=None) -> dict:
         """Get a row from a table with matching ID."""
         if not column_names:
@@ -9,11 +9,13 @@ from collections import defaultdict
 
 from sqlalchemy import create_engine
 from sqlalchemy import MetaData
-from sqlalchemy import func
+from sqlalchemy import Table
 from sqlalchemy import select
+from sqlalchemy.exc import NoSuchTableError
 from sqlalchemy.exc import SAWarning
 from ldap3.utils import dn as dnutils
 
+from pygluu.containerlib.metrics import instrument
 from pygluu.containerlib.utils import encode_text
 
 logger = logging.getLogger(__name__)
@@ -41,6 +43,8 @@ class SQLClient:
     def __init__(self):
         self._metadata = None
         self._engine = None
+        # tables reflected individually (without reflecting the whole schema)
+        self._tables = {}
 
         dialect = os.environ.get("GLUU_SQL_DB_DIALECT", "mysql")
         if dialect in ("pgsql", "postgresql"):
@@ -90,6 +94,31 @@ class SQLClient:
         """Dialect name."""
         return self.adapter.dialect
 
+    def get_table(self, table_name):
+        """Get table object.
+
+        If the whole schema hasn't been reflected (see :attr:`metadata`), only the given table
+        is reflected; the result is reused on subsequent calls.
+
+        :param table_name: Name of the table.
+        :returns: An instance of ``sqlalchemy.Table`` or ``None`` if table doesn't exist.
+        """
+        if self._metadata:
+            return self._metadata.tables.get(table_name)
+
+        if table_name not in self._tables:
+            with warnings.catch_warnings():
+                warnings.filterwarnings(
+                    "ignore",
+                    message="Skipped unsupported reflection of expression-based index",
+                    category=SAWarning,
+                )
+                try:
+                    self._tables[table_name] = Table(table_name, MetaData(), autoload_with=self.engine)
+                except NoSuchTableError:
+                    return None
+        return self._tables[table_name]
+
     def connected(self) -> bool:
         """Check whether connection is alive by executing simple query."""
         with self.engine.connect() as conn:
@@ -106,23 +135,24 @@ class SQLClient:
                 table_mapping[table_name][column.name] = str(column.type)
         return dict(table_mapping)
 
+    @instrument
     def row_exists(self, table_name, id_) -> bool:
         """Check whether a row is exist."""
-        table = self.metadata.tables.get(table_name)
+        table = self.get_table(table_name)
         if table is None:
             return False
 
-        query = select([func.count()]).select_from(table).where(
-            table.c.doc_id == id_
-        )
+        # lookup by primary key
+        query = select([table.c.doc_id]).where(table.c.doc_id == id_).limit(1)
         with self.engine.connect() as conn:
             result = conn.execute(query)
-            return result.fetchone()[0] > 0
+            return result.fetchone() is not None
 
     def quoted_id(self, identifier):
         """Get quoted identifier name."""
         return f"{self.adapter.quote_char}{identifier}{self.adapter.quote_char}"
 
+    @instrument
     def create_table(self, table_name: str, column_mapping: dict, pk_column: str):
         """Create table with its columns."""
         columns = []
@@ -145,6 +175,7 @@ class SQLClient:
             except Exception as exc:  # noqa: B902
                 self.adapter.on_create_table_error(exc)
 
+    @instrument
     def create_index(self, query):
         """Create index using raw query."""
         with self.engine.connect() as conn:
@@ -153,6 +184,7 @@ class SQLClient:
             except Exception as exc:  # noqa: B902
                 self.adapter.on_create_index_error(exc)
 
+    @instrument
     def insert_into(self, table_name, column_mapping):
         """Insert a row into a table."""
         table = self.metadata.tables.get(table_name)
@@ -180,6 +212,7 @@ class SQLClient:
             except Exception as exc:  # noqa: B902
                 self.adapter.on_insert_into_error(exc)
 
+    @instrument
     def get(self, table_name, id_, column_names=None) -> dict:
         """Get a row from a table with matching ID."""
         table = self.metadata.tables.get(table_name)
@@ -201,6 +234,7 @@ class SQLClient:
             return {}
         return dict(entry)
 
+    @instrument
     def update(self, table_name, id_, column_mapping) -> bool:
         """Update a table row with matching ID."""
         table = self.metadata.tables.get(table_name)
@@ -210,6 +244,7 @@ class SQLClient:
             result = conn.execute(query)
         return bool(result.rowcount)
 
+    @instrument
     def search(self, table_name, column_names=None) -> dict:
         """Get a row from a table with matching ID."""
         table = self.metadata.tables.get(table_name)
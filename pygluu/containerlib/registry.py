@@ -0,0 +1,259 @@
+"""This module contains process-wide registry of backend clients shared by adapters and managers."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Optional,
+    TypeVar,
+)
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+def credentials_digest(*values: Any) -> str:
+    """Get digest of credentials to be used in registry key (instead of plaintext values).
+
+    :param values: Credentials, i.e. username and password.
+    :returns: Hex digest of the values.
+    """
+    return hashlib.sha256("\0".join(str(value) for value in values).encode()).hexdigest()
+
+
+def _key_name(key: Hashable) -> str:
+    """Get name of registered object (without address nor credentials) to be logged.
+
+    :param key: Key of the object.
+    :returns: The first item of a tuple key, i.e. ``consul``, or the key itself.
+    """
+    if isinstance(key, tuple):
+        return str(key[0]) if key else ""
+    return str(key)
+
+
+def _close_client(client: Any) -> None:
+    """Close underlying connections of a client (if supported).
+
+    Clients of supported backends are closed via their own ``close`` method
+    (e.g. ``requests.Session``, boto3 client, ``kubernetes.client.ApiClient``)
+    or their transport (Google Secret Manager client).
+
+    :param client: Client instance.
+    """
+    for target in (client, getattr(client, "transport", None)):
+        close = getattr(target, "close", None)
+        if callable(close):
+            close()
+            return
+
+
+class ClientRegistry:
+    """Thread-safe registry of objects (clients, managers, etc.) memoized by key.
+
+    The key should include everything that makes the object unique, i.e. backend type,
+    address, and credentials, so adapters configured identically share a single client
+    (hence its connection pool, TLS sessions, and auth token). Credentials should be
+    passed through :func:`credentials_digest`, so the key doesn't hold their plaintext values.
+
+    .. code-block:: python
+
+        from pygluu.containerlib.registry import clients, credentials_digest
+
+        client = clients.get(
+            ("consul", host, port, credentials_digest(token)),
+            lambda: Consul(host=host, port=port, token=token),
+        )
+
+    Objects are never shared across processes; see :meth:`reset`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._objects: dict[Hashable, Any] = {}
+
+    def get(self, key: Hashable, factory: Callable[[], _T]) -> _T:
+        """Get object by key, or create (and register) it if missing.
+
+        :param key: Hashable key, i.e. a tuple of backend type, address, and credentials.
+        :param factory: Callable to create the object.
+        :returns: Registered object.
+        """
+        try:
+            return self._objects[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            # other thread may have created the object while waiting for the lock
+            if key not in self._objects:
+                self._objects[key] = factory()
+            return self._objects[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._objects
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def discard(self, key: Hashable) -> None:
+        """Close a registered client and remove it from the registry (if any).
+
+        Used to drop a client that may be broken, i.e. after a failed request,
+        so subsequent :meth:`get` call creates a new one.
+
+        :param key: Key of the object.
+        """
+        with self._lock:
+            obj = self._objects.pop(key, None)
+
+        if obj is None:
+            return
+
+        try:
+            _close_client(obj)
+        except Exception as exc:  # noqa: B902
+            logger.warning(f"Unable to close {_key_name(key)} client; reason={exc}")
+
+    def close(self) -> None:
+        """Close all registered clients and remove them from the registry.
+
+        Errors raised when closing a client are logged and ignored.
+        Subsequent :meth:`get` calls create new objects.
+        """
+        with self._lock:
+            objects, self._objects = self._objects, {}
+
+        for key, obj in objects.items():
+            try:
+                _close_client(obj)
+            except Exception as exc:  # noqa: B902
+                logger.warning(f"Unable to close {_key_name(key)} client; reason={exc}")
+
+    def reset(self) -> None:
+        """Remove all registered objects without closing them.
+
+        This method is called automatically in a child process after ``os.fork``,
+        as connections inherited from the parent process must not be reused
+        (nor closed) by the child.
+        """
+        # the lock may be held by a thread that doesn't exist in the child process
+        self._lock = threading.RLock()
+        self._objects = {}
+
+
+#: Default registry shared by adapters and :func:`~pygluu.containerlib.manager.get_manager`.
+clients = ClientRegistry()
+
+# ``os.register_at_fork`` is not available on Windows
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=clients.reset)
+
+
+def _incluster_available() -> bool:
+    """Check whether in-cluster config is available, i.e. running in a Kubernetes pod.
+
+    The check mirrors the requirements of ``kubernetes.config.load_incluster_config``.
+    """
+    return bool(
+        os.environ.get("KUBERNETES_SERVICE_HOST")
+        and os.environ.get("KUBERNETES_SERVICE_PORT")
+        and os.path.isfile("/var/run/secrets/kubernetes.io/serviceaccount/token")
+    )
+
+
+def get_kubernetes_api_client(
+    kubeconfig_file: str, use_kube_config: Optional[bool] = None, assert_hostname: bool = True,
+) -> Any:
+    """Get Kubernetes ``ApiClient`` shared by adapters with the same configuration.
+
+    The configuration is loaded into the client (instead of the global default configuration),
+    so kube config file is loaded only once per process. As the client is shared, its configuration
+    must not be modified by callers; clients that skip hostname verification are kept separately.
+
+    :param kubeconfig_file: Path to kube config file.
+    :param use_kube_config: Whether to load kube config file (``True``), in-cluster config (``False``),
+                            or in-cluster config if available and kube config file otherwise (``None``).
+    :param assert_hostname: Whether to verify hostname of the API server certificate.
+    :returns: Instance of ``kubernetes.client.ApiClient``.
+    """
+    if use_kube_config is None:
+        # resolve the config beforehand, so the client is shared with callers that choose it explicitly
+        use_kube_config = not _incluster_available()
+
+    def create():
+        import kubernetes.client
+        import kubernetes.config
+
+        configuration = kubernetes.client.Configuration()
+
+        if use_kube_config:
+            kubernetes.config.load_kube_config(kubeconfig_file, client_configuration=configuration)
+        else:
+            kubernetes.config.load_incluster_config(client_configuration=configuration)
+
+        if not assert_hostname:
+            configuration.assert_hostname = False
+        return kubernetes.client.ApiClient(configuration)
+
+    if use_kube_config:
+        key: tuple = ("kubernetes", "kubeconfig", kubeconfig_file)
+    else:
+        # kube config file is irrelevant to in-cluster config
+        key = ("kubernetes", "incluster")
+
+    if not assert_hostname:
+        key += ("no-assert-hostname",)
+    return clients.get(key, create)
+
+
+def aws_secrets_client() -> Any:
+    """Get AWS Secrets Manager client shared by adapters with the same endpoint and credentials.
+
+    The client is configured by ``GLUU_AWS_SECRETS_ENDPOINT_URL`` environment variable and
+    environment variables used by the AWS SDK (``AWS_PROFILE``, ``AWS_DEFAULT_REGION``, etc.).
+
+    :returns: Instance of boto3 ``SecretsManager`` client.
+    """
+    endpoint_url = os.environ.get("GLUU_AWS_SECRETS_ENDPOINT_URL") or None
+    key = ("aws", "secretsmanager", endpoint_url) + tuple(
+        os.environ.get(name, "")
+        for name in ("AWS_PROFILE", "AWS_DEFAULT_REGION", "AWS_REGION", "AWS_CONFIG_FILE", "AWS_SHARED_CREDENTIALS_FILE")
+    ) + (credentials_digest(os.environ.get("AWS_ACCESS_KEY_ID", "")),)
+
+    def create():
+        import boto3
+
+        return boto3.client("secretsmanager", endpoint_url=endpoint_url)
+    return clients.get(key, create)
+
+
+def aws_current_version_id(versions_to_stages: dict[str, list[str]]) -> str:
+    """Get ID of AWS secret version labeled as ``AWSCURRENT``.
+
+    :param versions_to_stages: Mapping of version ID and its staging labels.
+    :returns: Version ID (or empty string if not found).
+    """
+    for version_id, stages in versions_to_stages.items():
+        if "AWSCURRENT" in stages:
+            return version_id
+    return ""
+
+
+def google_secrets_client() -> Any:
+    """Get Google Secret Manager client shared by adapters with the same credentials.
+
+    :returns: Instance of ``SecretManagerServiceClient``.
+    """
+    def create():
+        from google.cloud import secretmanager
+
+        return secretmanager.SecretManagerServiceClient()
+    return clients.get(("google", "secretmanager", os.environ.get("GOOGLE_APPLICATION_CREDENTIALS", "")), create)
@@ -1,5 +1,40 @@
 # noqa: D104
-from pygluu.containerlib.secret.kubernetes_secret import KubernetesSecret  # noqa: F401
-from pygluu.containerlib.secret.vault_secret import VaultSecret  # noqa: F401
-from pygluu.containerlib.secret.aws_secret import AwsSecret  # noqa: F401
-from pygluu.containerlib.secret.google_secret import GoogleSecret  # noqa: F401
+# Adapters are imported lazily (on first attribute access), so importing
+# this package won't pull in SDKs of backends that are not in use.
+import importlib
+import typing as _t
+
+_ADAPTERS = {
+    "KubernetesSecret": "pygluu.containerlib.secret.kubernetes_secret",
+    "VaultSecret": "pygluu.containerlib.secret.vault_secret",
+    "AwsSecret": "pygluu.containerlib.secret.aws_secret",
+    "GoogleSecret": "pygluu.containerlib.secret.google_secret",
+    "AsyncGoogleSecret": "pygluu.containerlib.secret.google_secret",
+    "FileSecret": "pygluu.containerlib.secret.file_secret",
+}
+
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from pygluu.containerlib.secret.kubernetes_secret import KubernetesSecret  # noqa: F401
+    from pygluu.containerlib.secret.vault_secret import VaultSecret  # noqa: F401
+    from pygluu.containerlib.secret.aws_secret import AwsSecret  # noqa: F401
+    from pygluu.containerlib.secret.google_secret import GoogleSecret  # noqa: F401
+    from pygluu.containerlib.secret.google_secret import AsyncGoogleSecret  # noqa: F401
+    from pygluu.containerlib.secret.file_secret import FileSecret  # noqa: F401
+
+__all__ = list(_ADAPTERS)
+
+
+def __getattr__(name: str) -> _t.Any:
+    try:
+        module_name = _ADAPTERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    attr = getattr(importlib.import_module(module_name), name)
+    # cache the attribute so subsequent access won't go through this function
+    globals()[name] = attr
+    return attr
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_ADAPTERS))
@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import json
 import logging
-import lzma
 import os
-import sys
 import typing as _t
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from functools import cached_property
 from functools import partial
@@ -19,7 +18,15 @@ from botocore.exceptions import NoCredentialsError
 from botocore.exceptions import NoRegionError
 from math import ceil
 
+from pygluu.containerlib.metrics import in_current_context
+from pygluu.containerlib.metrics import instrument
+from pygluu.containerlib.metrics import record_bytes
+from pygluu.containerlib.registry import aws_current_version_id
+from pygluu.containerlib.registry import aws_secrets_client
 from pygluu.containerlib.secret.base_secret import BaseSecret
+from pygluu.containerlib.utils import dump_payload
+from pygluu.containerlib.utils import get_payload_compression
+from pygluu.containerlib.utils import load_payload
 from pygluu.containerlib.utils import safe_value
 
 logger = logging.getLogger(__name__)
@@ -37,6 +44,7 @@ class AwsSecret(BaseSecret):
     - `GLUU_AWS_SECRETS_ENDPOINT_URL`: The URL of AWS secretsmanager service (if omitted, will use the one in specified region).
     - `GLUU_AWS_SECRETS_PREFIX`: The prefix name of the secrets (default to `gluu`).
     - `GLUU_AWS_SECRETS_REPLICA_FILE`: The location of file contains replica regions definition (if any). This file is mostly used in primary region.
+    - `GLUU_PAYLOAD_COMPRESSION`: Compression of secrets payload, either `none` (default), `zlib`, or `lzma`.
 
     The following environment variables are used by the underlying AWS SDK:
 
@@ -91,15 +99,20 @@ class AwsSecret(BaseSecret):
         # max size of payload (currently 64K)
         self.max_payload_size = 65536
 
+        # mapping of multipart secret name and its last fetched version ID and fragment;
+        # a fragment is only downloaded if its current version ID (checked via cheap
+        # `DescribeSecret` call) is changed
+        self._versions: dict[str, str] = {}
+        self._fragments: dict[str, bytes] = {}
+
+        # last decoded secrets
+        self._data: _t.Optional[dict[str, _t.Any]] = None
+
     @cached_property
     def client(self) -> boto3.session.Session.client:
-        """Create the Secret Manager client."""
+        """Get the Secret Manager client (shared by instances with the same endpoint and credentials)."""
         try:
-            client = boto3.client(
-                "secretsmanager",
-                endpoint_url=os.environ.get("GLUU_AWS_SECRETS_ENDPOINT_URL") or None,
-            )
-            return client
+            return aws_secrets_client()
         except NoRegionError:
             raise RuntimeError(
                 "AWS region is not specified. Please specify the region in a file "
@@ -111,34 +124,112 @@ class AwsSecret(BaseSecret):
     def all(self) -> dict[str, _t.Any]:  # noqa: D102
         return self.get_all()
 
+    @instrument
     def get_all(self) -> dict[str, _t.Any]:
         """Get all key-value pairs.
 
         Returns:
             A mapping of secrets (if any).
         """
-        # get all existing multipart secrets
+        if self._data is not None and not self._parts_changed():
+            return dict(self._data)
+
+        # get all existing multipart secrets (ordered by part number)
         resp = self.client.list_secrets(
             Filters=[{"Key": "name", "Values": [self.basepath]}],
         )
-        names = [secret["Name"] for secret in resp["SecretList"]]
+        secrets = sorted(
+            (
+                secret for secret in resp["SecretList"]
+                if self._part_number(secret["Name"]) is not None
+            ),
+            key=lambda secret: self._part_number(secret["Name"]),
+        )
+        versions = {
+            secret["Name"]: aws_current_version_id(secret.get("SecretVersionsToStages", {}))
+            for secret in secrets
+        }
 
-        if not names:
+        if not versions:
             return {}
 
-        payload = b"".join([
-            self.client.get_secret_value(SecretId=name)["SecretBinary"]
-            for name in names
-        ])
+        # download changed parts concurrently; unchanged parts are reused
+        changed = [
+            name for name, version_id in versions.items()
+            if not version_id or version_id != self._versions.get(name) or name not in self._fragments
+        ]
+        fragments = {name: self._fragments.get(name, b"") for name in versions}
 
-        try:
-            # previously data is compressed using lzma
-            data = json.loads(lzma.decompress(payload).decode())
-            logger.warning("Loaded legacy data.")
-        except lzma.LZMAError:
-            data = json.loads(payload.decode())
-        return data
+        if changed:
+            with ThreadPoolExecutor(max_workers=len(changed)) as executor:
+                for name, secret in zip(changed, executor.map(in_current_context(self._get_fragment), changed)):
+                    fragments[name] = secret["SecretBinary"]
+                    versions[name] = secret.get("VersionId", versions[name])
+
+        # parts are joined in order into a single preallocated buffer
+        payload = b"".join(fragments.values())
+
+        # compression (if any) is detected from payload header
+        data = load_payload(payload)
+
+        self._versions = versions
+        self._fragments = fragments
+        self._data = data
+        return dict(data)
+
+    @instrument
+    def _get_fragment(self, name: str) -> dict[str, _t.Any]:
+        """Download a single part of multipart secret.
+
+        Args:
+            name: Name of the secret.
+
+        Returns:
+            Response of `GetSecretValue` call.
+        """
+        secret = self.client.get_secret_value(SecretId=name)
+        if isinstance(secret["SecretBinary"], str):
+            secret["SecretBinary"] = secret["SecretBinary"].encode()
+        record_bytes(received=len(secret["SecretBinary"]))
+        return secret
+
+    def _part_number(self, name: str) -> _t.Optional[int]:
+        """Get part number of multipart secret from its name.
 
+        Args:
+            name: Name of the secret, i.e. `gluu_secrets` or `gluu_secrets_1`.
+
+        Returns:
+            Part number or `None` if the name is not part of multipart secrets.
+        """
+        if name == self.basepath:
+            return 0
+
+        suffix = name[len(self.basepath) + 1:]
+        if name.startswith(f"{self.basepath}_") and suffix.isdigit():
+            return int(suffix)
+        return None
+
+    @instrument
+    def _parts_changed(self) -> bool:
+        """Check whether any of known multipart secrets has been changed.
+
+        Returns:
+            A boolean to indicate if version ID of any part is changed.
+        """
+        if not self._versions:
+            return True
+
+        def current_version(name):
+            resp = self.client.describe_secret(SecretId=name)
+            return aws_current_version_id(resp.get("VersionIdsToStages", {}))
+
+        names = list(self._versions)
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            current = list(executor.map(in_current_context(current_version), names))
+        return current != [self._versions[name] for name in names]
+
+    @instrument
     def get(self, key: str, default: _t.Any = "") -> _t.Any:
         """Get value based on given key.
 
@@ -152,6 +243,7 @@ class AwsSecret(BaseSecret):
         data = self.get_all()
         return data.get(key) or default
 
+    @instrument
     def set(self, key: str, value: _t.Any) -> bool:
         """Set key with given value.
 
@@ -164,8 +256,14 @@ class AwsSecret(BaseSecret):
         """
         data = self.get_all()
         data[key] = safe_value(value)
-        return self._update_secret_multipart(json.dumps(data))
 
+        updated = self._update_secret_multipart(
+            dump_payload(data, get_payload_compression())
+        )
+        self._data = data
+        return updated
+
+    @instrument
     def set_all(self, data: dict[str, _t.Any]) -> bool:
         """Set all key-value pairs.
 
@@ -182,7 +280,12 @@ class AwsSecret(BaseSecret):
         for k, v in data.items():
             # ensure key-value that has bytes is converted to text
             payload[k] = safe_value(v)
-        return self._update_secret_multipart(json.dumps(payload))
+
+        updated = self._update_secret_multipart(
+            dump_payload(payload, get_payload_compression())
+        )
+        self._data = payload
+        return updated
 
     @cached_property
     def replica_regions(self) -> list[dict[str, _t.Any]]:
@@ -207,6 +310,7 @@ class AwsSecret(BaseSecret):
                 ]
         return regions
 
+    @instrument
     def _update_secret_multipart(self, payload: _t.AnyStr) -> bool:  # noqa: D102
         if isinstance(payload, str):
             # Convert the string payload into a bytes. This step can be omitted if you
@@ -215,7 +319,8 @@ class AwsSecret(BaseSecret):
         else:
             payload_bytes = payload
 
-        data_length = sys.getsizeof(payload_bytes)
+        data_length = len(payload_bytes)
+        record_bytes(sent=data_length)
         parts = ceil(data_length / self.max_payload_size)
 
         if parts > 1:
@@ -229,7 +334,23 @@ class AwsSecret(BaseSecret):
             start_bytes = part * self.max_payload_size
             stop_bytes = (part + 1) * self.max_payload_size
             fragment = payload_bytes[start_bytes:stop_bytes]
-            self.client.update_secret(SecretId=name, SecretBinary=fragment)
+            resp = self.client.update_secret(SecretId=name, SecretBinary=fragment)
+
+            # keep track of the part so subsequent reads won't need to download it
+            self._versions[name] = (resp or {}).get("VersionId", "")
+            self._fragments[name] = fragment
+
+        # readers join all existing parts, hence parts beyond the new payload (i.e. the payload
+        # shrinks after compression) are emptied; they are not deleted as secret that is
+        # scheduled for deletion can't be re-created once the payload grows again
+        for name in list(self._versions):
+            part = self._part_number(name)
+            if part is None or part < parts or self._fragments.get(name) == b"":
+                continue
+
+            resp = self.client.update_secret(SecretId=name, SecretBinary=b"")
+            self._versions[name] = (resp or {}).get("VersionId", "")
+            self._fragments[name] = b""
         return True
 
     def _prepare_secret_multipart(self, part: int) -> str:
@@ -0,0 +1,28 @@
+"""This module contains secret adapter class to interact with local files."""
+
+from __future__ import annotations
+
+from pygluu.containerlib.filestore import FileStoreAdapter
+from pygluu.containerlib.secret.base_secret import BaseSecret
+
+
+class FileSecret(FileStoreAdapter, BaseSecret):
+    """This class interacts with secrets stored in local files.
+
+    The instance of this class is configured via environment variables.
+
+    Supported environment variables:
+
+    - ``GLUU_SECRET_FILE_PATH``: path to a JSON file contains key-value pairs, or a directory
+      where each file is a key and its contents is the value, i.e. mounted Kubernetes Secret or Docker secrets
+      (default to ``/etc/gluu/conf/secret.json``).
+
+    Files are parsed once and re-read only when they are changed.
+    See :class:`~pygluu.containerlib.filestore.FileStore` for details.
+    """
+
+    setting_prefix = "GLUU_SECRET_FILE_"
+    default_path = "/etc/gluu/conf/secret.json"
+
+    # secrets written by this adapter are readable by owner only
+    mode = 0o600
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-import sys
 import os
 import typing as _t
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from functools import cached_property
 from math import ceil
@@ -14,7 +14,14 @@ from math import ceil
 from google.cloud import secretmanager
 from google.api_core.exceptions import AlreadyExists, NotFound
 
+from pygluu.containerlib.metrics import in_current_context
+from pygluu.containerlib.metrics import instrument
+from pygluu.containerlib.metrics import record_bytes
+from pygluu.containerlib.registry import google_secrets_client
 from pygluu.containerlib.secret.base_secret import BaseSecret
+from pygluu.containerlib.utils import dump_payload
+from pygluu.containerlib.utils import get_payload_compression
+from pygluu.containerlib.utils import load_payload
 from pygluu.containerlib.utils import safe_value
 
 logger = logging.getLogger(__name__)
@@ -31,6 +38,7 @@ class GoogleSecret(BaseSecret):
     - `GOOGLE_PROJECT_ID`: ID of Google project.
     - `GLUU_GOOGLE_SECRET_VERSION_ID`: Gluu secret version ID in Google Secret Manager. Defaults to `latest`, which is recommended.
     - `GLUU_GOOGLE_SECRET_NAME_PREFIX`: Prefix for Gluu secret in Google Secret Manager. Defaults to `gluu`. If left `gluu-secret` secret will be created.
+    - `GLUU_PAYLOAD_COMPRESSION`: Compression of secrets payload, either `none` (default), `zlib`, or `lzma`.
     """
 
     def __init__(self) -> None:  # noqa: D107
@@ -52,14 +60,19 @@ class GoogleSecret(BaseSecret):
         # iterable contains multipart secret names
         self.multiparts: list[str] = []
 
+        # cached names of multipart secret versions to access, so listing secrets
+        # is not required on every read
+        self._names: list[str] = []
+
     @cached_property
     def client(self) -> secretmanager.SecretManagerServiceClient:
-        """Create the Secret Manager client."""
-        return secretmanager.SecretManagerServiceClient()
+        """Get the Secret Manager client (shared by instances with the same credentials)."""
+        return google_secrets_client()
 
     def all(self) -> dict[str, _t.Any]:  # noqa: D102
         return self.get_all()
 
+    @instrument
     def get_all(self) -> dict[str, _t.Any]:
         """Access the payload for the given secret version if one exists.
 
@@ -69,6 +82,29 @@ class GoogleSecret(BaseSecret):
         Returns:
             A mapping of secrets (if any)
         """
+        names = self._names or self._list_names()
+
+        if not names:
+            return {}
+
+        try:
+            payload = self._access_payload(names)
+        except ValueError:
+            # number of parts may have been changed by other client, hence
+            # multipart names are refreshed and the payload is fetched again
+            names = self._list_names()
+            payload = self._access_payload(names)
+
+        if payload is None:
+            return {}
+        return payload
+
+    def _list_names(self) -> list[str]:
+        """List resource names of multipart secret versions (ordered by part number).
+
+        Returns:
+            List of resource names.
+        """
         # get a list of secrets with prefixed name
         resp = self.client.list_secrets(
             request={
@@ -77,29 +113,84 @@ class GoogleSecret(BaseSecret):
             }
         )
 
+        return self._cache_names(scr.name for scr in resp)
+
+    def _cache_names(self, secret_names: _t.Iterable[str]) -> list[str]:
+        """Remember resource names of multipart secret versions (ordered by part number).
+
+        Args:
+            secret_names: Resource names of listed secrets.
+
+        Returns:
+            List of resource names of secret versions.
+        """
+        parts = {}
+        for secret_name in secret_names:
+            number = self._part_number(secret_name.rsplit("/", 1)[-1])
+            if number is not None:
+                parts[number] = f"{secret_name}/versions/{self.version_id}"
+
         # collect all secret names (if any) for further request
-        names = [f"{scr.name}/versions/{self.version_id}" for scr in resp]
+        self._names = [parts[number] for number in sorted(parts)]
+        return self._names
 
-        if not names:
-            return {}
+    def _part_number(self, name: str) -> _t.Optional[int]:
+        """Get part number of multipart secret from its name.
+
+        Args:
+            name: Name of the secret, i.e. `gluu-secret` or `gluu-secret-1`.
 
-        data = {}
-        payload = b""
+        Returns:
+            Part number or `None` if the name is not part of multipart secrets.
+        """
+        if name == self.google_secret_name:
+            return 0
 
-        for name in names:
+        suffix = name[len(self.google_secret_name) + 1:]
+        if name.startswith(f"{self.google_secret_name}-") and suffix.isdigit():
+            return int(suffix)
+        return None
+
+    @instrument
+    def _access_payload(self, names: list[str]) -> _t.Optional[dict[str, _t.Any]]:
+        """Access all parts concurrently and decode the joined payload.
+
+        Args:
+            names: Resource names of multipart secret versions.
+
+        Returns:
+            A mapping of secrets or `None` if there's no payload.
+        """
+        def access(name):
             # the secret with given name may not exist or have any versions created yet
             with suppress(NotFound):
-                fragment = self.client.access_secret_version(request={"name": name})
-                payload = payload + fragment.payload.data
+                return self.client.access_secret_version(request={"name": name}).payload.data
+            return b""
 
-        if not payload:
-            return {}
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            fragments = list(executor.map(in_current_context(access), names))
+        return self._load_fragments(fragments)
+
+    @staticmethod
+    def _load_fragments(fragments: list[bytes]) -> _t.Optional[dict[str, _t.Any]]:
+        """Decode payload joined from fragments of all parts.
 
-        data = json.loads(payload)
+        Args:
+            fragments: Payload fragments ordered by part number.
 
-        # decoded payload
-        return data
+        Returns:
+            A mapping of secrets or `None` if there's no payload.
+        """
+        # parts are joined in a single pass (ordered by part number)
+        payload = b"".join(fragments)
+        record_bytes(received=len(payload))
 
+        if not payload:
+            return None
+        # compression (if any) is detected from payload header
+        return load_payload(payload)
+
+    @instrument
     def get(self, key: str, default: _t.Any = "") -> _t.Any:
         """Get value based on given key.
 
@@ -113,6 +204,7 @@ class GoogleSecret(BaseSecret):
         result = self.get_all()
         return result.get(key) or default
 
+    @instrument
     def set(self, key: str, value: _t.Any) -> bool:
         """Set key with given value.
 
@@ -127,9 +219,10 @@ class GoogleSecret(BaseSecret):
         all_[key] = safe_value(value)
         logger.info(f"Adding key {key}.")
 
-        payload = safe_value(all_)
+        payload = dump_payload(all_, get_payload_compression())
         return self._add_secret_version_multipart(payload)
 
+    @instrument
     def set_all(self, data: dict[str, _t.Any]) -> bool:
         """Push a full dictionary to secrets.
 
@@ -146,7 +239,7 @@ class GoogleSecret(BaseSecret):
         for k, v in data.items():
             all_[k] = safe_value(v)
 
-        payload = safe_value(all_)
+        payload = dump_payload(all_, get_payload_compression())
         return self._add_secret_version_multipart(payload)
 
     def delete(self) -> None:
@@ -160,12 +253,35 @@ class GoogleSecret(BaseSecret):
         except NotFound:
             logger.warning(f'Secret {self.google_secret_name} does not exist in the secret manager.')
 
+    @instrument
     def _add_secret_version_multipart(self, payload: _t.AnyStr) -> bool:
         """Add a new secret version to the given secret with the provided payload.
 
         Args:
             payload: secret's payload
         """
+        for part, fragment in enumerate(self._split_payload(payload)):
+            name = self._prepare_secret_multipart(part)
+
+            # Build the resource name of the parent secret.
+            parent = self.client.secret_path(self.project_id, name)
+
+            # Add the secret version.
+            response = self.client.add_secret_version(
+                request={"parent": parent, "payload": {"data": fragment}}
+            )
+            logger.info(f"Added secret version: {response.name}")
+        return True
+
+    def _split_payload(self, payload: _t.AnyStr) -> list[bytes]:
+        """Split payload into fragments that fit into a single secret version.
+
+        Args:
+            payload: secret's payload
+
+        Returns:
+            List of fragments ordered by part number.
+        """
         if isinstance(payload, str):
             # Convert the string payload into a bytes. This step can be omitted if you
             # pass in bytes instead of a str for the payload argument.
@@ -173,7 +289,8 @@ class GoogleSecret(BaseSecret):
         else:
             payload_bytes = payload
 
-        data_length = sys.getsizeof(payload_bytes)
+        data_length = len(payload_bytes)
+        record_bytes(sent=data_length)
         parts = ceil(data_length / self.max_payload_size)
 
         if parts > 1:
@@ -182,22 +299,10 @@ class GoogleSecret(BaseSecret):
                 f"It will be splitted into {parts} parts."
             )
 
-        for part in range(0, parts):
-            name = self._prepare_secret_multipart(part)
-
-            start_bytes = part * self.max_payload_size
-            stop_bytes = (part + 1) * self.max_payload_size
-            fragment = payload_bytes[start_bytes:stop_bytes]
-
-            # Build the resource name of the parent secret.
-            parent = self.client.secret_path(self.project_id, name)
-
-            # Add the secret version.
-            response = self.client.add_secret_version(
-                request={"parent": parent, "payload": {"data": fragment}}
-            )
-            logger.info(f"Added secret version: {response.name}")
-        return True
+        return [
+            payload_bytes[part * self.max_payload_size:(part + 1) * self.max_payload_size]
+            for part in range(0, parts)
+        ]
 
     def _prepare_secret_multipart(self, part: int) -> str:
         """Create a new secret with the given name.
@@ -211,30 +316,252 @@ class GoogleSecret(BaseSecret):
         Returns:
             Newly created secret's name.
         """
-        name = self.google_secret_name
-
-        if part > 0:
-            name = f"{self.google_secret_name}-{part}"
+        name = self._part_name(part)
 
         if name in self.multiparts:
             return name
 
-        # Build the resource name of the parent project.
-        parent = f"projects/{self.project_id}"
-
         # Secret with given name may already exists
         with suppress(AlreadyExists):
             # Create the secret.
-            response = self.client.create_secret(
+            response = self.client.create_secret(request=self._create_secret_request(name))
+            self._secret_created(name, response)
+        return name
+
+    def _part_name(self, part: int) -> str:
+        """Get name of multipart secret.
+
+        Args:
+            part: multipart number.
+
+        Returns:
+            Name of the secret, i.e. `gluu-secret` or `gluu-secret-1`.
+        """
+        if part > 0:
+            return f"{self.google_secret_name}-{part}"
+        return self.google_secret_name
+
+    def _create_secret_request(self, name: str) -> dict[str, _t.Any]:
+        """Build request to create multipart secret.
+
+        Args:
+            name: Name of the secret.
+
+        Returns:
+            Request of `create_secret` call.
+        """
+        return {
+            # Build the resource name of the parent project.
+            "parent": f"projects/{self.project_id}",
+            "secret_id": name,
+            "secret": {
+                "replication": {"automatic": {}},
+                "labels": {"multipart_enabled": "true"},
+            },
+        }
+
+    def _secret_created(self, name: str, response: _t.Any) -> None:
+        """Remember newly created multipart secret.
+
+        Args:
+            name: Name of the secret.
+            response: Response of `create_secret` call.
+        """
+        logger.info(f"Created secret: {response.name}")
+        self.multiparts.append(name)
+
+        # new part is not listed in cached names yet
+        self._names = []
+
+
+class AsyncGoogleSecret:
+    """Native asyncio counterpart of `GoogleSecret`.
+
+    Requests are sent by `SecretManagerServiceAsyncClient` on the running event loop,
+    using the settings (and cached multipart names) of the wrapped adapter;
+    parts of multipart secret are accessed and added concurrently.
+
+    Args:
+        secret: Synchronous adapter to take settings from.
+    """
+
+    def __init__(self, secret: _t.Optional[GoogleSecret] = None) -> None:  # noqa: D107
+        # fail early (so managers fallback to executor) if the installed SDK has no asyncio client
+        self.client_class = secretmanager.SecretManagerServiceAsyncClient
+
+        self.secret = secret or GoogleSecret()
+        self._client: _t.Any = None
+        self._client_loop: _t.Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def client(self) -> _t.Any:
+        """Get the asyncio client bound to the running event loop (created on first access)."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = self.client_class()
+            self._client_loop = loop
+        return self._client
+
+    async def close(self) -> None:
+        """Close the client; must be called on the event loop that uses the client."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.transport.close()
+
+    @instrument
+    async def get_all(self) -> dict[str, _t.Any]:
+        """Access the payload for the given secret version if one exists.
+
+        See `GoogleSecret.get_all` for details.
+
+        Returns:
+            A mapping of secrets (if any)
+        """
+        names = self.secret._names or await self._list_names()
+
+        if not names:
+            return {}
+
+        try:
+            payload = await self._access_payload(names)
+        except ValueError:
+            # number of parts may have been changed by other client, hence
+            # multipart names are refreshed and the payload is fetched again
+            names = await self._list_names()
+            payload = await self._access_payload(names)
+
+        if payload is None:
+            return {}
+        return payload
+
+    async def _list_names(self) -> list[str]:
+        """List resource names of multipart secret versions (ordered by part number).
+
+        Returns:
+            List of resource names.
+        """
+        pager = await self.client.list_secrets(
+            request={
+                "parent": f"projects/{self.secret.project_id}",
+                "filter": f"name:secrets/{self.secret.google_secret_name}",
+            }
+        )
+        return self.secret._cache_names([scr.name async for scr in pager])
+
+    async def _access_payload(self, names: list[str]) -> _t.Optional[dict[str, _t.Any]]:
+        """Access all parts concurrently and decode the joined payload.
+
+        Args:
+            names: Resource names of multipart secret versions.
+
+        Returns:
+            A mapping of secrets or `None` if there's no payload.
+        """
+        async def access(name):
+            # the secret with given name may not exist or have any versions created yet
+            with suppress(NotFound):
+                response = await self.client.access_secret_version(request={"name": name})
+                return response.payload.data
+            return b""
+
+        fragments = await asyncio.gather(*[access(name) for name in names])
+        return self.secret._load_fragments(fragments)
+
+    @instrument
+    async def get(self, key: str, default: _t.Any = "") -> _t.Any:
+        """Get value based on given key.
+
+        Args:
+            key: Key name.
+            default: Default value if key is not exist.
+
+        Returns:
+            Value based on given key or default one.
+        """
+        result = await self.get_all()
+        return result.get(key) or default
+
+    @instrument
+    async def set(self, key: str, value: _t.Any) -> bool:
+        """Set key with given value.
+
+        Args:
+            key: Key name.
+            value: Value of the key.
+
+        Returns:
+            A boolean to mark whether secret is set or not.
+        """
+        logger.info(f"Adding key {key}.")
+        return await self.set_all({key: value})
+
+    @instrument
+    async def set_all(self, data: dict[str, _t.Any]) -> bool:
+        """Push a full dictionary to secrets.
+
+        Args:
+            data: full dictionary to push (merged with existing secrets).
+
+        Returns:
+            A boolean to mark whether secret is set or not.
+        """
+        all_ = await self.get_all()
+
+        for k, v in data.items():
+            all_[k] = safe_value(v)
+
+        payload = dump_payload(all_, get_payload_compression())
+        return await self._add_secret_version_multipart(payload)
+
+    async def wait_for_key(self, key: str, timeout: float, default: _t.Any = "") -> _t.Any:
+        """Check the key once (Google Secret Manager has no change notifications).
+
+        Args:
+            key: Key name.
+            timeout: Max. time to wait (in seconds); unused.
+            default: Default value if key is not set.
+
+        Returns:
+            Value of the key or default one.
+        """
+        return await self.get(key, default) or default
+
+    async def _add_secret_version_multipart(self, payload: _t.AnyStr) -> bool:
+        """Add a new secret version to all parts concurrently.
+
+        Args:
+            payload: secret's payload
+        """
+        async def add(part, fragment):
+            name = await self._prepare_secret_multipart(part)
+            response = await self.client.add_secret_version(
                 request={
-                    "parent": parent,
-                    "secret_id": name,
-                    "secret": {
-                        "replication": {"automatic": {}},
-                        "labels": {"multipart_enabled": "true"},
-                    },
+                    "parent": f"projects/{self.secret.project_id}/secrets/{name}",
+                    "payload": {"data": fragment},
                 }
             )
-            logger.info(f"Created secret: {response.name}")
-            self.multiparts.append(name)
+            logger.info(f"Added secret version: {response.name}")
+
+        fragments = self.secret._split_payload(payload)
+        await asyncio.gather(*[add(part, fragment) for part, fragment in enumerate(fragments)])
+        return True
+
+    async def _prepare_secret_multipart(self, part: int) -> str:
+        """Create a new secret for given part (if not exist).
+
+        Args:
+            part: multipart number.
+
+        Returns:
+            Newly created secret's name.
+        """
+        name = self.secret._part_name(part)
+
+        if name in self.secret.multiparts:
+            return name
+
+        # Secret with given name may already exists
+        with suppress(AlreadyExists):
+            response = await self.client.create_secret(request=self.secret._create_secret_request(name))
+            self.secret._secret_created(name, response)
         return name
@@ -3,22 +3,28 @@
 from __future__ import annotations
 
 import base64
+import logging
 import os
 from typing import (
     Any,
+    Optional,
 )
 
 import kubernetes.client
-import kubernetes.config
 
+from pygluu.containerlib.metrics import instrument
+from pygluu.containerlib.registry import get_kubernetes_api_client
 from pygluu.containerlib.secret.base_secret import BaseSecret
 from pygluu.containerlib.utils import (
     as_boolean,
     safe_value,
 )
+from pygluu.containerlib.watch import KubernetesWatchMixin
 
+logger = logging.getLogger(__name__)
 
-class KubernetesSecret(BaseSecret):
+
+class KubernetesSecret(KubernetesWatchMixin, BaseSecret):
     """This class interacts with Kubernetes Secret backend.
 
     The following environment variables are used to instantiate the client:
@@ -26,8 +32,19 @@ class KubernetesSecret(BaseSecret):
     - ``GLUU_SECRET_KUBERNETES_NAMESPACE``
     - ``GLUU_SECRET_KUBERNETES_SECRET``
     - ``GLUU_SECRET_KUBERNETES_USE_KUBE_CONFIG``
+    - ``GLUU_SECRET_KUBERNETES_WATCH``
+
+    If ``GLUU_SECRET_KUBERNETES_WATCH`` is set to ``true``, a background watcher
+    is started on first read (see :meth:`watch`).
     """
 
+    resource_api = "secret"
+    name_setting = "GLUU_SECRET_KUBERNETES_SECRET"
+    namespace_setting = "GLUU_SECRET_KUBERNETES_NAMESPACE"
+    watch_setting = "GLUU_SECRET_KUBERNETES_WATCH"
+    watch_thread_name = "kubernetes-secret-watcher"
+    watch_label = "Secret"
+
     def __init__(self):
         self.settings = {
             k: v
@@ -41,22 +58,25 @@ class KubernetesSecret(BaseSecret):
             "GLUU_SECRET_KUBERNETES_SECRET", "gluu",
         )
         self.settings.setdefault("GLUU_SECRET_KUBERNETES_USE_KUBE_CONFIG", False)
+        self.settings.setdefault("GLUU_SECRET_KUBERNETES_WATCH", False)
 
         self._client = None
         self.name_exists = False
         self.kubeconfig_file = os.path.expanduser("~/.kube/config")
+        self._init_watch()
 
     @property
     def client(self):
         """Lazy-loaded client to interact with Kubernetes API."""
         if not self._client:
-            if as_boolean(self.settings["GLUU_SECRET_KUBERNETES_USE_KUBE_CONFIG"]):
-                kubernetes.config.load_kube_config(self.kubeconfig_file)
-            else:
-                kubernetes.config.load_incluster_config()
-            self._client = kubernetes.client.CoreV1Api()
+            api_client = get_kubernetes_api_client(
+                self.kubeconfig_file,
+                use_kube_config=as_boolean(self.settings["GLUU_SECRET_KUBERNETES_USE_KUBE_CONFIG"]),
+            )
+            self._client = kubernetes.client.CoreV1Api(api_client)
         return self._client
 
+    @instrument
     def get(self, key, default: Any = "") -> Any:
         """Get value based on given key.
 
@@ -95,6 +115,13 @@ class KubernetesSecret(BaseSecret):
                 else:
                     raise
 
+    def _prepare_resource(self) -> None:
+        self._prepare_secret()
+
+    def _decode_data(self, data: Optional[dict[str, str]]) -> dict[str, str]:
+        return {k: base64.b64decode(v).decode() for k, v in (data or {}).items()}
+
+    @instrument
     def set(self, key: str, value: Any) -> bool:
         """Set key with given value.
 
@@ -114,25 +141,33 @@ class KubernetesSecret(BaseSecret):
             self.settings["GLUU_SECRET_KUBERNETES_NAMESPACE"],
             body=body,
         )
+
+        if ret:
+            self._update_mirror({key: safe_value(value)})
         return bool(ret)
 
     def all(self) -> dict:  # pragma: no cover
         return self.get_all()
 
+    @instrument
     def get_all(self) -> dict:
         """Get all key-value pairs.
 
         :returns: A ``dict`` of key-value pairs (if any).
         """
+        mirror = self._get_mirror()
+        if mirror is not None:
+            return dict(mirror)
+
         self._prepare_secret()
         result = self.client.read_namespaced_secret(
             self.settings["GLUU_SECRET_KUBERNETES_SECRET"],
             self.settings["GLUU_SECRET_KUBERNETES_NAMESPACE"],
         )
 
-        data = result.data or {}
-        return {k: base64.b64decode(v).decode() for k, v in data.items()}
+        return self._decode_data(result.data)
 
+    @instrument
     def set_all(self, data: dict[str, Any]) -> bool:
         """Set all key-value pairs.
 
@@ -154,4 +189,7 @@ class KubernetesSecret(BaseSecret):
             self.settings["GLUU_SECRET_KUBERNETES_NAMESPACE"],
             body=body,
         )
+
+        if ret:
+            self._update_mirror({key: safe_value(value) for key, value in data.items()})
         return bool(ret)
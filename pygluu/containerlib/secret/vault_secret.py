@@ -3,15 +3,31 @@
 from __future__ import annotations
 
 import logging
+import math
 import os
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import (
     Any,
+    Callable,
+    Iterable,
+    Optional,
     Tuple,
     Union,
 )
 
 import hvac
-
+import hvac.exceptions
+import requests
+from requests.adapters import HTTPAdapter
+
+from pygluu.containerlib.metrics import in_current_context
+from pygluu.containerlib.metrics import instrument
+from pygluu.containerlib.metrics import record_response_bytes
+from pygluu.containerlib.registry import clients
 from pygluu.containerlib.secret.base_secret import BaseSecret
 from pygluu.containerlib.utils import (
     as_boolean,
@@ -20,6 +36,63 @@ from pygluu.containerlib.utils import (
 
 logger = logging.getLogger(__name__)
 
+#: Interval (in seconds) to re-check token with unknown TTL (i.e. token not issued by the adapter).
+TOKEN_CHECK_INTERVAL = 60
+
+#: Tokens are considered expired this number of seconds before their actual expiry.
+TOKEN_EXPIRY_MARGIN = 5
+
+#: Max. number of attempts to write a document changed concurrently by other clients.
+DOCUMENT_CAS_RETRIES = 5
+
+
+class _TokenLease:
+    """Lease of Vault token shared by adapters using the same client.
+
+    :param timer: Callable to get monotonic time in seconds.
+    """
+
+    def __init__(self, timer: Callable[[], float] = time.monotonic) -> None:
+        self.timer = timer
+        self.lock = threading.Lock()
+        self.expires_at = 0.0
+        self.renewable = False
+        # whether the token is issued by AppRole login (as opposed to token given externally)
+        self.issued = False
+        self.stop_event = threading.Event()
+        self.renewer: Optional[threading.Thread] = None
+
+    def is_valid(self) -> bool:
+        """Check whether token can be used without contacting Vault."""
+        return self.timer() < self.expires_at - TOKEN_EXPIRY_MARGIN
+
+    def update(self, auth: dict[str, Any]) -> None:
+        """Update lease based on ``auth`` section of login/renew response.
+
+        :param auth: The ``auth`` section of the response.
+        """
+        self.renewable = bool(auth.get("renewable"))
+
+        if "lease_duration" not in auth:
+            # TTL is unknown, hence token will be checked again later
+            self.expires_at = self.timer() + TOKEN_CHECK_INTERVAL
+        elif not auth["lease_duration"]:
+            # token never expires
+            self.expires_at = math.inf
+        else:
+            self.expires_at = self.timer() + auth["lease_duration"]
+
+    def invalidate(self) -> None:
+        """Mark token as expired, so it will be checked (or re-issued) on next use."""
+        self.expires_at = 0.0
+
+    def close(self) -> None:
+        """Stop background thread that renews the token (if any).
+
+        Called by :meth:`~pygluu.containerlib.registry.ClientRegistry.close`.
+        """
+        self.stop_event.set()
+
 
 class VaultSecret(BaseSecret):
     """This class interacts with Vault backend.
@@ -35,6 +108,24 @@ class VaultSecret(BaseSecret):
     - ``GLUU_SECRET_VAULT_CERT_FILE``
     - ``GLUU_SECRET_VAULT_KEY_FILE``
     - ``GLUU_SECRET_VAULT_CACERT_FILE``
+    - ``GLUU_SECRET_VAULT_CONCURRENCY``: max. number of concurrent requests made by ``get_all`` (default to ``10``).
+    - ``GLUU_SECRET_VAULT_LAYOUT``: storage layout of secrets, either ``keys`` (default; each secret
+      is stored at its own path under ``secret/gluu``) or ``document`` (all secrets are stored
+      in KV v2 document(s); see below).
+    - ``GLUU_SECRET_VAULT_KV_MOUNT``: mount point of KV v2 secrets engine used by ``document`` layout
+      (default to ``secret``).
+    - ``GLUU_SECRET_VAULT_DOCUMENT_PATH``: path of the document (default to ``gluu``).
+    - ``GLUU_SECRET_VAULT_DOCUMENT_SHARDS``: number of documents the secrets are spread across
+      (default to ``1``); documents are stored at ``<path>/<shard>`` if there are multiple shards.
+
+    In ``document`` layout, reading or writing all secrets costs a single request per document,
+    and writes use check-and-set (based on the last known version of the document) to avoid
+    overwriting concurrent changes. Secrets stored in ``keys`` layout can be copied
+    into documents using :meth:`migrate_to_document`.
+
+    Token issued by AppRole login is reused until its TTL (taken from login response) is nearly expired,
+    so operations don't need to check the token against Vault. Renewable token is renewed
+    in background thread after 2/3 of its TTL has passed (or re-issued if renewal fails).
     """
 
     def __init__(self):
@@ -70,6 +161,21 @@ class VaultSecret(BaseSecret):
         self.settings.setdefault(
             "GLUU_SECRET_VAULT_CACERT_FILE", "/etc/certs/vault_ca.crt",
         )
+        self.settings.setdefault(
+            "GLUU_SECRET_VAULT_CONCURRENCY", 10,
+        )
+        self.settings.setdefault(
+            "GLUU_SECRET_VAULT_LAYOUT", "keys",
+        )
+        self.settings.setdefault(
+            "GLUU_SECRET_VAULT_KV_MOUNT", "secret",
+        )
+        self.settings.setdefault(
+            "GLUU_SECRET_VAULT_DOCUMENT_PATH", "gluu",
+        )
+        self.settings.setdefault(
+            "GLUU_SECRET_VAULT_DOCUMENT_SHARDS", 1,
+        )
 
         cert, verify = self._verify_cert(
             self.settings["GLUU_SECRET_VAULT_SCHEME"],
@@ -81,17 +187,82 @@ class VaultSecret(BaseSecret):
 
         self._request_warning(self.settings["GLUU_SECRET_VAULT_SCHEME"], verify)
 
-        self.client = hvac.Client(
-            url="{}://{}:{}".format(
-                self.settings["GLUU_SECRET_VAULT_SCHEME"],
-                self.settings["GLUU_SECRET_VAULT_HOST"],
-                self.settings["GLUU_SECRET_VAULT_PORT"],
-            ),
-            cert=cert,
-            verify=verify,
+        url = "{}://{}:{}".format(
+            self.settings["GLUU_SECRET_VAULT_SCHEME"],
+            self.settings["GLUU_SECRET_VAULT_HOST"],
+            self.settings["GLUU_SECRET_VAULT_PORT"],
         )
+
+        # instances with identical address and credentials share a single client,
+        # hence its connection pool and auth token
+        client_key = (
+            "vault",
+            url,
+            cert,
+            verify,
+            self.concurrency,
+            self.settings["GLUU_SECRET_VAULT_ROLE_ID_FILE"],
+            self.settings["GLUU_SECRET_VAULT_SECRET_ID_FILE"],
+        )
+        self.client = clients.get(
+            client_key,
+            lambda: hvac.Client(url=url, cert=cert, verify=verify, session=self._build_session()),
+        )
+        # lease of token shared by instances using the same client
+        self._lease = clients.get(client_key + ("lease",), _TokenLease)
         self.prefix = "secret/gluu"
 
+        # last known contents and version of each document (used by ``document`` layout)
+        self._documents: dict[int, Tuple[dict[str, str], int]] = {}
+        self._documents_lock = threading.Lock()
+
+    @property
+    def concurrency(self) -> int:
+        """Get max. number of concurrent requests to Vault.
+
+        The value is determined by ``GLUU_SECRET_VAULT_CONCURRENCY`` environment variable.
+        """
+        try:
+            concurrency = int(self.settings["GLUU_SECRET_VAULT_CONCURRENCY"])
+        except ValueError:
+            concurrency = 10
+        return max(1, concurrency)
+
+    def _build_session(self) -> requests.Session:
+        """Create HTTP session with connection pool sized for concurrent requests.
+
+        :returns: An instance of ``requests.Session``.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=self.concurrency)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.hooks["response"].append(record_response_bytes)
+        return session
+
+    @property
+    def layout(self) -> str:
+        """Get storage layout of secrets, either ``keys`` or ``document``.
+
+        The value is determined by ``GLUU_SECRET_VAULT_LAYOUT`` environment variable.
+        """
+        layout = self.settings["GLUU_SECRET_VAULT_LAYOUT"]
+        if layout not in ("keys", "document"):
+            raise ValueError(f"Unsupported Vault storage layout {layout!r}; expected 'keys' or 'document'")
+        return layout
+
+    @property
+    def shards(self) -> int:
+        """Get number of documents used by ``document`` layout.
+
+        The value is determined by ``GLUU_SECRET_VAULT_DOCUMENT_SHARDS`` environment variable.
+        """
+        try:
+            shards = int(self.settings["GLUU_SECRET_VAULT_DOCUMENT_SHARDS"])
+        except ValueError:
+            shards = 1
+        return max(1, shards)
+
     @property
     def role_id(self):
         """Get the Role ID from file.
@@ -121,13 +292,106 @@ class VaultSecret(BaseSecret):
         return secret_id
 
     def _authenticate(self) -> None:
-        """Authenticate client."""
-        if self.client.is_authenticated():
+        """Authenticate client.
+
+        Token that is not expired yet (according to its lease) is used as it is,
+        without making any request to Vault.
+        """
+        if self._lease.is_valid():
             return
 
+        with self._lease.lock:
+            # other thread may have authenticated the client while waiting for the lock
+            if not self._lease.is_valid():
+                self._refresh_token()
+
+    @instrument
+    def _refresh_token(self) -> None:
+        """Check current token (if it's not issued by AppRole login) or log in to get a new one.
+
+        Token that is not issued by this adapter (e.g. from ``VAULT_TOKEN`` environment variable)
+        is checked against Vault every ``TOKEN_CHECK_INTERVAL`` seconds; login is attempted
+        only if the token is rejected.
+
+        Must be called while holding the lease lock.
+        """
+        if not self._lease.issued and self.client.is_authenticated():
+            self._lease.update({})
+            return
+        self._login()
+
+    def _login(self) -> None:
+        """Log in using AppRole and keep track of the token lease."""
         creds = self.client.auth.approle.login(self.role_id, self.secret_id, use_token=False)
         self.client.token = creds["auth"]["client_token"]
+        self._lease.update(creds["auth"])
+        self._lease.issued = True
+
+        if self._lease.renewable and math.isfinite(self._lease.expires_at):
+            self._start_renewer()
+
+    def _start_renewer(self) -> None:
+        """Start background thread to renew the token (if not started yet)."""
+        lease = self._lease
+        if lease.renewer and lease.renewer.is_alive():
+            return
+
+        lease.stop_event.clear()
+        lease.renewer = threading.Thread(
+            target=self._renew_loop, name="vault-token-renewer", daemon=True,
+        )
+        lease.renewer.start()
+
+    def _renew_loop(self) -> None:
+        """Renew the token after 2/3 of its remaining TTL has passed, until it can't be renewed."""
+        lease = self._lease
+
+        while not lease.stop_event.is_set():
+            remaining = lease.expires_at - lease.timer()
+            if not math.isfinite(remaining):
+                return
+
+            if lease.stop_event.wait(max(0, remaining * 2 / 3)):
+                return
+
+            with lease.lock:
+                try:
+                    auth = self.client.auth.token.renew_self()["auth"]
+                    if auth.get("lease_duration", 0) <= TOKEN_EXPIRY_MARGIN * 2:
+                        # renewing token that reaches its max. TTL won't extend its lifetime
+                        raise ValueError("token is reaching its max. TTL")
+                    lease.update(auth)
+                except Exception as exc:  # noqa: B902
+                    logger.warning(f"Unable to renew Vault token; reason={exc}")
+                    try:
+                        self._login()
+                    except Exception as exc:  # noqa: B902
+                        # next operation will try to log in (and raise the error)
+                        logger.warning(f"Unable to log in to Vault; reason={exc}")
+                        lease.invalidate()
+                        return
+
+                if not lease.renewable:
+                    return
+
+    def _call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call a function that makes request to Vault.
+
+        If the token is rejected (e.g. revoked before its expiry), the client
+        is re-authenticated and the function is called once more.
+
+        :param func: Function to call.
+        :returns: Result of the function.
+        """
+        self._authenticate()
+        try:
+            return func(*args, **kwargs)
+        except hvac.exceptions.Forbidden:
+            self._lease.invalidate()
+            self._authenticate()
+            return func(*args, **kwargs)
 
+    @instrument
     def get(self, key: str, default: Any = "") -> Any:
         """Get value based on given key.
 
@@ -135,13 +399,25 @@ class VaultSecret(BaseSecret):
         :param default: Default value if key is not exist.
         :returns: Value based on given key or default one.
         """
-        self._authenticate()
+        if self.layout == "document":
+            data = self._call(self._read_documents, [self._shard_of(key)])
+            return data.get(key, default)
+        return self._call(self._read, key, default)
+
+    def _read(self, key: str, default: Any = "") -> Any:
+        """Read value of given key without authenticating the client.
+
+        :param key: Key name.
+        :param default: Default value if key is not exist.
+        :returns: Value based on given key or default one.
+        """
         sc = self.client.read(f"{self.prefix}/{key}")
 
         if not sc:
             return default
         return sc["data"]["value"]
 
+    @instrument
     def set(self, key: str, value: Any) -> bool:
         """Set key with given value.
 
@@ -149,41 +425,186 @@ class VaultSecret(BaseSecret):
         :param value: Value of the key.
         :returns: A ``bool`` to mark whether config is set or not.
         """
-        self._authenticate()
+        if self.layout == "document":
+            return self._call(self._write_documents, {key: value})
+
         val = {"value": safe_value(value)}
 
         # hvac.v1.Client.write checks for status code 200,
         # but Vault HTTP API returns 205 if request succeeded;
         # hence we're using lower level of `hvac.v1.Client` API to set key-val
-        response = self.client._adapter.post(
-            f"/v1/{self.prefix}/{key}", json=val
+        response = self._call(
+            self.client._adapter.post, f"/v1/{self.prefix}/{key}", json=val,
         )
         return response.status_code == 204
 
     def all(self) -> dict:  # pragma: no cover
         return self.get_all()
 
+    @instrument
     def get_all(self) -> dict:
         """Get all key-value pairs.
 
         :returns: A ``dict`` of key-value pairs (if any).
         """
-        self._authenticate()
-        result = self.client.list(self.prefix)
+        if self.layout == "document":
+            return self._call(self._read_documents, range(self.shards))
+        return self._get_all_keys()
+
+    def _get_all_keys(self) -> dict:
+        """Get all key-value pairs stored in ``keys`` layout.
+
+        :returns: A ``dict`` of key-value pairs (if any).
+        """
+        # authenticate once per batch
+        result = self._call(self.client.list, self.prefix)
         if not result:
             return {}
-        return {key: self.get(key) for key in result["data"]["keys"]}
 
+        keys = result["data"]["keys"]
+        if not keys:
+            return {}
+
+        # fetch values concurrently over the shared keep-alive session; each read is
+        # re-authenticated and retried if the token expires in the middle of the batch
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(keys))) as executor:
+            values = executor.map(in_current_context(partial(self._call, self._read)), keys)
+        return dict(zip(keys, values))
+
+    @instrument
     def set_all(self, data: dict[str, Any]) -> bool:
         """Set key-value pairs.
 
         :param data: Key-value pairs.
         :returns: A boolean to mark whether secret is set or not.
         """
+        if self.layout == "document":
+            return self._call(self._write_documents, data)
+
         for k, v in data.items():
             self.set(k, v)
         return True
 
+    def _document_path(self, shard: int) -> str:
+        """Get path of the document that holds given shard.
+
+        :param shard: Shard number.
+        :returns: Path relative to KV v2 mount point.
+        """
+        path = self.settings["GLUU_SECRET_VAULT_DOCUMENT_PATH"]
+        if self.shards > 1:
+            return f"{path}/{shard}"
+        return path
+
+    def _shard_of(self, key: str) -> int:
+        """Get shard number of given key.
+
+        :param key: Key name.
+        :returns: Shard number (stable across processes).
+        """
+        if self.shards == 1:
+            return 0
+        return zlib.crc32(key.encode()) % self.shards
+
+    def _read_document(self, shard: int) -> Tuple[dict[str, str], int]:
+        """Read a document.
+
+        :param shard: Shard number.
+        :returns: A tuple of key-value pairs and version of the document (``0`` if it doesn't exist).
+        """
+        try:
+            resp = self.client.secrets.kv.v2.read_secret_version(
+                path=self._document_path(shard),
+                mount_point=self.settings["GLUU_SECRET_VAULT_KV_MOUNT"],
+            )
+        except hvac.exceptions.InvalidPath:
+            doc: Tuple[dict[str, str], int] = ({}, 0)
+        else:
+            doc = (resp["data"]["data"] or {}, resp["data"]["metadata"]["version"])
+
+        with self._documents_lock:
+            self._documents[shard] = doc
+        return doc
+
+    def _read_documents(self, shards: Iterable[int]) -> dict[str, str]:
+        """Read documents (concurrently) and merge their key-value pairs.
+
+        :param shards: Shard numbers.
+        :returns: Merged key-value pairs.
+        """
+        shards = list(shards)
+        if len(shards) == 1:
+            docs = [self._read_document(shards[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(shards))) as executor:
+                docs = list(executor.map(in_current_context(self._read_document), shards))
+
+        data = {}
+        for doc, _ in docs:
+            data.update(doc)
+        return data
+
+    def _write_documents(self, data: dict[str, Any]) -> bool:
+        """Merge key-value pairs into documents using check-and-set writes.
+
+        Each affected document is written once, based on its last known contents and version;
+        if the document is changed by other client, it's re-read and the write is retried.
+
+        :param data: Key-value pairs.
+        :returns: A boolean to mark whether documents are written.
+        """
+        changes: dict[int, dict[str, str]] = {}
+        for key, value in data.items():
+            changes.setdefault(self._shard_of(key), {})[key] = safe_value(value)
+
+        for shard, values in changes.items():
+            for attempt in range(DOCUMENT_CAS_RETRIES):
+                with self._documents_lock:
+                    cached = self._documents.get(shard)
+                doc, version = cached if cached is not None else self._read_document(shard)
+
+                merged = dict(doc)
+                merged.update(values)
+
+                try:
+                    resp = self.client.secrets.kv.v2.create_or_update_secret(
+                        path=self._document_path(shard),
+                        secret=merged,
+                        cas=version,
+                        mount_point=self.settings["GLUU_SECRET_VAULT_KV_MOUNT"],
+                    )
+                except hvac.exceptions.InvalidRequest as exc:
+                    if "check-and-set" not in str(exc) or attempt == DOCUMENT_CAS_RETRIES - 1:
+                        raise
+                    # document is changed by other client; re-read it and try again
+                    self._read_document(shard)
+                    continue
+
+                with self._documents_lock:
+                    self._documents[shard] = (merged, resp["data"]["version"])
+                break
+        return True
+
+    def migrate_to_document(self, delete: bool = False) -> list[str]:
+        """Copy secrets stored in ``keys`` layout into document(s) used by ``document`` layout.
+
+        Existing key-value pairs in the documents are preserved, unless they are overwritten
+        by secrets being migrated.
+
+        :param delete: Whether to delete secrets stored in ``keys`` layout after they are copied.
+        :returns: Sorted list of migrated keys.
+        """
+        data = self._get_all_keys()
+        if not data:
+            return []
+
+        self._call(self._write_documents, data)
+
+        if delete:
+            for key in data:
+                self._call(self.client.delete, f"{self.prefix}/{key}")
+        return sorted(data)
+
     def _request_warning(self, scheme: str, verify: bool) -> None:
         """Emit warning about unverified request to unsecure Consul address.
 
@@ -0,0 +1,236 @@
+"""This module contains encrypted on-disk snapshot of config/secret key-value pairs."""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import namedtuple
+from typing import (
+    Any,
+    Callable,
+    Optional,
+)
+
+from cryptography.fernet import Fernet
+from cryptography.fernet import InvalidToken
+
+logger = logging.getLogger(__name__)
+
+#: Contents of loaded snapshot.
+SnapshotData = namedtuple("SnapshotData", ["data", "created_at", "digest"])
+
+
+def _digest(data: dict[str, Any]) -> str:
+    """Compute digest of key-value pairs.
+
+    :param data: Key-value pairs.
+    :returns: Hex digest of canonical JSON representation.
+    """
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def _read_snapshot_key(path: str) -> bytes:
+    """Read key material from a file.
+
+    The file can be either the salt file rendered by
+    :func:`~pygluu.containerlib.persistence.render_salt` (``encode_salt = <salt>``)
+    or a file that contains raw key material.
+
+    :param path: Path to key file.
+    :returns: Key material (empty ``bytes`` if file is missing).
+    """
+    try:
+        with open(path) as f:
+            txt = f.read()
+    except (FileNotFoundError, IsADirectoryError, PermissionError):
+        return b""
+
+    for line in txt.splitlines():
+        name, sep, value = line.partition("=")
+        if sep and name.strip() == "encode_salt":
+            return value.strip().encode()
+    return txt.strip().encode()
+
+
+class Snapshot:
+    """Encrypted on-disk snapshot of key-value pairs.
+
+    The snapshot is encrypted using Fernet (AES-CBC and HMAC-SHA256) with key derived
+    from the contents of ``key_file``, and holds metadata (creation time and digest of
+    key-value pairs) to determine its staleness and whether it needs to be rewritten.
+
+    :param path: Path to snapshot file.
+    :param key_file: Path to file contains key material.
+    :param max_staleness: Max. age (in seconds) of snapshot accepted as a fallback.
+    :param timer: Callable to get current (wall clock) time in seconds.
+    """
+
+    #: Version of snapshot format.
+    version = 1
+
+    def __init__(
+        self,
+        path: str,
+        key_file: str = "/etc/gluu/conf/salt",
+        max_staleness: float = 3600,
+        timer: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.key_file = key_file
+        self.max_staleness = max(0, max_staleness)
+        self.timer = timer
+
+        # digest and creation time of snapshot file, to avoid rewriting unchanged snapshot
+        self._digest = ""
+        self._created_at = 0.0
+
+    @classmethod
+    def from_env(cls, name: str) -> Optional["Snapshot"]:
+        """Create snapshot configured by environment variables.
+
+        Supported environment variables:
+
+        - ``GLUU_MANAGER_SNAPSHOT_DIR``: directory where snapshot files are stored;
+          snapshot is disabled if this variable is not set.
+        - ``GLUU_MANAGER_SNAPSHOT_KEY_FILE``: file contains key material
+          (default to ``/etc/gluu/conf/salt``).
+        - ``GLUU_MANAGER_SNAPSHOT_MAX_STALENESS``: max. age of snapshot (in seconds)
+          used when backend is unreachable (default to ``3600``).
+
+        :param name: Name of the snapshot, i.e. ``config`` or ``secret``.
+        :returns: Instance of :class:`Snapshot` or ``None`` if snapshot is disabled.
+        """
+        snapshot_dir = os.environ.get("GLUU_MANAGER_SNAPSHOT_DIR", "")
+        if not snapshot_dir:
+            return None
+
+        try:
+            max_staleness = float(os.environ.get("GLUU_MANAGER_SNAPSHOT_MAX_STALENESS", 3600))
+        except ValueError:
+            max_staleness = 3600
+
+        return cls(
+            os.path.join(snapshot_dir, f"{name}.snapshot"),
+            key_file=os.environ.get("GLUU_MANAGER_SNAPSHOT_KEY_FILE", "/etc/gluu/conf/salt"),
+            max_staleness=max_staleness,
+        )
+
+    def _get_fernet(self) -> Optional[Fernet]:
+        """Create Fernet instance using key derived from key file.
+
+        :returns: Instance of ``Fernet`` or ``None`` if key is not available.
+        """
+        material = _read_snapshot_key(self.key_file)
+        if not material:
+            return None
+
+        key = hashlib.sha256(b"gluu-manager-snapshot:" + material).digest()
+        return Fernet(base64.urlsafe_b64encode(key))
+
+    def age(self, snapshot: SnapshotData) -> float:
+        """Get age of snapshot (in seconds).
+
+        :param snapshot: Loaded snapshot.
+        :returns: Number of seconds since snapshot was created.
+        """
+        return max(0, self.timer() - snapshot.created_at)
+
+    def is_stale(self, snapshot: SnapshotData) -> bool:
+        """Check whether snapshot is older than max. staleness.
+
+        :param snapshot: Loaded snapshot.
+        :returns: A boolean to mark whether snapshot is stale.
+        """
+        return self.age(snapshot) > self.max_staleness
+
+    def load(self) -> Optional[SnapshotData]:
+        """Load and decrypt snapshot file.
+
+        :returns: Loaded snapshot or ``None`` if snapshot is missing, undecryptable, or malformed.
+        """
+        fernet = self._get_fernet()
+        if not fernet:
+            return None
+
+        try:
+            with open(self.path, "rb") as f:
+                token = f.read()
+                mtime = os.fstat(f.fileno()).st_mtime
+        except FileNotFoundError:
+            return None
+
+        try:
+            doc = json.loads(fernet.decrypt(token))
+            if doc["version"] != self.version:
+                raise ValueError(f"unsupported version {doc['version']}")
+            # unchanged snapshot is revalidated by refreshing its modification time (see :meth:`save`);
+            # modification time in the future is not trusted
+            created_at = max(float(doc["created_at"]), min(mtime, self.timer()))
+            snapshot = SnapshotData(doc["data"], created_at, doc["digest"])
+        except (InvalidToken, ValueError, KeyError, TypeError) as exc:
+            logger.warning(f"Unable to load snapshot {self.path}; reason={exc}")
+            return None
+
+        self._digest = snapshot.digest
+        self._created_at = snapshot.created_at
+        return snapshot
+
+    def save(self, data: dict[str, Any]) -> bool:
+        """Encrypt and save snapshot file atomically.
+
+        Unchanged key-value pairs (compared to loaded or saved snapshot) are not rewritten;
+        only the modification time of the file is refreshed, so the creation time of
+        the snapshot reflects the last successful revalidation.
+
+        :param data: Key-value pairs.
+        :returns: A boolean to mark whether snapshot file is written.
+        """
+        digest = _digest(data)
+        now = self.timer()
+        if digest == self._digest:
+            try:
+                os.utime(self.path, (now, now))
+            except OSError:
+                # snapshot file is removed, hence rewrite it
+                pass
+            else:
+                self._created_at = now
+                return False
+
+        fernet = self._get_fernet()
+        if not fernet:
+            logger.warning(f"Unable to save snapshot {self.path}; reason=missing key in {self.key_file}")
+            return False
+
+        doc = {
+            "version": self.version,
+            "created_at": now,
+            "digest": digest,
+            "data": data,
+        }
+        token = fernet.encrypt(json.dumps(doc).encode())
+
+        dirname = os.path.dirname(self.path) or "."
+        os.makedirs(dirname, exist_ok=True)
+
+        # write to temporary file (created with 0600 mode) and rename it,
+        # so readers never see partially written snapshot
+        fd, tmp_path = tempfile.mkstemp(dir=dirname, prefix=".snapshot-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(token)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+        self._digest = digest
+        self._created_at = now
+        return True
@@ -2,7 +2,9 @@
 
 import base64
 import contextlib
+import functools
 import json
+import lzma
 import os
 import pathlib
 import random
@@ -12,8 +14,12 @@ import socket
 import ssl
 import string
 import subprocess
+import tempfile
+import threading
+import zlib
 from typing import Any
 from typing import AnyStr
+from typing import Iterable
 from typing import Tuple
 from datetime import datetime
 from datetime import timedelta
@@ -22,18 +28,40 @@ from ipaddress import IPv4Address
 from cryptography.hazmat.primitives.ciphers import Cipher
 from cryptography.hazmat.primitives.ciphers import algorithms
 from cryptography.hazmat.primitives.ciphers import modes
-from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.backends import default_backend
 from cryptography import x509
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.x509.oid import NameOID
-from ldap3.utils import hashed
 
 # Default charset
 _DEFAULT_CHARS = "".join([string.ascii_letters, string.digits])
 
+# Supported modes of text encoding
+TEXT_ENCODE_MODES = ("3des", "aes-gcm")
+
+# Prefix of text encoded using AES-256 and GCM mode (version 1 of the format);
+# legacy (triple DES) text is plain base64 which never contains ``:`` character
+AES_GCM_PREFIX = b"gcm1:"
+
+# Header of versioned payload envelope, followed by version and codec bytes
+PAYLOAD_MAGIC = b"GLUU"
+
+PAYLOAD_VERSION = 1
+
+# Supported compression codecs of payload envelope (name and header byte)
+PAYLOAD_CODECS = {
+    "zlib": 1,
+    "lzma": 2,
+}
+
+# Header of raw xz stream (written by legacy ``lzma.compress`` calls)
+_LZMA_MAGIC = b"\xfd7zXZ\x00"
+
 
 def as_boolean(val: Any) -> bool:
     """Convert value as boolean.
@@ -207,6 +235,9 @@ def ldap_encode(password: AnyStr) -> str:
     :param password: A password with ``str`` or ``bytes`` type.
     :return: A string of encoded password.
     """
+    # imported on demand as ``ldap3`` is only needed by LDAP-related helpers
+    from ldap3.utils import hashed
+
     return hashed.hashed(hashed.HASHED_SALTED_SHA, password)
 
 
@@ -223,40 +254,239 @@ def anystr_to_bytes(val: AnyStr) -> bytes:
     return val
 
 
-def encode_text(text: AnyStr, key: AnyStr) -> bytes:
-    """Encode text using triple DES and ECB mode.
+def write_file_atomic(dest: str, contents: bytes, mode: int = 0o644) -> None:
+    """Write contents to a file atomically.
+
+    Contents are written into a temporary file in the same directory, then renamed
+    as destination file, so readers never see partially written file.
+    Permission of existing destination file is preserved.
+
+    :param dest: Absolute path to destination file.
+    :param contents: Contents of the file.
+    :param mode: Permission of newly created file, i.e. ``0o600`` for secrets.
+    """
+    dirname = os.path.dirname(dest) or "."
+
+    try:
+        mode = os.stat(dest).st_mode & 0o777
+    except FileNotFoundError:
+        pass
+
+    fd, tmp_path = tempfile.mkstemp(dir=dirname, prefix=f".{os.path.basename(dest)}-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(contents)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, dest)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+class Codec:
+    """Encode/decode text with a fixed key (salt).
+
+    Supported modes:
+
+    - ``3des`` (default): triple DES and ECB mode; this is the legacy format
+      that is also understood by Java-based Gluu Server components.
+    - ``aes-gcm``: AES-256 and GCM mode with random nonce and key derived
+      from the salt using HKDF-SHA256; encoded text is prefixed by ``AES_GCM_PREFIX``.
+
+    Decoding auto-detects the format of each text regardless of the mode.
+
+    Cipher contexts are created once and reused, so the key schedule is not recomputed
+    on each call. As ECB mode encrypts each block independently, the contexts are never
+    finalized; instead, padded data is passed through them under a lock, which makes
+    an instance safe to share between threads.
 
     .. code-block:: python
 
+        codec = Codec("a" * 24)
+
         # output: b'OdiOLVWUv7f8OzfNsuB5Fg=='
-        encode_text("secret text", "a" * 24)
+        codec.encode("secret text")
 
-    :param text: Plain text (``str`` or ``bytes``) need to be encoded.
-    :param key: Key used for encoding salt.
-    :returns: Encoded ``bytes`` text.
+        # output: [b'secret text', b'abcd']
+        codec.decode_many([b'OdiOLVWUv7f8OzfNsuB5Fg==', b'YgH8NDxhxmA='])
+
+        # output: b'gcm1:...'
+        Codec("a" * 24, mode="aes-gcm").encode("secret text")
+
+    :param salt: Key (``str`` or ``bytes``) used for encoding/decoding.
+    :param mode: Mode used for encoding, either ``3des`` or ``aes-gcm``.
     """
-    with contextlib.suppress(AttributeError):
-        # ``key`` must be a ``bytes``
-        key = key.encode()
 
-    with contextlib.suppress(AttributeError):
-        # ``text`` must be a ``bytes``
-        text = text.encode()
+    #: Block size of triple DES (in bytes).
+    block_size = algorithms.TripleDES.block_size // 8
+
+    #: Size of AES-GCM nonce (in bytes).
+    nonce_size = 12
+
+    def __init__(self, salt: AnyStr, mode: str = "3des") -> None:
+        if mode not in TEXT_ENCODE_MODES:
+            raise ValueError(f"Unsupported encode mode {mode}")
+
+        self.mode = mode
+        self._salt = anystr_to_bytes(salt)
+        self._lock = threading.Lock()
+
+        # cipher contexts are created on first use (salt may not be a valid 3DES key in ``aes-gcm`` mode)
+        self._encryptor = None
+        self._decryptor = None
+        self._aesgcm = None
+
+    def _get_3des_contexts(self) -> tuple:
+        """Get triple DES encryptor and decryptor contexts (must be called while holding the lock)."""
+        if self._encryptor is None:
+            cipher = Cipher(
+                algorithms.TripleDES(self._salt), modes.ECB(), backend=default_backend(),
+            )
+            self._encryptor = cipher.encryptor()
+            self._decryptor = cipher.decryptor()
+        return self._encryptor, self._decryptor
+
+    def _get_aesgcm(self) -> AESGCM:
+        """Get AES-GCM cipher with key derived from salt."""
+        if self._aesgcm is None:
+            key = HKDF(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=None,
+                info=b"gluu-text-encoding-aes-256-gcm",
+                backend=default_backend(),
+            ).derive(self._salt)
+            self._aesgcm = AESGCM(key)
+        return self._aesgcm
+
+    def _pad(self, data: bytes) -> bytes:
+        """Add PKCS7 padding."""
+        size = self.block_size - len(data) % self.block_size
+        return data + bytes([size]) * size
+
+    def _unpad(self, data: bytes) -> bytes:
+        """Remove PKCS7 padding."""
+        size = data[-1] if data else 0
+        if not 0 < size <= self.block_size or data[-size:] != bytes([size]) * size:
+            raise ValueError("Invalid padding bytes.")
+        return data[:-size]
+
+    def encode(self, text: AnyStr) -> bytes:
+        """Encode text.
+
+        :param text: Plain text (``str`` or ``bytes``) need to be encoded.
+        :returns: Encoded ``bytes`` text.
+        """
+        return self.encode_many([text])[0]
+
+    def decode(self, text: AnyStr) -> bytes:
+        """Decode text.
+
+        :param text: Encoded text (``str`` or ``bytes``) need to be decoded.
+        :returns: Decoded ``bytes`` text.
+        """
+        return self.decode_many([text])[0]
+
+    def encode_many(self, texts: Iterable[AnyStr]) -> list:
+        """Encode multiple texts (in a single pass through the cipher for ``3des`` mode).
+
+        :param texts: Plain texts (``str`` or ``bytes``) need to be encoded.
+        :returns: List of encoded ``bytes`` texts (in the same order).
+        """
+        if self.mode == "aes-gcm":
+            aesgcm = self._get_aesgcm()
+            result = []
+            for text in texts:
+                nonce = os.urandom(self.nonce_size)
+                encrypted = aesgcm.encrypt(nonce, anystr_to_bytes(text), None)
+                result.append(AES_GCM_PREFIX + base64.b64encode(nonce + encrypted))
+            return result
+
+        padded = [self._pad(anystr_to_bytes(text)) for text in texts]
+
+        with self._lock:
+            encryptor, _ = self._get_3des_contexts()
+            encrypted = encryptor.update(b"".join(padded))
+
+        result = []
+        offset = 0
+        for chunk in padded:
+            result.append(base64.b64encode(encrypted[offset:offset + len(chunk)]))
+            offset += len(chunk)
+        return result
+
+    def decode_many(self, texts: Iterable[AnyStr]) -> list:
+        """Decode multiple texts (legacy ``3des`` texts are decoded in a single pass through the cipher).
+
+        :param texts: Encoded texts (``str`` or ``bytes``) need to be decoded.
+        :returns: List of decoded ``bytes`` texts (in the same order).
+        """
+        texts = [anystr_to_bytes(text) for text in texts]
+        result = [b""] * len(texts)
+        legacy = []
+
+        for index, text in enumerate(texts):
+            if text.startswith(AES_GCM_PREFIX):
+                raw = base64.b64decode(text[len(AES_GCM_PREFIX):])
+                nonce, encrypted = raw[:self.nonce_size], raw[self.nonce_size:]
+                try:
+                    result[index] = self._get_aesgcm().decrypt(nonce, encrypted, None)
+                except InvalidTag:
+                    raise ValueError("Unable to decode text; invalid key or corrupted data.")
+                continue
+
+            chunk = base64.b64decode(text)
+            if not chunk or len(chunk) % self.block_size:
+                raise ValueError("The length of the provided data is not a multiple of the block length.")
+            legacy.append((index, chunk))
+
+        if legacy:
+            with self._lock:
+                _, decryptor = self._get_3des_contexts()
+                decrypted = decryptor.update(b"".join(chunk for _, chunk in legacy))
+
+            offset = 0
+            for index, chunk in legacy:
+                result[index] = self._unpad(decrypted[offset:offset + len(chunk)])
+                offset += len(chunk)
+        return result
+
+
+@functools.lru_cache(maxsize=32)
+def _get_codec(key: bytes, mode: str = "3des") -> Codec:
+    """Get cached :class:`Codec` instance for given key and mode.
+
+    :param key: Key used for encoding/decoding.
+    :param mode: Mode used for encoding.
+    :returns: Instance of :class:`Codec`.
+    """
+    return Codec(key, mode=mode)
 
-    cipher = Cipher(
-        algorithms.TripleDES(key), modes.ECB(), backend=default_backend(),
-    )
-    encryptor = cipher.encryptor()
 
-    padder = padding.PKCS7(algorithms.TripleDES.block_size).padder()
-    padded_data = padder.update(text) + padder.finalize()
+def encode_text(text: AnyStr, key: AnyStr, mode: str = "3des") -> bytes:
+    """Encode text using triple DES and ECB mode (default) or AES-256 and GCM mode.
 
-    encrypted_text = encryptor.update(padded_data) + encryptor.finalize()
-    return base64.b64encode(encrypted_text)
+    Note that values consumed by Java-based Gluu Server components must be encoded
+    using ``3des`` mode.
+
+    .. code-block:: python
+
+        # output: b'OdiOLVWUv7f8OzfNsuB5Fg=='
+        encode_text("secret text", "a" * 24)
+
+    :param text: Plain text (``str`` or ``bytes``) need to be encoded.
+    :param key: Key used for encoding salt.
+    :param mode: Mode used for encoding, either ``3des`` or ``aes-gcm``.
+    :returns: Encoded ``bytes`` text.
+    """
+    return _get_codec(anystr_to_bytes(key), mode).encode(text)
 
 
 def decode_text(text: AnyStr, key: AnyStr) -> bytes:
-    """Decode text using triple DES and ECB mode.
+    """Decode text encoded using triple DES and ECB mode or AES-256 and GCM mode.
+
+    The mode is detected from the encoded text.
 
     .. code-block:: python
 
@@ -267,22 +497,97 @@ def decode_text(text: AnyStr, key: AnyStr) -> bytes:
     :param key: Key used for decoding salt.
     :returns: Decoded ``bytes`` text.
     """
-    encoded_text = base64.b64decode(text)
+    return _get_codec(anystr_to_bytes(key)).decode(text)
 
-    with contextlib.suppress(AttributeError):
-        # ``key`` must be a ``bytes``
-        key = key.encode()
 
-    cipher = Cipher(
-        algorithms.TripleDES(key), modes.ECB(), backend=default_backend(),
-    )
-    decryptor = cipher.decryptor()
+def get_payload_compression() -> str:
+    """Get compression codec of payload envelope.
+
+    The codec is controlled by ``GLUU_PAYLOAD_COMPRESSION`` environment variable,
+    i.e. ``none`` (default; plain JSON, readable by older clients), ``zlib``, or ``lzma``.
+
+    Compression is opt-in, as older clients can't read the payload envelope. Roll it out in stages:
+    upgrade all containers that read the payload first (any version reads both formats),
+    then set ``GLUU_PAYLOAD_COMPRESSION`` on the writers.
+
+    :returns: Name of compression codec.
+    """
+    compression = os.environ.get("GLUU_PAYLOAD_COMPRESSION", "none").lower()
+    if compression not in PAYLOAD_CODECS and compression != "none":
+        raise ValueError(f"Unsupported payload compression {compression}")
+    return compression
+
+
+def dump_payload(data: Any, compression: str = "zlib") -> bytes:
+    """Serialize data as JSON and wrap it in a compressed payload envelope.
 
-    unpadder = padding.PKCS7(algorithms.TripleDES.block_size).unpadder()
-    padded_data = decryptor.update(encoded_text) + decryptor.finalize()
+    The envelope consists of ``PAYLOAD_MAGIC`` header, a version byte, a codec byte,
+    and the compressed JSON bytes.
 
-    # decrypt the encrypted text
-    return unpadder.update(padded_data) + unpadder.finalize()
+    .. code-block:: python
+
+        # output: b'GLUU\x01\x01x\x9c...'
+        dump_payload({"foo": "bar"})
+
+    :param data: JSON-serializable data.
+    :param compression: Name of compression codec (``zlib``, ``lzma``, or ``none``).
+    :returns: Payload ``bytes``.
+    """
+    payload = json.dumps(data).encode()
+
+    if compression == "none":
+        return payload
+
+    if compression == "zlib":
+        payload = zlib.compress(payload)
+    elif compression == "lzma":
+        payload = lzma.compress(payload)
+    else:
+        raise ValueError(f"Unsupported payload compression {compression}")
+    return PAYLOAD_MAGIC + bytes([PAYLOAD_VERSION, PAYLOAD_CODECS[compression]]) + payload
+
+
+def load_payload(payload: AnyStr) -> Any:
+    """Deserialize data from payload envelope.
+
+    The format is auto-detected, hence legacy payloads (plain JSON and raw ``lzma`` stream)
+    are loaded as well.
+
+    .. code-block:: python
+
+        # output: {'foo': 'bar'}
+        load_payload(dump_payload({"foo": "bar"}))
+
+    :param payload: Payload (``str`` or ``bytes``) created by :func:`dump_payload`.
+    :returns: Deserialized data.
+    :raises ValueError: If payload is malformed or truncated.
+    """
+    payload = anystr_to_bytes(payload)
+
+    if payload.startswith(PAYLOAD_MAGIC):
+        header_size = len(PAYLOAD_MAGIC) + 2
+        version, codec = payload[len(PAYLOAD_MAGIC):header_size]
+
+        if version != PAYLOAD_VERSION:
+            raise ValueError(f"Unsupported payload version {version}")
+
+        try:
+            if codec == PAYLOAD_CODECS["zlib"]:
+                payload = zlib.decompress(payload[header_size:])
+            elif codec == PAYLOAD_CODECS["lzma"]:
+                payload = lzma.decompress(payload[header_size:])
+            else:
+                raise ValueError(f"Unsupported payload codec {codec}")
+        except (zlib.error, lzma.LZMAError) as exc:
+            raise ValueError(f"Unable to decompress payload; reason={exc}")
+
+    elif payload.startswith(_LZMA_MAGIC):
+        # previously data is compressed using lzma without envelope
+        try:
+            payload = lzma.decompress(payload)
+        except lzma.LZMAError as exc:
+            raise ValueError(f"Unable to decompress payload; reason={exc}")
+    return json.loads(payload)
 
 
 def generate_ssl_certkey(suffix, email, hostname, org_name, country_code,
@@ -1,38 +1,98 @@
 """This module consists of startup order utilities."""
 
+import contextlib
+import functools
 import json
 import logging
+import math
 import os
+import random
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 
 import backoff
 import requests
 
-from pygluu.containerlib.persistence.couchbase import (
-    get_couchbase_user,
-    get_couchbase_password,
-    CouchbaseClient,
-)
+from pygluu.containerlib.registry import clients
+from pygluu.containerlib.registry import credentials_digest
 from pygluu.containerlib.utils import as_boolean
-from pygluu.containerlib.persistence.ldap import LdapClient
-from pygluu.containerlib.persistence.sql import SQLClient
-from pygluu.containerlib.persistence.spanner import SpannerClient
 
 
 logger = logging.getLogger(__name__)
 
+#: Dependencies that must be ready before checking other dependency (if both are passed to ``wait_for``).
+#:
+#: Each prerequisite is satisfied by either its full check or its ``*_conn`` variant,
+#: i.e. ``config`` or ``config_conn``.
+DEPENDENCY_REQUIREMENTS = {
+    "ldap": ("config", "secret"),
+    "ldap_conn": ("config", "secret"),
+    "couchbase": ("config", "secret"),
+    "couchbase_conn": ("config", "secret"),
+    "sql": ("config", "secret"),
+    "sql_conn": ("config", "secret"),
+    "spanner": ("config", "secret"),
+    "spanner_conn": ("config", "secret"),
+}
+
+#: Supported strategies of computing interval between retries (see :func:`get_wait_strategy`).
+WAIT_STRATEGIES = ("constant", "expo", "decorrelated")
+
+# deadline (as per ``time.monotonic``) of the ``wait_for`` call and name of
+# the ``wait_for_*`` check running in current thread
+_local = threading.local()
+
 
 class WaitError(Exception):
-    """Class to mark error while running ``wait_for_*`` functions."""
+    """Class to mark error while running ``wait_for_*`` functions.
+
+    When raised by :func:`wait_for`, the ``errors`` attribute contains
+    mapping of dependency name and its error.
+    """
+
+    def __init__(self, *args, errors=None):
+        super().__init__(*args)
+        self.errors = errors or {}
+
 
-    pass
+def _get_wait_setting(name: str, default, type_=int):
+    """Get value of a wait setting from environment variable.
+
+    When called by a ``wait_for_*`` function, the per-check variable
+    (i.e. ``GLUU_WAIT_MAX_TIME_COUCHBASE`` for ``wait_for_couchbase``)
+    takes precedence over the global one.
+
+    :param name: Name of the environment variable.
+    :param default: Default value if the variable is missing or invalid.
+    :param type_: Callable to convert the value.
+    """
+    names = [name]
+    check = getattr(_local, "check", None)
+    if check:
+        names.insert(0, f"{name}_{check.upper()}")
+
+    for env_name in names:
+        value = os.environ.get(env_name)
+        if value is None:
+            continue
+        try:
+            return type_(value)
+        except ValueError:
+            continue
+    return default
 
 
 def get_wait_max_time() -> int:
     """Get maximum time accepted by ``wait_for`` function.
 
     Default maximum time is 300 seconds. To change the value, pass
-    `GLUU_WAIT_MAX_TIME` environment variable.
+    `GLUU_WAIT_MAX_TIME` environment variable. The value can be overridden
+    per check by passing `GLUU_WAIT_MAX_TIME_<CHECK>` environment variable,
+    i.e. `GLUU_WAIT_MAX_TIME_COUCHBASE` for ``wait_for_couchbase``.
 
     .. code-block:: python
 
@@ -46,13 +106,17 @@ def get_wait_max_time() -> int:
         manager = get_manager()
         wait_for_config(manager)
 
+    When called by a check started by :func:`wait_for`, the value is capped
+    by the remaining time of the overall deadline.
+
     :returns: Wait maximum time (in seconds).
     """
-    default = 60 * 5
-    try:
-        max_time = int(os.environ.get("GLUU_WAIT_MAX_TIME", default))
-    except ValueError:
-        max_time = default
+    max_time = _get_wait_setting("GLUU_WAIT_MAX_TIME", 60 * 5)
+
+    # checks started by ``wait_for`` share its deadline
+    deadline = getattr(_local, "deadline", None)
+    if deadline is not None:
+        max_time = min(max_time, math.ceil(deadline - time.monotonic()))
     return max(1, max_time)
 
 
@@ -60,7 +124,10 @@ def get_wait_interval() -> int:
     """Get interval time between each execution of ``wait_for`` function.
 
     Default interval time is 10 seconds. To change the value, pass
-    `GLUU_WAIT_SLEEP_DURATION` environment variable.
+    `GLUU_WAIT_SLEEP_DURATION` environment variable. The value can be overridden
+    per check by passing `GLUU_WAIT_SLEEP_DURATION_<CHECK>` environment variable.
+
+    For ``expo`` and ``decorrelated`` strategies, the value is the max. interval.
 
     .. code-block:: python
 
@@ -76,12 +143,134 @@ def get_wait_interval() -> int:
 
     :returns: Wait interval (in seconds).
     """
-    default = 10
+    interval = _get_wait_setting("GLUU_WAIT_SLEEP_DURATION", 10)
+    return max(1, interval)
+
+
+def get_wait_base_interval() -> float:
+    """Get initial interval used by ``expo`` and ``decorrelated`` strategies.
+
+    Default initial interval is 1 second. To change the value, pass
+    `GLUU_WAIT_BASE_INTERVAL` environment variable (or `GLUU_WAIT_BASE_INTERVAL_<CHECK>`
+    for a specific check).
+
+    :returns: Initial interval (in seconds).
+    """
+    interval = _get_wait_setting("GLUU_WAIT_BASE_INTERVAL", 1.0, float)
+    return min(max(0.1, interval), get_wait_interval())
+
+
+def get_wait_strategy() -> str:
+    """Get strategy of computing interval between retries.
+
+    Supported strategies:
+
+    - ``constant`` (default): retry every :func:`get_wait_interval` seconds
+    - ``expo``: exponential interval starting from :func:`get_wait_base_interval`,
+      capped by :func:`get_wait_interval`, with full jitter
+    - ``decorrelated``: decorrelated jitter, i.e. random interval between
+      :func:`get_wait_base_interval` and 3 times the previous interval,
+      capped by :func:`get_wait_interval`
+
+    To change the value, pass `GLUU_WAIT_STRATEGY` environment variable
+    (or `GLUU_WAIT_STRATEGY_<CHECK>` for a specific check).
+    Unsupported value fallbacks to ``constant``.
+
+    :returns: Name of the strategy.
+    """
+    strategy = _get_wait_setting("GLUU_WAIT_STRATEGY", "constant", str).lower()
+    if strategy not in WAIT_STRATEGIES:
+        logger.warning(f"Unsupported wait strategy {strategy!r}; fallback to 'constant'")
+        strategy = "constant"
+    return strategy
+
+
+def wait_gen():
+    """Generate intervals between retries based on :func:`get_wait_strategy`.
+
+    This is a wait generator compatible with ``backoff.on_exception`` decorator.
+    """
+    strategy = get_wait_strategy()
+    max_interval = get_wait_interval()
+    base = get_wait_base_interval()
+
+    # advance past initial ``.send()`` call made by backoff
+    yield
+
+    interval = base
+    while True:
+        if strategy == "expo":
+            yield random.uniform(0, interval)  # nosec: B311
+            interval = min(max_interval, interval * 2)
+        elif strategy == "decorrelated":
+            interval = min(max_interval, random.uniform(base, interval * 3))  # nosec: B311
+            yield interval
+        else:
+            yield max_interval
+
+
+class RetryBudget:
+    """Token bucket that caps the rate of probes made by ``wait_for_*`` functions.
+
+    Each probe takes a token; when the bucket is empty, the probe is delayed until a token
+    is refilled, hence concurrent checks can't exceed ``rate`` probes per second
+    (after the initial ``burst``).
+
+    :param rate: Number of tokens refilled per second; ``0`` disables the budget.
+    :param burst: Max. number of tokens in the bucket.
+    :param timer: Monotonic clock function.
+    :param sleep: Sleep function.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, timer=time.monotonic, sleep=time.sleep) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.timer = timer
+        self.sleep = sleep
+        self.tokens = float(self.burst)
+        self.updated_at = timer()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token, waiting until it's available.
+
+        :returns: Time spent waiting for the token (in seconds).
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = self.timer()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+            # take the token in advance; negative tokens are the debt of waiting probes
+            self.tokens -= 1
+            delay = max(0.0, -self.tokens / self.rate)
+
+        if delay:
+            self.sleep(delay)
+        return delay
+
+
+def get_retry_budget() -> RetryBudget:
+    """Get retry budget shared by ``wait_for_*`` functions in current process.
+
+    The budget is configured by `GLUU_WAIT_RETRY_RATE` (probes per second; default to ``0``
+    which disables the budget) and `GLUU_WAIT_RETRY_BURST` (default to ``10``)
+    environment variables.
+
+    :returns: An instance of :class:`RetryBudget`.
+    """
     try:
-        interval = int(os.environ.get("GLUU_WAIT_SLEEP_DURATION", default))
+        rate = max(0.0, float(os.environ.get("GLUU_WAIT_RETRY_RATE", 0)))
     except ValueError:
-        interval = default
-    return max(1, interval)
+        rate = 0.0
+    try:
+        burst = int(os.environ.get("GLUU_WAIT_RETRY_BURST", 10))
+    except ValueError:
+        burst = 10
+    return clients.get(("wait", "budget", rate, burst), lambda: RetryBudget(rate, burst))
 
 
 def on_backoff(details: dict):
@@ -108,22 +297,125 @@ def on_giveup(details: dict):
     )
 
 
-#: A pre-configured alias of ``backoff.on_exception`` decorator.
-#:
-#: This decorator implies following setup:
-#:
-#: - each retry is executed with constant time
-#: - catch all ``Exception``
-retry_on_exception = backoff.on_exception(
-    backoff.constant,
-    Exception,
-    max_time=get_wait_max_time,
-    on_backoff=on_backoff,
-    on_success=on_success,
-    on_giveup=on_giveup,
-    jitter=None,
-    interval=get_wait_interval,
-)
+def _check_name(func) -> str:
+    """Get name of the check performed by a ``wait_for_*`` function, i.e. ``couchbase`` for ``wait_for_couchbase``."""
+    check = func.__name__
+    if check.startswith("wait_for_"):
+        check = check[len("wait_for_"):]
+    return check
+
+
+@contextlib.contextmanager
+def _check_context(check: str):
+    """Resolve wait settings of the given check (see :func:`_get_wait_setting`) within the context."""
+    previous = getattr(_local, "check", None)
+    _local.check = check
+    try:
+        yield
+    finally:
+        _local.check = previous
+
+
+def _check_max_time(func) -> int:
+    """Get max. time of the check performed by a ``wait_for_*`` function (regardless of any deadline)."""
+    with _check_context(_check_name(func)):
+        return max(1, _get_wait_setting("GLUU_WAIT_MAX_TIME", 60 * 5))
+
+
+def retry_on_exception(func):
+    """Decorate a ``wait_for_*`` function to retry it on exception.
+
+    The decorator implies following setup:
+
+    - interval between retries is computed by :func:`wait_gen`
+    - retries stop after :func:`get_wait_max_time` seconds
+    - each attempt takes a token from :func:`get_retry_budget`
+    - catch all ``Exception``
+
+    Settings are resolved per check, i.e. ``GLUU_WAIT_MAX_TIME_COUCHBASE``
+    is applied to ``wait_for_couchbase``.
+
+    :param func: Function to decorate.
+    """
+    check = _check_name(func)
+
+    @backoff.on_exception(
+        wait_gen,
+        Exception,
+        max_time=get_wait_max_time,
+        on_backoff=on_backoff,
+        on_success=on_success,
+        on_giveup=on_giveup,
+        jitter=None,
+    )
+    @functools.wraps(func)
+    def probe(*args, **kwargs):
+        get_retry_budget().acquire()
+        return func(*args, **kwargs)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _check_context(check):
+            return probe(*args, **kwargs)
+    return wrapper
+
+
+def run_once(func, *args, **kwargs):
+    """Run a ``wait_for_*`` function once, skipping the retries added by :func:`retry_on_exception`.
+
+    Per-check settings (i.e. ``GLUU_WAIT_MAX_TIME_COUCHBASE`` for ``wait_for_couchbase``)
+    are resolved as if the function is retried.
+
+    .. code-block:: python
+
+        with wait_deadline(time.monotonic() + 5):
+            run_once(wait_for_config, manager)
+
+    :param func: A ``wait_for_*`` function (decorated or not).
+    :returns: Result of the function.
+    """
+    with _check_context(_check_name(func)):
+        return getattr(func, "__wrapped__", func)(*args, **kwargs)
+
+
+@contextlib.contextmanager
+def _probe_client(key: tuple, factory):
+    """Get client used by ``wait_for_*`` functions, kept across retries.
+
+    Clients are stored in :data:`~pygluu.containerlib.registry.clients`; if the probe fails
+    with an unexpected error (e.g. dropped connection), the client is discarded,
+    so the next retry starts with a new one.
+
+    :param key: Key of the client (without ``wait`` prefix).
+    :param factory: Callable to create the client.
+    """
+    key = ("wait",) + key
+    client = clients.get(key, factory)
+    try:
+        yield client
+    except WaitError:
+        # backend is reachable but not ready yet
+        raise
+    except Exception:
+        clients.discard(key)
+        raise
+
+
+def _request_timeout() -> float:
+    """Get timeout of a single request made by ``wait_for_*`` function.
+
+    The timeout is the remaining time of the current deadline (see :func:`wait_deadline`),
+    or :func:`get_wait_max_time` if there's no deadline, so a request never outlives the check.
+    """
+    deadline = getattr(_local, "deadline", None)
+    if deadline is not None:
+        return max(0.1, deadline - time.monotonic())
+    return get_wait_max_time()
+
+
+def _http_session():
+    """Get ``requests.Session`` shared by HTTP-based ``wait_for_*`` functions, so connections are reused across retries."""
+    return clients.get(("wait", "http"), requests.Session)
 
 
 @retry_on_exception
@@ -137,9 +429,13 @@ def wait_for_config(manager, **kwargs):
     :param manager: An instance of :class:`~pygluu.containerlib.manager._Manager`.
     """
     conn_only = as_boolean(kwargs.get("conn_only", False))
-    hostname = manager.config.get("hostname")
+    if conn_only:
+        manager.config.get("hostname")
+        return
 
-    if not conn_only and not hostname:
+    # returns as soon as the key is set if the adapter supports change notifications
+    hostname = manager.config.wait_for_key("hostname", timeout=get_wait_max_time())
+    if not hostname:
         raise WaitError("Config 'hostname' is not available")
 
 
@@ -154,12 +450,35 @@ def wait_for_secret(manager, **kwargs):
     :param manager: An instance of :class:`~pygluu.containerlib.manager._Manager`.
     """
     conn_only = as_boolean(kwargs.get("conn_only", False))
-    ssl_cert = manager.secret.get("ssl_cert")
+    if conn_only:
+        manager.secret.get("ssl_cert")
+        return
 
-    if not conn_only and not ssl_cert:
+    # returns as soon as the key is set if the adapter supports change notifications
+    ssl_cert = manager.secret.wait_for_key("ssl_cert", timeout=get_wait_max_time())
+    if not ssl_cert:
         raise WaitError("Secret 'ssl_cert' is not available")
 
 
+@contextlib.contextmanager
+def _ldap_probe_client(manager):
+    """Get LDAP client (kept across retries) with its connection bound."""
+    from pygluu.containerlib.persistence.ldap import LdapClient
+
+    key = (
+        "ldap",
+        os.environ.get("GLUU_LDAP_URL", "localhost:1636"),
+        os.environ.get("GLUU_LDAP_USE_SSL", ""),
+        # password is not kept in the registry key as plaintext
+        credentials_digest(manager.config.get("ldap_binddn"), manager.secret.get("encoded_ox_ldap_pw")),
+    )
+    with _probe_client(key, lambda: LdapClient(manager)) as client:
+        # a bound connection stays open after searches, hence it's reused by next retry
+        if not client.conn.bound:
+            client.conn.bind()
+        yield client
+
+
 @retry_on_exception
 def wait_for_ldap(manager, **kwargs):
     """Wait for readiness/availability of LDAP server based on existing entry.
@@ -190,8 +509,8 @@ def wait_for_ldap(manager, **kwargs):
     else:
         search = default_search
 
-    client = LdapClient(manager)
-    entries = client.search(search[0], search[1], attributes=["objectClass"], limit=1)
+    with _ldap_probe_client(manager) as client:
+        entries = client.search(search[0], search[1], attributes=["objectClass"], limit=1)
     if not entries:
         raise WaitError("LDAP is not fully initialized")
 
@@ -202,7 +521,8 @@ def wait_for_ldap_conn(manager, **kwargs):
 
     :param manager: An instance of :class:`~pygluu.containerlib.manager._Manager`.
     """
-    connected = LdapClient(manager).is_connected()
+    with _ldap_probe_client(manager) as client:
+        connected = client.is_connected()
     if not connected:
         raise WaitError("LDAP is unreachable")
 
@@ -213,6 +533,12 @@ def wait_for_couchbase(manager, **kwargs):
 
     :param manager: An instance of :class:`~pygluu.containerlib.manager._Manager`.
     """
+    from pygluu.containerlib.persistence.couchbase import (
+        get_couchbase_user,
+        get_couchbase_password,
+        CouchbaseClient,
+    )
+
     host = os.environ.get("GLUU_COUCHBASE_URL", "localhost")
     user = get_couchbase_user(manager)
     password = get_couchbase_password(manager)
@@ -231,12 +557,12 @@ def wait_for_couchbase(manager, **kwargs):
     if persistence_type == "hybrid" and ldap_mapping == "default":
         bucket, key = f"{bucket_prefix}_user", "groups_60B7"
 
-    cb_client = CouchbaseClient(host, user, password)
-
-    req = cb_client.exec_query(
-        f"SELECT objectClass FROM {bucket} USE KEYS $key",
-        key=key,
-    )
+    client_key = ("couchbase", host, credentials_digest(user, password))
+    with _probe_client(client_key, lambda: CouchbaseClient(host, user, password)) as cb_client:
+        req = cb_client.exec_query(
+            f"SELECT objectClass FROM {bucket} USE KEYS $key",
+            key=key,
+        )
 
     if not req.ok:
         try:
@@ -258,12 +584,19 @@ def wait_for_couchbase_conn(manager, **kwargs):
 
     :param manager: An instance of :class:`~pygluu.containerlib.manager._Manager`.
     """
+    from pygluu.containerlib.persistence.couchbase import (
+        get_couchbase_user,
+        get_couchbase_password,
+        CouchbaseClient,
+    )
+
     host = os.environ.get("GLUU_COUCHBASE_URL", "localhost")
     user = get_couchbase_user(manager)
     password = get_couchbase_password(manager)
 
-    cb_client = CouchbaseClient(host, user, password)
-    req = cb_client.get_buckets()
+    client_key = ("couchbase", host, credentials_digest(user, password))
+    with _probe_client(client_key, lambda: CouchbaseClient(host, user, password)) as cb_client:
+        req = cb_client.get_buckets()
 
     if not req.ok:
         raise WaitError(f"Unable to connect to host in {host} list")
@@ -279,7 +612,7 @@ def wait_for_oxauth(manager, **kwargs):
     """
     addr = os.environ.get("GLUU_OXAUTH_BACKEND", "localhost:8081")
     url = f"http://{addr}/oxauth/.well-known/openid-configuration"
-    req = requests.get(url)
+    req = _http_session().get(url, timeout=_request_timeout())
 
     if not req.ok:
         raise WaitError(req.reason)
@@ -295,7 +628,7 @@ def wait_for_oxtrust(manager, **kwargs):
     """
     addr = os.environ.get("GLUU_OXTRUST_BACKEND", "localhost:8082")
     url = f"http://{addr}/identity/finishlogout.htm"
-    req = requests.get(url)
+    req = _http_session().get(url, timeout=_request_timeout())
 
     if not req.ok:
         raise WaitError(req.reason)
@@ -316,17 +649,48 @@ def wait_for_oxd(manager, **kwargs):
     addr = os.environ.get("GLUU_OXD_SERVER_URL", "localhost:8443")
     verify = as_boolean(os.environ.get("GLUU_OXD_SERVER_VERIFY", False))
     url = f"https://{addr}/health-check"
-    req = requests.get(url, verify=verify)
+    req = _http_session().get(url, verify=verify, timeout=_request_timeout())
 
     if not req.ok:
         raise WaitError(req.reason)
 
 
+def _sql_client_key() -> tuple:
+    """Get key of SQL client used by ``wait_for_sql*`` functions."""
+    return ("sql",) + tuple(
+        os.environ.get(name, "")
+        for name in (
+            "GLUU_SQL_DB_DIALECT",
+            "GLUU_SQL_DB_HOST",
+            "GLUU_SQL_DB_PORT",
+            "GLUU_SQL_DB_NAME",
+            "GLUU_SQL_DB_USER",
+            "GLUU_SQL_PASSWORD_FILE",
+        )
+    )
+
+
+def _spanner_client_key() -> tuple:
+    """Get key of Spanner client used by ``wait_for_spanner*`` functions."""
+    return ("spanner",) + tuple(
+        os.environ.get(name, "")
+        for name in (
+            "GOOGLE_APPLICATION_CREDENTIALS",
+            "GOOGLE_PROJECT_ID",
+            "GLUU_GOOGLE_SPANNER_INSTANCE_ID",
+            "GLUU_GOOGLE_SPANNER_DATABASE_ID",
+        )
+    )
+
+
 @retry_on_exception
 def wait_for_sql_conn(manager, **kwargs):
     """Wait for readiness/liveness of an SQL database connection."""
+    from pygluu.containerlib.persistence.sql import SQLClient
+
     # checking connection
-    init = SQLClient().connected()
+    with _probe_client(_sql_client_key(), SQLClient) as client:
+        init = client.connected()
     if not init:
         raise WaitError("SQL backend is unreachable")
 
@@ -334,7 +698,11 @@ def wait_for_sql_conn(manager, **kwargs):
 @retry_on_exception
 def wait_for_sql(manager, **kwargs):
     """Wait for readiness/liveness of an SQL database."""
-    init = SQLClient().row_exists("oxAuthClient", manager.config.get("oxauth_client_id"))
+    from pygluu.containerlib.persistence.sql import SQLClient
+
+    # only ``oxAuthClient`` table is reflected (once) instead of the whole schema
+    with _probe_client(_sql_client_key(), SQLClient) as client:
+        init = client.row_exists("oxAuthClient", manager.config.get("oxauth_client_id"))
 
     if not init:
         raise WaitError("SQL is not fully initialized")
@@ -343,8 +711,11 @@ def wait_for_sql(manager, **kwargs):
 @retry_on_exception
 def wait_for_spanner_conn(manager, **kwargs):
     """Wait for readiness/liveness of an Spanner database connection."""
+    from pygluu.containerlib.persistence.spanner import SpannerClient
+
     # checking connection
-    init = SpannerClient().connected()
+    with _probe_client(_spanner_client_key(), SpannerClient) as client:
+        init = client.connected()
     if not init:
         raise WaitError("Spanner backend is unreachable")
 
@@ -352,12 +723,88 @@ def wait_for_spanner_conn(manager, **kwargs):
 @retry_on_exception
 def wait_for_spanner(manager, **kwargs):
     """Wait for readiness/liveness of an Spanner database."""
-    init = SpannerClient().row_exists("oxAuthClient", manager.config.get("oxauth_client_id"))
+    from pygluu.containerlib.persistence.spanner import SpannerClient
+
+    with _probe_client(_spanner_client_key(), SpannerClient) as client:
+        init = client.row_exists("oxAuthClient", manager.config.get("oxauth_client_id"))
 
     if not init:
         raise WaitError("Spanner is not fully initialized")
 
 
+@contextlib.contextmanager
+def wait_deadline(deadline: float):
+    """Bound ``wait_for_*`` functions called in current thread by the given deadline.
+
+    Within the context, :func:`get_wait_max_time` is capped by the remaining time.
+
+    .. code-block:: python
+
+        import time
+
+        with wait_deadline(time.monotonic() + 5):
+            wait_for_config(manager)
+
+    :param deadline: Deadline as per ``time.monotonic``.
+    """
+    previous = getattr(_local, "deadline", None)
+    _local.deadline = deadline
+    try:
+        yield
+    finally:
+        _local.deadline = previous
+
+
+def _run_callback(callback: dict, manager, deadline: float) -> None:
+    """Run a ``wait_for_*`` function (in a worker thread) bounded by the given deadline."""
+    with wait_deadline(deadline):
+        callback["func"](manager, **callback["kwargs"])
+
+
+def _get_requirements(dep: str, deps: list) -> list:
+    """Get prerequisites of a dependency that are passed to ``wait_for``."""
+    requirements = []
+    for name in DEPENDENCY_REQUIREMENTS.get(dep, ()):
+        requirements.extend(
+            candidate for candidate in (name, f"{name}_conn") if candidate in deps
+        )
+    return requirements
+
+
+def get_wait_callbacks() -> dict:
+    """Get mapping of supported dependencies and their ``wait_for_*`` functions.
+
+    :returns: A mapping of dependency name and ``dict`` of function (``func``)
+              and its keyword arguments (``kwargs``).
+    """
+    return {
+        "config": {"func": wait_for_config, "kwargs": {"label": "Config"}},
+        "config_conn": {
+            "func": wait_for_config,
+            "kwargs": {"label": "Config", "conn_only": True},
+        },
+        "ldap": {"func": wait_for_ldap, "kwargs": {"label": "LDAP"}},
+        "ldap_conn": {"func": wait_for_ldap_conn, "kwargs": {"label": "LDAP"}},
+        "couchbase": {"func": wait_for_couchbase, "kwargs": {"label": "Couchbase"}},
+        "couchbase_conn": {
+            "func": wait_for_couchbase_conn,
+            "kwargs": {"label": "Couchbase"},
+        },
+        "secret": {"func": wait_for_secret, "kwargs": {"label": "Secret"}},
+        "secret_conn": {
+            "func": wait_for_secret,
+            "kwargs": {"label": "Secret", "conn_only": True},
+        },
+        "oxauth": {"func": wait_for_oxauth, "kwargs": {"label": "oxAuth"}},
+        "oxtrust": {"func": wait_for_oxtrust, "kwargs": {"label": "oxTrust"}},
+        "oxd": {"func": wait_for_oxd, "kwargs": {"label": "oxd"}},
+        "sql_conn": {"func": wait_for_sql_conn, "kwargs": {"label": "SQL"}},
+        "sql": {"func": wait_for_sql, "kwargs": {"label": "SQL"}},
+        "spanner_conn": {"func": wait_for_spanner_conn, "kwargs": {"label": "Spanner"}},
+        "spanner": {"func": wait_for_spanner, "kwargs": {"label": "Spanner"}},
+    }
+
+
 def wait_for(manager, deps=None):
     """Dispatch appropriate ``wait_for_*`` functions (if any).
 
@@ -379,6 +826,13 @@ def wait_for(manager, deps=None):
     - `spanner`
     - `spanner_conn`
 
+    Independent dependencies are checked concurrently, while dependencies listed
+    in :data:`DEPENDENCY_REQUIREMENTS` (i.e. persistence) are checked after their
+    prerequisites (i.e. `config` and `secret`) are ready. All checks share a single
+    deadline, set by the longest max. time of the requested checks
+    (``GLUU_WAIT_MAX_TIME`` or its per-check override, see :func:`get_wait_max_time`);
+    each check is still bounded by its own max. time.
+
     .. code-block:: python
 
         from pygluu.containerlib import get_manager
@@ -390,38 +844,60 @@ def wait_for(manager, deps=None):
 
     :param manager: An instance of :class:`~pygluu.containerlib.manager._Manager`.
     :param deps: An iterable of dependencies to check.
+    :raises WaitError: If any of the dependencies is not ready; errors of each dependency
+                       are available in its ``errors`` attribute.
     """
-    deps = deps or []
-    callbacks = {
-        "config": {"func": wait_for_config, "kwargs": {"label": "Config"}},
-        "config_conn": {
-            "func": wait_for_config,
-            "kwargs": {"label": "Config", "conn_only": True},
-        },
-        "ldap": {"func": wait_for_ldap, "kwargs": {"label": "LDAP"}},
-        "ldap_conn": {"func": wait_for_ldap_conn, "kwargs": {"label": "LDAP"}},
-        "couchbase": {"func": wait_for_couchbase, "kwargs": {"label": "Couchbase"}},
-        "couchbase_conn": {
-            "func": wait_for_couchbase_conn,
-            "kwargs": {"label": "Couchbase"},
-        },
-        "secret": {"func": wait_for_secret, "kwargs": {"label": "Secret"}},
-        "secret_conn": {
-            "func": wait_for_secret,
-            "kwargs": {"label": "Secret", "conn_only": True},
-        },
-        "oxauth": {"func": wait_for_oxauth, "kwargs": {"label": "oxAuth"}},
-        "oxtrust": {"func": wait_for_oxtrust, "kwargs": {"label": "oxTrust"}},
-        "oxd": {"func": wait_for_oxd, "kwargs": {"label": "oxd"}},
-        "sql_conn": {"func": wait_for_sql_conn, "kwargs": {"label": "SQL"}},
-        "sql": {"func": wait_for_sql, "kwargs": {"label": "SQL"}},
-        "spanner_conn": {"func": wait_for_spanner_conn, "kwargs": {"label": "Spanner"}},
-        "spanner": {"func": wait_for_spanner, "kwargs": {"label": "Spanner"}},
-    }
+    callbacks = get_wait_callbacks()
 
-    for dep in deps:
-        callback = callbacks.get(dep)
-        if not callback:
+    pending = []
+    for dep in deps or []:
+        if dep not in callbacks:
             logger.warning(f"Unsupported callback for {dep} dependency")
-            continue
-        callback["func"](manager, **callback["kwargs"])
+        elif dep not in pending:
+            pending.append(dep)
+
+    if not pending:
+        return
+
+    requirements = {dep: _get_requirements(dep, pending) for dep in pending}
+    deadline = time.monotonic() + max(_check_max_time(callbacks[dep]["func"]) for dep in pending)
+    ready = set()
+    errors = {}
+    futures = {}
+
+    with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix="gluu-wait") as executor:
+        while pending or futures:
+            for dep in list(pending):
+                failed = [req for req in requirements[dep] if req in errors]
+
+                if failed:
+                    errors[dep] = WaitError(f"Skipped as {', '.join(failed)} is not ready")
+                elif all(req in ready for req in requirements[dep]):
+                    if time.monotonic() >= deadline:
+                        errors[dep] = WaitError("Skipped as deadline is exceeded")
+                    else:
+                        future = executor.submit(_run_callback, callbacks[dep], manager, deadline)
+                        futures[future] = dep
+                else:
+                    # prerequisites are still being checked
+                    continue
+                pending.remove(dep)
+
+            if not futures:
+                # nothing is running, hence the remaining prerequisites can't be satisfied
+                for dep in pending:
+                    errors[dep] = WaitError("Skipped as its prerequisites are never checked")
+                break
+
+            done, _ = wait_futures(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                dep = futures.pop(future)
+                exc = future.exception()
+                if exc is None:
+                    ready.add(dep)
+                else:
+                    errors[dep] = exc
+
+    if errors:
+        reasons = "; ".join(f"{dep}: {exc}" for dep, exc in errors.items())
+        raise WaitError(f"Dependencies are not ready; {reasons}", errors=errors) from next(iter(errors.values()))
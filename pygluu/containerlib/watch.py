@@ -0,0 +1,401 @@
+"""This module contains mixins for adapters that keep a local copy of key-value pairs up-to-date."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Optional,
+)
+
+from pygluu.containerlib.utils import as_boolean
+
+logger = logging.getLogger(__name__)
+
+
+class WatchMixin:
+    """Keep a local mirror of key-value pairs up-to-date in a background thread.
+
+    Subclass calls :meth:`_init_watch` in its constructor and implements :meth:`_relist`
+    (initial synchronization) and :meth:`_watch_once` (wait for the next change),
+    both of which pass the new key-value pairs to :meth:`_replace_mirror`.
+
+    Each watcher thread has its own stop event (passed to the hooks), so a stopped watcher
+    that is still blocked in a request never touches the mirror after :meth:`unwatch`.
+    The mirror is never modified in place (a new ``dict`` is swapped in on every change),
+    hence readers can iterate it without locking.
+    """
+
+    #: Name of the setting that starts the watcher on first read.
+    watch_setting = ""
+
+    #: Name of the watcher thread.
+    watch_thread_name = "watcher"
+
+    #: Name of the watched resource (used in log messages).
+    watch_label = "backend"
+
+    def _init_watch(self) -> None:
+        """Initialize the watcher state."""
+        # local copy of (decoded) key-value pairs maintained by the watcher
+        self._mirror: Optional[dict[str, str]] = None
+        self._watch_lock = threading.Lock()
+        # serializes changes of the mirror made by the watcher and local writes
+        self._mirror_lock = threading.Lock()
+        self._watch_stop = threading.Event()
+        self._watch_stop.set()
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_callbacks: list[Callable[[str, Optional[str]], None]] = []
+
+    def watch(self, callback: Optional[Callable[[str, Optional[str]], None]] = None) -> None:
+        """Keep a local mirror of key-value pairs up-to-date.
+
+        Once the watcher is started, ``get`` and ``get_all`` are answered from the mirror.
+        The initial synchronization is done before this method returns, hence any error
+        while connecting to the backend is raised to the caller.
+
+        .. code-block:: python
+
+            def on_change(key, value):
+                # value is ``None`` if the key is deleted
+                print(key, value)
+
+            config = ConsulConfig()
+            config.watch(on_change)
+
+        :param callback: Optional callable that receives key and its new value on every change.
+        """
+        if callback:
+            self.add_watch_callback(callback)
+
+        with self._watch_lock:
+            if not self._watch_stop.is_set() and self._watch_thread and self._watch_thread.is_alive():
+                return
+
+            stop = threading.Event()
+            self._relist(stop)
+
+            self._watch_stop = stop
+            self._watch_thread = threading.Thread(
+                target=self._watch_loop, args=(stop,), name=self.watch_thread_name, daemon=True,
+            )
+            self._watch_thread.start()
+
+    def unwatch(self, timeout: float = 1) -> None:
+        """Stop the watcher and discard the local mirror.
+
+        The watcher may be blocked in a request (i.e. Consul blocking query) for a while;
+        it exits once the request returns, but it won't change the mirror anymore, hence
+        the next :meth:`watch` call starts a new watcher right away.
+
+        :param timeout: Max. time to wait for the watcher thread to exit (in seconds).
+        """
+        with self._watch_lock:
+            thread, self._watch_thread = self._watch_thread, None
+
+            with self._mirror_lock:
+                self._watch_stop.set()
+                self._mirror = None
+            self._reset_watch()
+
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def add_watch_callback(self, callback: Callable[[str, Optional[str]], None]) -> None:
+        """Register callable to be invoked on every changed key.
+
+        :param callback: Callable that receives key and its new value (``None`` if deleted).
+        """
+        self._watch_callbacks.append(callback)
+
+    def _get_mirror(self) -> Optional[dict[str, str]]:
+        """Get local mirror (if any).
+
+        The watcher is started automatically if the setting named by :attr:`watch_setting` is enabled.
+
+        :returns: A ``dict`` of key-value pairs or ``None`` if watcher is not running.
+        """
+        if self._mirror is None and as_boolean(self.settings[self.watch_setting]):
+            self.watch()
+        return self._mirror
+
+    def _relist(self, stop: threading.Event) -> None:
+        """Fetch all key-value pairs and replace the local mirror.
+
+        Subclass **MUST** implement this method.
+
+        :param stop: Stop event of the watcher.
+        """
+        raise NotImplementedError
+
+    def _watch_once(self, stop: threading.Event) -> None:
+        """Wait for the next change and apply it to the local mirror.
+
+        Subclass **MUST** implement this method.
+
+        :param stop: Stop event of the watcher.
+        """
+        raise NotImplementedError
+
+    def _reset_watch(self) -> None:
+        """Reset backend-specific watcher state (i.e. index of the last change)."""
+
+    def _watch_loop(self, stop: threading.Event) -> None:
+        """Watch changes until the watcher is stopped.
+
+        :param stop: Stop event of the watcher.
+        """
+        delay = 1
+
+        while not stop.is_set():
+            try:
+                self._watch_once(stop)
+                delay = 1
+            except Exception as exc:  # noqa: B902
+                logger.warning(f"Unable to watch {self.watch_label}; reason={exc}; retrying in {delay} seconds")
+                stop.wait(delay)
+                delay = min(delay * 2, 30)
+
+    def _replace_mirror(self, data: dict[str, str], stop: Optional[threading.Event] = None) -> bool:
+        """Replace local mirror and notify callbacks about changed keys.
+
+        :param data: Decoded key-value pairs.
+        :param stop: Stop event of the watcher; the mirror is not replaced if the watcher has been stopped.
+        :returns: A ``bool`` to mark whether the mirror is replaced.
+        """
+        with self._mirror_lock:
+            if stop is not None and stop.is_set():
+                return False
+
+            previous = self._mirror
+            self._mirror = data
+
+        # initial synchronization is not considered as changes
+        if previous is None:
+            return True
+
+        changes: dict[str, Optional[str]] = {
+            key: None for key in previous if key not in data
+        }
+        changes.update({
+            key: value for key, value in data.items()
+            if previous.get(key) != value
+        })
+        self._notify(changes)
+        return True
+
+    def _update_mirror(self, data: dict[str, str]) -> None:
+        """Apply local writes to the mirror (if the watcher is running).
+
+        :param data: Key-value pairs that have been written.
+        """
+        with self._mirror_lock:
+            if self._mirror is None:
+                return
+
+            mirror = dict(self._mirror)
+            changes = {k: v for k, v in data.items() if mirror.get(k) != v}
+            mirror.update(data)
+            self._mirror = mirror
+        self._notify(changes)
+
+    def _notify(self, changes: dict[str, Optional[str]]) -> None:
+        """Invoke registered callbacks for each changed key.
+
+        :param changes: Mapping of changed key and its new value.
+        """
+        for key, value in changes.items():
+            for callback in self._watch_callbacks:
+                try:
+                    callback(key, value)
+                except Exception as exc:  # noqa: B902
+                    logger.warning(f"Unable to run watch callback for {key}; reason={exc}")
+
+
+class KubernetesWatchMixin(WatchMixin):
+    """Watch a single ConfigMap or Secret using Kubernetes watch API.
+
+    The resource is read before the watcher starts, and subsequent changes are watched
+    starting from the read ``resourceVersion``. If the watch expires (HTTP 410 Gone),
+    the resource is read again.
+
+    Subclass sets :attr:`resource_api`, :attr:`name_setting` and :attr:`namespace_setting`,
+    and implements :meth:`_prepare_resource` and :meth:`_decode_data`.
+    """
+
+    #: Suffix of ``CoreV1Api`` methods, i.e. ``config_map`` for ``read_namespaced_config_map``.
+    resource_api = ""
+
+    #: Name of the setting that holds name of the resource.
+    name_setting = ""
+
+    #: Name of the setting that holds namespace of the resource.
+    namespace_setting = ""
+
+    def _init_watch(self) -> None:
+        super()._init_watch()
+        self._resource_version = ""
+
+    def _reset_watch(self) -> None:
+        self._resource_version = ""
+
+    def _prepare_resource(self) -> None:
+        """Create the resource if not exist.
+
+        Subclass **MUST** implement this method.
+        """
+        raise NotImplementedError
+
+    def _decode_data(self, data: Optional[dict[str, str]]) -> dict[str, str]:
+        """Decode data of the resource.
+
+        :param data: Data of the resource as returned by Kubernetes API.
+        :returns: Decoded key-value pairs.
+        """
+        return dict(data or {})
+
+    def _read_resource(self) -> Any:
+        """Read the resource.
+
+        :returns: The ``V1ConfigMap`` or ``V1Secret`` object.
+        """
+        read = getattr(self.client, f"read_namespaced_{self.resource_api}")
+        return read(self.settings[self.name_setting], self.settings[self.namespace_setting])
+
+    def _stream(self, watcher: Any, resource_version: Optional[str], timeout: int) -> Any:
+        """Stream events of the resource.
+
+        :param watcher: An instance of ``kubernetes.watch.Watch``.
+        :param resource_version: ``resourceVersion`` to watch from.
+        :param timeout: Max. duration of the stream (in seconds).
+        :returns: Iterator of watch events.
+        """
+        return watcher.stream(
+            getattr(self.client, f"list_namespaced_{self.resource_api}"),
+            self.settings[self.namespace_setting],
+            field_selector=f"metadata.name={self.settings[self.name_setting]}",
+            resource_version=resource_version,
+            timeout_seconds=timeout,
+        )
+
+    def wait_for_key(self, key: str, timeout: float, default: Any = "") -> Any:
+        """Wait until given key has non-empty value using Kubernetes watch API.
+
+        The resource is read once, then its changes are watched (starting from the read
+        ``resourceVersion``), hence the call returns as soon as the key is set,
+        instead of polling it periodically.
+
+        :param key: Key name.
+        :param timeout: Max. time to wait (in seconds).
+        :param default: Default value if key is not set.
+        :returns: Value of the key or default one.
+        """
+        import kubernetes.client
+        import kubernetes.watch
+
+        deadline = time.monotonic() + timeout
+
+        while True:
+            try:
+                result = self._read_resource()
+                data, resource_version = result.data or {}, result.metadata.resource_version
+            except kubernetes.client.rest.ApiException as exc:
+                if exc.status != 404:
+                    raise
+                # the resource will be created later
+                data, resource_version = {}, None
+
+            if data.get(key):
+                return self._decode_data({key: data[key]})[key]
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return default
+
+            watcher = kubernetes.watch.Watch()
+            for event in self._stream(watcher, resource_version, max(1, int(remaining))):
+                if event["type"] == "ERROR":
+                    status = event.get("raw_object", {})
+                    if status.get("code") == 410:
+                        # resourceVersion is too old, read the resource again
+                        watcher.stop()
+                        break
+                    raise kubernetes.client.rest.ApiException(
+                        status=status.get("code"), reason=status.get("message"),
+                    )
+
+                data = event["object"].data or {}
+                if event["type"] != "DELETED" and data.get(key):
+                    watcher.stop()
+                    return self._decode_data({key: data[key]})[key]
+
+    def _relist(self, stop: threading.Event) -> None:
+        """Fetch the resource and remember its ``resourceVersion``.
+
+        :param stop: Stop event of the watcher.
+        """
+        self._prepare_resource()
+        result = self._read_resource()
+        if self._sync_mirror(result.data, stop):
+            self._resource_version = result.metadata.resource_version
+
+    def _watch_once(self, stop: threading.Event) -> None:
+        """Consume a single watch stream.
+
+        :param stop: Stop event of the watcher.
+        """
+        import kubernetes.client
+        import kubernetes.watch
+
+        watcher = kubernetes.watch.Watch()
+
+        try:
+            for event in self._stream(watcher, self._resource_version, 300):
+                if stop.is_set():
+                    watcher.stop()
+                    return
+
+                if event["type"] == "ERROR":
+                    status = event.get("raw_object", {})
+                    if status.get("code") == 410:
+                        self._safe_relist(stop)
+                        watcher.stop()
+                        return
+                    raise kubernetes.client.rest.ApiException(
+                        status=status.get("code"), reason=status.get("message"),
+                    )
+
+                obj = event["object"]
+                data = {} if event["type"] == "DELETED" else obj.data
+                if not self._sync_mirror(data, stop):
+                    watcher.stop()
+                    return
+                self._resource_version = obj.metadata.resource_version
+        except kubernetes.client.rest.ApiException as exc:
+            if exc.status != 410:
+                raise
+            # resourceVersion is too old, read the resource again
+            self._safe_relist(stop)
+
+    def _safe_relist(self, stop: threading.Event) -> None:
+        """Re-read the resource without raising error.
+
+        :param stop: Stop event of the watcher.
+        """
+        try:
+            self._relist(stop)
+        except Exception as exc:  # noqa: B902
+            logger.warning(f"Unable to list {self.watch_label}; reason={exc}")
+            stop.wait(1)
+
+    def _sync_mirror(self, data: Optional[dict[str, str]], stop: Optional[threading.Event] = None) -> bool:
+        """Replace local copy with data of the resource.
+
+        :param data: Data of the resource.
+        :param stop: Stop event of the watcher.
+        :returns: A ``bool`` to mark whether the local copy is replaced.
+        """
+        return self._replace_mirror(self._decode_data(data), stop)
@@ -44,6 +44,9 @@ setup(
         "boto3>=1.26.21",
         "google-cloud-secret-manager>=2.2.0",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.7"],
+    },
     classifiers=[
         "Intended Audience :: Developers",
         "License :: OSI Approved :: Apache License 2.0",
@@ -1,6 +1,16 @@
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def reset_client_registry():
+    # managers and clients are memoized per process; discard them,
+    # so each test gets fresh instances
+    yield
+
+    from pygluu.containerlib.registry import clients
+    clients.reset()
+
+
 @pytest.fixture()
 def gconfig():
     from pygluu.containerlib.config.base_config import BaseConfig
@@ -109,3 +119,83 @@ def gk8s_meta():
     meta = KubernetesMeta()
     meta.kubeconfig_file = "tests/kubeconfig"
     yield meta
+
+
+class FakeAwsSecretsClient:
+    """In-memory stand-in of AWS Secrets Manager client."""
+
+    def __init__(self):
+        from collections import Counter
+
+        self.secrets = {}
+        self.calls = Counter()
+
+    def _find(self, name):
+        from botocore.exceptions import ClientError
+
+        if name not in self.secrets:
+            raise ClientError(
+                {"Error": {"Code": "ResourceNotFoundException", "Message": ""}},
+                "GetSecretValue",
+            )
+        return self.secrets[name]
+
+    def _put(self, name, **kwargs):
+        import uuid
+
+        version_id = str(uuid.uuid4())
+        secret = {"Name": name, "VersionId": version_id}
+        secret.update({k: v for k, v in kwargs.items() if k in ("SecretString", "SecretBinary")})
+        if isinstance(secret.get("SecretBinary"), str):
+            secret["SecretBinary"] = secret["SecretBinary"].encode()
+        self.secrets[name] = secret
+        return {"Name": name, "VersionId": version_id}
+
+    def create_secret(self, Name, **kwargs):
+        self.calls["create_secret"] += 1
+        return self._put(Name, **kwargs)
+
+    def update_secret(self, SecretId, **kwargs):
+        self.calls["update_secret"] += 1
+        self._find(SecretId)
+        return self._put(SecretId, **kwargs)
+
+    def describe_secret(self, SecretId):
+        self.calls["describe_secret"] += 1
+        secret = self._find(SecretId)
+        return {"Name": SecretId, "VersionIdsToStages": {secret["VersionId"]: ["AWSCURRENT"]}}
+
+    def get_secret_value(self, SecretId):
+        self.calls["get_secret_value"] += 1
+        return dict(self._find(SecretId))
+
+    def list_secrets(self, Filters):
+        self.calls["list_secrets"] += 1
+        prefix = Filters[0]["Values"][0]
+        return {
+            "SecretList": [
+                {"Name": name, "SecretVersionsToStages": {secret["VersionId"]: ["AWSCURRENT"]}}
+                for name, secret in self.secrets.items()
+                if name.startswith(prefix)
+            ]
+        }
+
+
+@pytest.fixture()
+def gaws_config():
+    from pygluu.containerlib.config import AwsConfig
+
+    config = AwsConfig()
+    config.client = FakeAwsSecretsClient()
+    config.replica_regions = []
+    yield config
+
+
+@pytest.fixture()
+def gaws_secret():
+    from pygluu.containerlib.secret import AwsSecret
+
+    secret = AwsSecret()
+    secret.client = FakeAwsSecretsClient()
+    secret.replica_regions = []
+    yield secret
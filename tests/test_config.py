@@ -4,6 +4,8 @@ import pytest
 
 
 KubeResult = namedtuple("KubeResult", ["data"])
+KubeObject = namedtuple("KubeObject", ["data", "metadata"])
+KubeMetadata = namedtuple("KubeMetadata", ["resource_version"])
 
 
 # ===========
@@ -130,12 +132,288 @@ def test_consul_config_request_warning(gconsul_config, caplog):
 
 def test_consul_config_set_all(gconsul_config, monkeypatch):
     monkeypatch.setattr(
-        "consul.Consul.KV.put",
-        lambda cls, k, v: True,
+        "consul.Consul.Txn.put",
+        lambda cls, payload: {"Results": [{"KV": {}} for _ in payload], "Errors": None},
     )
     assert gconsul_config.set_all({"foo": "bar"}) is True
 
 
+def test_consul_config_set_all_batches(gconsul_config, monkeypatch):
+    import base64
+
+    payloads = []
+
+    def txn_put(cls, payload):
+        payloads.append(payload)
+        return {"Results": [{"KV": {}} for _ in payload], "Errors": None}
+
+    monkeypatch.setattr("consul.Consul.Txn.put", txn_put)
+    gconsul_config.settings["GLUU_CONFIG_CONSUL_TXN_MAX_OPS"] = 2
+
+    assert gconsul_config.set_all({"a": "1", "b": 2, "c": True}) is True
+    assert [len(payload) for payload in payloads] == [2, 1]
+    assert payloads[1][0]["KV"] == {
+        "Verb": "set",
+        "Key": gconsul_config.prefix + "c",
+        "Value": base64.b64encode(b"true").decode(),
+    }
+
+
+def test_consul_config_set_all_rollback(gconsul_config, monkeypatch, caplog):
+    import json
+    from consul import ConsulException
+
+    def txn_put(cls, payload):
+        body = json.dumps({"Results": None, "Errors": [{"OpIndex": 0, "What": "failed"}]})
+        raise ConsulException(f"409 {body}")
+
+    monkeypatch.setattr("consul.Consul.Txn.put", txn_put)
+    assert gconsul_config.set_all({"foo": "bar"}) is False
+    assert "('foo', 'failed')" in caplog.text
+
+
+def test_consul_config_set_all_max_bytes(gconsul_config):
+    import json
+
+    payloads = []
+
+    class Txn:
+        def put(self, payload):
+            payloads.append(payload)
+            return {"Results": [{"KV": {}} for _ in payload], "Errors": None}
+
+    class Client:
+        txn = Txn()
+
+    gconsul_config.client = Client()
+    gconsul_config.settings["GLUU_CONFIG_CONSUL_TXN_MAX_BYTES"] = 1024
+
+    data = {"a": "x" * 300, "b": "y" * 300, "c": "z" * 300, "d": "small"}
+    assert gconsul_config.set_all(data) is True
+    assert [len(payload) for payload in payloads] == [2, 2]
+    assert all(len(json.dumps(payload)) <= 1024 for payload in payloads)
+
+
+def test_consul_config_set_all_not_atomic_across_batches(gconsul_config, monkeypatch):
+    from consul import ConsulException
+
+    written = {}
+
+    def txn_put(cls, payload):
+        if written:
+            raise ConsulException("409 rolled back")
+        written.update({op["KV"]["Key"]: op["KV"]["Value"] for op in payload})
+        return {"Results": [{"KV": {}} for _ in payload], "Errors": None}
+
+    monkeypatch.setattr("consul.Consul.Txn.put", txn_put)
+    gconsul_config.settings["GLUU_CONFIG_CONSUL_TXN_MAX_OPS"] = 2
+
+    # the 2nd batch is rolled back, but the 1st one has been written
+    assert gconsul_config.set_all({"a": "1", "b": "2", "c": "3"}) is False
+    assert sorted(written) == [gconsul_config.prefix + "a", gconsul_config.prefix + "b"]
+
+
+class AsyncConsulClient:
+    """Fake client of ``AsyncConsulConfig`` whose methods are coroutines."""
+
+    def __init__(self, data=None, fail_after=None):
+        self.data = dict(data or {})
+        self.payloads = []
+        self.fail_after = fail_after
+        self.kv = self
+        self.txn = self
+
+    async def get(self, key, recurse=False, **kwargs):
+        if recurse:
+            return 1, [{"Key": k, "Value": v.encode()} for k, v in self.data.items() if k.startswith(key)]
+        if key not in self.data:
+            return 1, None
+        return 1, {"Key": key, "Value": self.data[key].encode()}
+
+    async def put(self, payload_or_key, value=None):
+        import base64
+        from consul import ConsulException
+
+        if value is not None:
+            self.data[payload_or_key] = value
+            return True
+
+        if self.fail_after is not None and len(self.payloads) >= self.fail_after:
+            raise ConsulException('409 {"Errors": [{"OpIndex": 0, "What": "rolled back"}]}')
+        self.payloads.append(payload_or_key)
+        self.data.update({
+            op["KV"]["Key"]: base64.b64decode(op["KV"]["Value"]).decode() for op in payload_or_key
+        })
+        return {"Results": [{"KV": {}} for _ in payload_or_key], "Errors": None}
+
+
+@pytest.fixture()
+def gasync_consul_config(gconsul_config, monkeypatch):
+    pytest.importorskip("aiohttp")
+    from pygluu.containerlib.config import AsyncConsulConfig
+
+    client = AsyncConsulClient()
+    monkeypatch.setattr(AsyncConsulConfig, "client", property(lambda self: client))
+    yield AsyncConsulConfig(gconsul_config)
+
+
+def test_async_consul_config_get_set(gasync_consul_config):
+    import asyncio
+
+    async def main():
+        assert await gasync_consul_config.set("foo", {"bar": 1}) is True
+        return await gasync_consul_config.get("foo"), await gasync_consul_config.get("missing", "default")
+
+    assert asyncio.run(main()) == ('{"bar": 1}', "default")
+    assert gasync_consul_config.client.data == {"testing/config/foo": '{"bar": 1}'}
+
+
+def test_async_consul_config_set_all_batches(gasync_consul_config):
+    import asyncio
+
+    gasync_consul_config.config.settings["GLUU_CONFIG_CONSUL_TXN_MAX_OPS"] = 2
+    data = {"a": "1", "b": "2", "c": "3"}
+
+    assert asyncio.run(gasync_consul_config.set_all(data)) is True
+    assert [len(payload) for payload in gasync_consul_config.client.payloads] == [2, 1]
+    assert asyncio.run(gasync_consul_config.get_all()) == data
+
+
+def test_async_consul_config_set_all_rolled_back(gasync_consul_config, caplog):
+    import asyncio
+
+    gasync_consul_config.client.fail_after = 0
+
+    assert asyncio.run(gasync_consul_config.set_all({"a": "1"})) is False
+    assert "('a', 'rolled back')" in caplog.text
+
+
+def test_async_consul_config_mirror(gasync_consul_config):
+    import asyncio
+
+    gasync_consul_config.config._mirror = {"foo": "bar"}
+
+    assert asyncio.run(gasync_consul_config.get("foo")) == "bar"
+    assert asyncio.run(gasync_consul_config.get_all()) == {"foo": "bar"}
+    assert gasync_consul_config.client.data == {}
+
+
+def test_consul_config_watch_mirror(gconsul_config, monkeypatch):
+    monkeypatch.setattr(
+        "pygluu.containerlib.config.consul_config.ConsulConfig._watch_loop",
+        lambda cls, stop: None,
+    )
+    monkeypatch.setattr(
+        "consul.Consul.KV.get",
+        lambda cls, k, recurse: (
+            10,
+            [{"Key": gconsul_config.prefix + "foo", "Value": b"bar"}],
+        ),
+    )
+    gconsul_config.watch()
+
+    def _raise_exc(*args, **kwargs):
+        raise AssertionError("reads must be served by the mirror")
+
+    monkeypatch.setattr("consul.Consul.KV.get", _raise_exc)
+    assert gconsul_config.get("foo") == "bar"
+    assert gconsul_config.get("missing", "default") == "default"
+    assert gconsul_config.get_all() == {"foo": "bar"}
+
+
+def test_consul_config_watch_callback(gconsul_config):
+    changes = []
+    gconsul_config.add_watch_callback(lambda k, v: changes.append((k, v)))
+
+    gconsul_config._sync_mirror(1, [
+        {"Key": gconsul_config.prefix + "foo", "Value": b"bar"},
+        {"Key": gconsul_config.prefix + "lorem", "Value": b"ipsum"},
+    ])
+    # initial sync doesn't trigger callbacks
+    assert changes == []
+
+    gconsul_config._sync_mirror(2, [
+        {"Key": gconsul_config.prefix + "foo", "Value": b"baz"},
+    ])
+    assert sorted(changes) == [("foo", "baz"), ("lorem", None)]
+    assert gconsul_config._mirror_index == 2
+
+
+def test_consul_config_rewatch_while_blocked(gconsul_config):
+    import threading
+
+    # the first blocking query (made by the old watcher) waits for `release`,
+    # the next ones wait for `done`
+    release, done = threading.Event(), threading.Event()
+    queries = []
+    values = [b"bar"]
+
+    class KV:
+        def get(self, key, recurse=False, index=None, wait=None):
+            if index is not None:
+                queries.append(index)
+                (release if len(queries) == 1 else done).wait(5)
+            return 1, [{"Key": gconsul_config.prefix + "foo", "Value": values[0]}]
+
+    class Client:
+        kv = KV()
+
+    gconsul_config.client = Client()
+    gconsul_config.watch()
+    old_thread = gconsul_config._watch_thread
+
+    try:
+        gconsul_config.unwatch(timeout=0.1)
+        assert old_thread.is_alive()
+
+        # new watcher is started even though the old one is still blocked
+        gconsul_config.watch()
+        assert gconsul_config._watch_thread is not old_thread
+        assert gconsul_config.get_all() == {"foo": "bar"}
+
+        # stopped watcher doesn't touch the mirror of its successor
+        values[0] = b"stale"
+        release.set()
+        old_thread.join(5)
+        assert gconsul_config.get_all() == {"foo": "bar"}
+    finally:
+        done.set()
+        gconsul_config.unwatch()
+
+
+def test_consul_config_wait_for_key(gconsul_config):
+    calls = []
+
+    class KV:
+        def get(self, key, index=None, wait=None):
+            calls.append((key, index, wait))
+            if index is None:
+                return 10, None
+            # the key is set while blocking query is waiting
+            return 11, {"Value": b"demoexample.gluu.org"}
+
+    class Client:
+        kv = KV()
+
+    gconsul_config.client = Client()
+    assert gconsul_config.wait_for_key("hostname", timeout=60) == "demoexample.gluu.org"
+    assert calls[0] == (gconsul_config.prefix + "hostname", None, None)
+    assert calls[1][1] == 10
+    assert calls[1][2] == "60s"
+
+
+def test_consul_config_wait_for_key_timeout(gconsul_config):
+    class KV:
+        def get(self, key, index=None, wait=None):
+            return 10, None
+
+    class Client:
+        kv = KV()
+
+    gconsul_config.client = Client()
+    assert gconsul_config.wait_for_key("hostname", timeout=0, default="default") == "default"
+
+
 # =================
 # kubernetes config
 # =================
@@ -218,6 +496,31 @@ def test_k8s_config_incluster():
         config.client
 
 
+def test_k8s_config_watch_mirror(gk8s_config, monkeypatch):
+    gk8s_config.name_exists = True
+
+    monkeypatch.setattr(
+        "pygluu.containerlib.config.kubernetes_config.KubernetesConfig._watch_loop",
+        lambda cls, stop: None,
+    )
+    monkeypatch.setattr(
+        "kubernetes.client.CoreV1Api.read_namespaced_config_map",
+        lambda cls, n, ns: KubeObject(data={"foo": "bar"}, metadata=KubeMetadata("10")),
+    )
+    gk8s_config.watch()
+    assert gk8s_config._resource_version == "10"
+
+    def _raise_exc(*args, **kwargs):
+        raise AssertionError("reads must be served locally")
+
+    monkeypatch.setattr(
+        "kubernetes.client.CoreV1Api.read_namespaced_config_map",
+        _raise_exc,
+    )
+    assert gk8s_config.get("foo") == "bar"
+    assert gk8s_config.get_all() == {"foo": "bar"}
+
+
 def test_k8s_config_set_all(gk8s_config, monkeypatch):
     monkeypatch.setattr(
         "kubernetes.client.CoreV1Api.read_namespaced_config_map",
@@ -228,3 +531,116 @@ def test_k8s_config_set_all(gk8s_config, monkeypatch):
         lambda cls, n, ns, body: KubeResult(data={"foo": "bar"})
     )
     assert gk8s_config.set_all({"foo": "bar"}) is True
+
+
+# ==========
+# aws config
+# ==========
+
+
+def test_aws_config_get_all_unchanged(gaws_config):
+    gaws_config.set_all({"foo": "bar"})
+    gaws_config.client.calls.clear()
+
+    assert gaws_config.get("foo") == "bar"
+    assert gaws_config.get_all() == {"foo": "bar"}
+
+    # version is checked without downloading the payload
+    assert gaws_config.client.calls["get_secret_value"] == 0
+    assert gaws_config.client.calls["describe_secret"] == 2
+
+
+def test_aws_config_get_all_changed(gaws_config):
+    gaws_config.set_all({"foo": "bar"})
+
+    # simulate changes made by other client
+    gaws_config.client.update_secret(SecretId=gaws_config.basepath, SecretString='{"foo": "baz"}')
+    gaws_config.client.calls.clear()
+
+    assert gaws_config.get("foo") == "baz"
+    assert gaws_config.client.calls["get_secret_value"] == 1
+
+
+# ===========
+# file config
+# ===========
+
+
+def test_file_config_json(tmpdir, monkeypatch):
+    from pygluu.containerlib.config.file_config import FileConfig
+
+    path = tmpdir.join("conf", "config.json")
+    monkeypatch.setenv("GLUU_CONFIG_FILE_PATH", str(path))
+    config = FileConfig()
+
+    # missing file
+    assert config.get_all() == {}
+    assert config.get("foo", "default") == "default"
+
+    assert config.set_all({"foo": "bar", "num": 1}) is True
+    assert config.set("lorem", "ipsum") is True
+    assert config.get_all() == {"foo": "bar", "num": "1", "lorem": "ipsum"}
+    assert path.check(file=True)
+    # no leftover of temporary files
+    assert path.dirpath().listdir() == [path]
+
+
+def test_file_config_json_reload(tmpdir, monkeypatch):
+    import json
+    import os
+    from pygluu.containerlib.config.file_config import FileConfig
+
+    path = tmpdir.join("config.json")
+    path.write(json.dumps({"foo": "bar"}))
+    monkeypatch.setenv("GLUU_CONFIG_FILE_PATH", str(path))
+    config = FileConfig()
+    assert config.get("foo") == "bar"
+
+    # unchanged file is not parsed again
+    monkeypatch.setattr(config.store, "_read_json", lambda: {"foo": "stale"})
+    assert config.get("foo") == "bar"
+    monkeypatch.undo()
+
+    # file replaced by other writer
+    tmp = tmpdir.join("new.json")
+    tmp.write(json.dumps({"foo": "baz"}))
+    os.replace(str(tmp), str(path))
+    assert config.get("foo") == "baz"
+
+
+def test_file_config_json_invalid(tmpdir, monkeypatch):
+    from pygluu.containerlib.config.file_config import FileConfig
+
+    path = tmpdir.join("config.json")
+    path.write("[]")
+    monkeypatch.setenv("GLUU_CONFIG_FILE_PATH", str(path))
+
+    with pytest.raises(ValueError):
+        FileConfig().get_all()
+
+
+class FakeWatch:
+    events = []
+
+    def stream(self, func, namespace, **kwargs):
+        yield from self.events
+
+    def stop(self):
+        pass
+
+
+def test_k8s_config_wait_for_key(gk8s_config, monkeypatch):
+    class Client:
+        def read_namespaced_config_map(self, name, namespace):
+            return KubeObject(data={}, metadata=KubeMetadata(resource_version="1"))
+
+        def list_namespaced_config_map(self, namespace, **kwargs):
+            pass
+
+    monkeypatch.setattr(FakeWatch, "events", [
+        {"type": "MODIFIED", "object": KubeObject(data={"foo": "bar"}, metadata=KubeMetadata("2"))},
+        {"type": "MODIFIED", "object": KubeObject(data={"hostname": "demoexample.gluu.org"}, metadata=KubeMetadata("3"))},
+    ])
+    monkeypatch.setattr("kubernetes.watch.Watch", FakeWatch)
+    gk8s_config._client = Client()
+    assert gk8s_config.wait_for_key("hostname", timeout=60) == "demoexample.gluu.org"
@@ -0,0 +1,173 @@
+import json
+
+import pytest
+
+
+@pytest.fixture
+def health_monitor(monkeypatch):
+    from pygluu.containerlib import wait
+    from pygluu.containerlib.health import HealthMonitor
+
+    def failing_check(manager, **kwargs):
+        raise wait.WaitError("LDAP is unreachable")
+
+    monkeypatch.setattr(wait, "wait_for_config", lambda manager, **kwargs: None)
+    monkeypatch.setattr(wait, "wait_for_ldap", failing_check)
+
+    now = [100.0]
+    monitor = HealthMonitor(None, ["config", "ldap", "random"], interval=10, timer=lambda: now[0])
+    monitor.now = now
+    return monitor
+
+
+def test_health_monitor_status(health_monitor):
+    assert list(health_monitor.probes) == ["config", "ldap"]
+    assert health_monitor.status()["checks"]["config"]["error"] == "Not checked yet"
+
+    health_monitor.check_all()
+    status = health_monitor.status()
+
+    assert status["status"] == "fail"
+    assert status["checks"]["config"]["ok"] is True
+    assert status["checks"]["ldap"]["error"] == "LDAP is unreachable"
+    assert health_monitor.status(["config"])["status"] == "ok"
+
+
+def test_health_monitor_stale_result(health_monitor):
+    health_monitor.check("config")
+
+    health_monitor.now[0] += health_monitor.max_age + 1
+    check = health_monitor.status(["config"])["checks"]["config"]
+    assert check["ok"] is False
+    assert "older than" in check["error"]
+
+
+def test_health_monitor_skip_retry(monkeypatch):
+    from pygluu.containerlib import wait
+    from pygluu.containerlib.health import HealthMonitor
+
+    calls = []
+
+    @wait.retry_on_exception
+    def wait_for_oxauth(manager, **kwargs):
+        calls.append(1)
+        raise wait.WaitError("Service Unavailable")
+
+    monkeypatch.setattr(wait, "wait_for_oxauth", wait_for_oxauth)
+    result = HealthMonitor(None, ["oxauth"]).check("oxauth")
+
+    assert result.ok is False
+    # probe is not retried
+    assert calls == [1]
+
+
+def test_health_monitor_per_check_settings(monkeypatch):
+    from pygluu.containerlib import wait
+    from pygluu.containerlib.health import HealthMonitor
+
+    settings = []
+
+    @wait.retry_on_exception
+    def wait_for_oxauth(manager, **kwargs):
+        settings.append(wait._get_wait_setting("GLUU_WAIT_SLEEP_DURATION", 10))
+
+    monkeypatch.setenv("GLUU_WAIT_SLEEP_DURATION_OXAUTH", "3")
+    monkeypatch.setattr(wait, "wait_for_oxauth", wait_for_oxauth)
+    result = HealthMonitor(None, ["oxauth"]).check("oxauth")
+
+    assert result.ok is True
+    # per-check override is applied to the single attempt
+    assert settings == [3]
+
+
+def test_health_monitor_probe_timeout(monkeypatch):
+    import threading
+    from pygluu.containerlib import wait
+    from pygluu.containerlib.health import HealthMonitor
+
+    release = threading.Event()
+    calls = []
+
+    def wait_for_ldap(manager, **kwargs):
+        calls.append(1)
+        release.wait(5)
+
+    monkeypatch.setattr(wait, "wait_for_ldap", wait_for_ldap)
+    monitor = HealthMonitor(None, ["ldap"], timeout=0.2)
+
+    try:
+        result = monitor.check("ldap")
+        assert result.ok is False
+        assert result.error == "Timed out after 0.2 seconds"
+        assert result.duration < 1
+
+        # hanging probe is not started again
+        monitor.check("ldap")
+        assert calls == [1]
+    finally:
+        release.set()
+        monitor.stop()
+
+
+@pytest.mark.parametrize("path, code", [
+    ("/health", 503),
+    ("/health/config", 200),
+    ("/health/ldap", 503),
+    ("/random", 404),
+])
+def test_health_server(health_monitor, path, code):
+    import threading
+    import urllib.error
+    import urllib.request
+    from pygluu.containerlib.health import make_server
+
+    health_monitor.check_all()
+    server = make_server(health_monitor, "127.0.0.1:0")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}{path}") as resp:
+            status, body = resp.status, resp.read()
+    except urllib.error.HTTPError as exc:
+        status, body = exc.code, exc.read()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert status == code
+    assert json.loads(body)
+
+
+def test_health_server_unix_socket(health_monitor, tmpdir):
+    import socket
+    import threading
+    from pygluu.containerlib.health import make_server
+
+    health_monitor.check("config")
+    path = str(tmpdir.join("health.sock"))
+    server = make_server(health_monitor, f"unix:{path}")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(path)
+            sock.sendall(b"GET /health/config HTTP/1.0\r\n\r\n")
+            data = b"".join(iter(lambda: sock.recv(4096), b""))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    head, _, body = data.partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.0 200")
+    assert json.loads(body)["status"] == "ok"
+
+
+def test_health_server_unix_socket_keep_regular_file(health_monitor, tmpdir):
+    from pygluu.containerlib.health import make_server
+
+    path = tmpdir.join("health.sock")
+    path.write("data")
+
+    with pytest.raises(OSError):
+        make_server(health_monitor, f"unix:{path}")
+    assert path.read() == "data"
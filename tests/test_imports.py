@@ -0,0 +1,60 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = [
+    "boto3",
+    "consul",
+    "docker",
+    "google.cloud.secretmanager",
+    "google.cloud.spanner",
+    "hvac",
+    "kubernetes",
+    "ldap3",
+    "sqlalchemy",
+]
+
+
+def _imported_modules(stmt, **env):
+    code = "\n".join([
+        "import json, sys",
+        stmt,
+        f"print(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))",
+    ])
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        stdout=subprocess.PIPE,
+        check=True,
+        env=dict(os.environ, **env),
+    )
+    return json.loads(proc.stdout.decode().splitlines()[-1])
+
+
+@pytest.mark.parametrize("stmt", [
+    "import pygluu.containerlib",
+    "import pygluu.containerlib.wait",
+    "import pygluu.containerlib.persistence",
+    "import pygluu.containerlib.config, pygluu.containerlib.secret, pygluu.containerlib.meta",
+])
+def test_import_without_backend_sdks(stmt):
+    assert _imported_modules(stmt) == []
+
+
+def test_get_manager_imports_selected_adapters():
+    modules = _imported_modules(
+        "from pygluu.containerlib import get_manager; get_manager()",
+        GLUU_CONFIG_ADAPTER="consul",
+        GLUU_SECRET_ADAPTER="vault",
+    )
+    assert modules == ["consul", "hvac"]
+
+
+def test_lazy_package_attribute():
+    import pygluu.containerlib.config
+
+    assert "ConsulConfig" in dir(pygluu.containerlib.config)
+    with pytest.raises(AttributeError):
+        pygluu.containerlib.config.MissingConfig
@@ -1,4 +1,6 @@
+import asyncio
 import os
+import time
 
 import pytest
 
@@ -23,6 +25,7 @@ class GAdapter(object):
 @pytest.mark.parametrize("adapter, adapter_cls", [
     ("consul", "ConsulConfig"),
     ("kubernetes", "KubernetesConfig"),
+    ("file", "FileConfig"),
     ("random", "NoneType"),
 ])
 def test_config_manager(adapter, adapter_cls):
@@ -38,6 +41,7 @@ def test_config_manager(adapter, adapter_cls):
 @pytest.mark.parametrize("adapter, adapter_cls", [
     ("vault", "VaultSecret"),
     ("kubernetes", "KubernetesSecret"),
+    ("file", "FileSecret"),
     ("random", "NoneType"),
 ])
 def test_secret_manager(adapter, adapter_cls):
@@ -146,3 +150,349 @@ def test_manager_secret_from_file(
         "secret_key", str(dst), encode, binary_mode,
     )
     assert result == expected
+
+
+class CountingAdapter(object):
+    def __init__(self, data=None):
+        self.data = dict(data or {})
+        self.calls = {"get": 0, "get_all": 0}
+
+    def get(self, k, default=None):
+        self.calls["get"] += 1
+        return self.data.get(k) or default
+
+    def set(self, k, v):
+        self.data[k] = v
+        return True
+
+    def get_all(self):
+        self.calls["get_all"] += 1
+        return dict(self.data)
+
+    def set_all(self, data):
+        self.data.update(data)
+        return True
+
+
+def test_adapter_cache_ttl():
+    from pygluu.containerlib.manager import AdapterCache
+
+    now = [0]
+    cache = AdapterCache(ttl=10, timer=lambda: now[0])
+    cache.load({"foo": "bar"})
+    assert cache.get("foo") == (True, "bar")
+
+    now[0] = 11
+    assert cache.get("foo") == (False, None)
+    assert cache.fresh is False
+
+
+def test_adapter_cache_lru_eviction():
+    from pygluu.containerlib.manager import AdapterCache
+
+    cache = AdapterCache(ttl=10, maxsize=2)
+    cache.load({"a": "1", "b": "2"})
+    assert cache.complete is True
+
+    # mark `a` as recently used, hence `b` will be evicted
+    cache.get("a")
+    cache.update({"c": "3"})
+
+    assert cache.get_all() == {"a": "1", "c": "3"}
+    assert cache.complete is False
+
+
+def test_adapter_cache_invalidate():
+    from pygluu.containerlib.manager import AdapterCache
+
+    cache = AdapterCache(ttl=10)
+    cache.load({"a": "1", "b": "2"})
+
+    cache.invalidate(["a"])
+    assert cache.get("a") == (False, None)
+    assert cache.complete is False
+
+    cache.invalidate()
+    assert cache.fresh is False
+
+
+def test_adapter_cache_invalidate_uncached_key(monkeypatch):
+    from pygluu.containerlib.manager import ConfigManager
+
+    monkeypatch.setenv("GLUU_CONFIG_CACHE_TTL", "60")
+    manager = ConfigManager()
+    adapter = CountingAdapter({"foo": "bar"})
+    manager.adapter = adapter
+
+    assert manager.get("lorem", "default") == "default"
+
+    # key is written by other process, hence it is unknown to cache
+    adapter.data["lorem"] = "ipsum"
+    manager.cache.invalidate(["lorem"])
+    assert manager.cache.complete is False
+    assert manager.get("lorem", "default") == "ipsum"
+
+
+@pytest.mark.parametrize("manager_cls, prefix", [
+    ("ConfigManager", "GLUU_CONFIG_CACHE"),
+    ("SecretManager", "GLUU_SECRET_CACHE"),
+])
+def test_manager_cache_read_through(monkeypatch, manager_cls, prefix):
+    import pygluu.containerlib.manager
+
+    monkeypatch.setenv(f"{prefix}_TTL", "60")
+    manager = getattr(pygluu.containerlib.manager, manager_cls)()
+    adapter = CountingAdapter({"foo": "bar", "lorem": "ipsum", "empty": ""})
+    manager.adapter = adapter
+
+    assert manager.get("foo") == "bar"
+    assert manager.get("lorem") == "ipsum"
+    assert manager.get("missing", "default") == "default"
+    # cached empty value is not replaced by default
+    assert manager.get("empty", "default") == ""
+    assert manager.get_all() == {"foo": "bar", "lorem": "ipsum", "empty": ""}
+
+    # all reads are served by a single snapshot
+    assert adapter.calls == {"get": 0, "get_all": 1}
+
+
+def test_manager_cache_write_through(monkeypatch):
+    from pygluu.containerlib.manager import ConfigManager
+
+    monkeypatch.setenv("GLUU_CONFIG_CACHE_TTL", "60")
+    manager = ConfigManager()
+    adapter = CountingAdapter({"foo": "bar"})
+    manager.adapter = adapter
+
+    manager.get("foo")
+    manager.set("foo", "baz")
+    manager.set_all({"lorem": {"ipsum": 1}})
+
+    assert manager.get("foo") == "baz"
+    assert manager.get("lorem") == '{"ipsum": 1}'
+    assert adapter.calls["get_all"] == 1
+
+    manager.invalidate()
+    manager.get("foo")
+    assert adapter.calls["get_all"] == 2
+
+
+def test_manager_cache_disabled(monkeypatch):
+    from pygluu.containerlib.manager import ConfigManager
+
+    monkeypatch.delenv("GLUU_CONFIG_CACHE_TTL", raising=False)
+    manager = ConfigManager()
+    adapter = CountingAdapter({"foo": "bar"})
+    manager.adapter = adapter
+
+    manager.get("foo")
+    manager.get("foo")
+    assert adapter.calls == {"get": 2, "get_all": 0}
+
+
+class SlowAdapter(CountingAdapter):
+    def get(self, k, default=None):
+        time.sleep(0.2)
+        return super().get(k, default)
+
+
+def test_async_manager_get_concurrent():
+    from pygluu.containerlib.manager import AsyncConfigManager
+    from pygluu.containerlib.manager import ConfigManager
+
+    manager = ConfigManager()
+    manager.adapter = SlowAdapter({"foo": "bar", "lorem": "ipsum"})
+    async_manager = AsyncConfigManager(manager)
+
+    async def main():
+        return await asyncio.gather(*[
+            async_manager.get(key, "default") for key in ["foo", "lorem", "missing", "foo", "lorem"]
+        ])
+
+    start = time.monotonic()
+    assert asyncio.run(main()) == ["bar", "ipsum", "default", "bar", "ipsum"]
+    # calls are not serialized
+    assert time.monotonic() - start < 0.8
+
+
+def test_async_manager_cache_single_load(monkeypatch):
+    from pygluu.containerlib.manager import AsyncSecretManager
+
+    monkeypatch.setenv("GLUU_SECRET_CACHE_TTL", "60")
+    async_manager = AsyncSecretManager()
+    adapter = CountingAdapter({"foo": "bar"})
+    async_manager.manager.adapter = adapter
+
+    async def main():
+        await async_manager.set_all({"lorem": "ipsum"})
+        return await asyncio.gather(*[async_manager.get("foo") for _ in range(10)])
+
+    assert asyncio.run(main()) == ["bar"] * 10
+    assert adapter.calls["get_all"] == 1
+    assert async_manager.adapter is adapter
+
+
+class NativeAdapter(object):
+    """Fake native asyncio adapter wrapping ``CountingAdapter``."""
+
+    def __init__(self, adapter):
+        self.adapter = adapter
+        self.calls = {"get": 0, "get_all": 0}
+
+    async def get(self, k, default=None):
+        self.calls["get"] += 1
+        return self.adapter.data.get(k) or default
+
+    async def set(self, k, v):
+        self.adapter.data[k] = v
+        return True
+
+    async def get_all(self):
+        self.calls["get_all"] += 1
+        await asyncio.sleep(0.01)
+        return dict(self.adapter.data)
+
+    async def set_all(self, data):
+        self.adapter.data.update(data)
+        return True
+
+    async def wait_for_key(self, k, timeout, default=""):
+        return await self.get(k, default)
+
+    async def close(self):
+        pass
+
+
+def test_async_manager_native_adapter(monkeypatch):
+    from pygluu.containerlib.manager import AsyncConfigManager
+
+    monkeypatch.setenv("GLUU_CONFIG_CACHE_TTL", "60")
+    monkeypatch.setattr(AsyncConfigManager, "async_adapters", {"CountingAdapter": f"{__name__}.NativeAdapter"})
+    async_manager = AsyncConfigManager()
+    adapter = CountingAdapter({"foo": "bar"})
+    async_manager.manager.adapter = adapter
+
+    async def main():
+        values = await asyncio.gather(*[async_manager.get(key, "default") for key in ["foo", "missing"] * 5])
+        await async_manager.set("lorem", "ipsum")
+        values.append(await async_manager.get("lorem"))
+        await async_manager.close()
+        return values
+
+    assert asyncio.run(main()) == ["bar", "default"] * 5 + ["ipsum"]
+    native = async_manager.native_adapter
+    assert isinstance(native, NativeAdapter) and native.adapter is adapter
+    # snapshot is loaded once by the native adapter; blocking adapter is never called
+    assert native.calls == {"get": 0, "get_all": 1}
+    assert adapter.calls == {"get": 0, "get_all": 0}
+    # cache is shared with the wrapped manager
+    assert async_manager.manager.get("lorem") == "ipsum"
+
+
+def test_async_manager_native_adapter_fallback(monkeypatch, caplog):
+    from pygluu.containerlib.manager import AsyncConfigManager
+
+    monkeypatch.setattr(AsyncConfigManager, "async_adapters", {"CountingAdapter": "missing_module.NativeAdapter"})
+    async_manager = AsyncConfigManager()
+    adapter = CountingAdapter({"foo": "bar"})
+    async_manager.manager.adapter = adapter
+
+    assert asyncio.run(async_manager.get("foo")) == "bar"
+    assert async_manager.native_adapter is None
+    assert adapter.calls["get"] == 1
+    assert "calls are offloaded to executor" in caplog.text
+
+
+@pytest.mark.parametrize("native", [False, True])
+def test_async_secret_manager_to_file_mode(tmpdir, monkeypatch, native):
+    from pygluu.containerlib.manager import AsyncSecretManager
+
+    if native:
+        monkeypatch.setattr(AsyncSecretManager, "async_adapters", {"CountingAdapter": f"{__name__}.NativeAdapter"})
+    async_manager = AsyncSecretManager()
+    async_manager.manager.adapter = CountingAdapter({"server_cert": "cert"})
+    dest = tmpdir.join("server.crt")
+
+    asyncio.run(async_manager.to_file("server_cert", str(dest), mode=0o640))
+    assert dest.read() == "cert"
+    assert dest.stat().mode & 0o777 == 0o640
+    assert (async_manager.native_adapter is not None) is native
+
+
+def test_manager_secret_to_files(tmpdir):
+    from pygluu.containerlib.manager import SecretManager
+    from pygluu.containerlib.utils import encode_text
+
+    manager = SecretManager()
+    adapter = CountingAdapter({
+        "encoded_salt": "a" * 24,
+        "server_cert": "cert",
+        "server_jks": encode_text(b"\x00\xffjks", "a" * 24).decode(),
+    })
+    manager.adapter = adapter
+
+    # existing file keeps its permission
+    tmpdir.join("missing.txt").write("")
+    tmpdir.join("missing.txt").chmod(0o640)
+
+    manager.to_files({
+        "server_cert": str(tmpdir.join("server.crt")),
+        "server_jks": {"dest": str(tmpdir.join("server.jks")), "binary_mode": True, "mode": 0o644},
+        "missing": str(tmpdir.join("missing.txt")),
+    })
+
+    assert tmpdir.join("server.crt").read() == "cert"
+    assert tmpdir.join("server.jks").read_binary() == b"\x00\xffjks"
+    assert tmpdir.join("missing.txt").read() == ""
+    assert tmpdir.join("server.crt").stat().mode & 0o777 == 0o600
+    assert tmpdir.join("server.jks").stat().mode & 0o777 == 0o644
+    assert tmpdir.join("missing.txt").stat().mode & 0o777 == 0o640
+    # secrets are fetched once
+    assert adapter.calls == {"get": 0, "get_all": 1}
+
+
+def test_manager_secret_from_files(tmpdir):
+    from pygluu.containerlib.manager import SecretManager
+    from pygluu.containerlib.utils import decode_text
+
+    manager = SecretManager()
+    adapter = CountingAdapter({"encoded_salt": "a" * 24})
+    manager.adapter = adapter
+
+    tmpdir.join("server.crt").write("cert")
+    tmpdir.join("server.jks").write_binary(b"\x00\xffjks")
+
+    assert manager.from_files({
+        "server_cert": str(tmpdir.join("server.crt")),
+        "server_jks": {"src": str(tmpdir.join("server.jks")), "binary_mode": True},
+    })
+    assert adapter.data["server_cert"] == "cert"
+    assert decode_text(adapter.data["server_jks"], "a" * 24) == b"\x00\xffjks"
+
+
+def test_manager_secret_reencode_secrets():
+    from pygluu.containerlib.manager import SecretManager
+    from pygluu.containerlib.utils import decode_text
+
+    manager = SecretManager()
+    adapter = CountingAdapter({
+        "encoded_salt": "a" * 24,
+        "encoded_ox_ldap_pw": "YgH8NDxhxmA=",
+        "encoded_python_pw": "YgH8NDxhxmA=",
+        "encoded_invalid": "not-encoded",
+    })
+    manager.adapter = adapter
+
+    assert manager.reencode_secrets(["encoded_python_pw", "encoded_invalid"]) == ["encoded_python_pw"]
+    assert adapter.data["encoded_python_pw"].startswith("gcm1:")
+    assert decode_text(adapter.data["encoded_python_pw"], "a" * 24) == b"abcd"
+    assert adapter.data["encoded_invalid"] == "not-encoded"
+    # keys that are not selected (i.e. consumed by Java-based components) are untouched
+    assert adapter.data["encoded_ox_ldap_pw"] == "YgH8NDxhxmA="
+
+    # already migrated
+    assert manager.reencode_secrets(["encoded_python_pw"]) == []
+
+    # revert migration
+    assert manager.reencode_secrets(["encoded_python_pw"], mode="3des") == ["encoded_python_pw"]
+    assert adapter.data["encoded_python_pw"] == "YgH8NDxhxmA="
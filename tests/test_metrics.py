@@ -0,0 +1,186 @@
+import pytest
+
+
+@pytest.fixture
+def metrics_registry(monkeypatch):
+    from pygluu.containerlib import metrics
+
+    registry = metrics.MetricsRegistry(enabled=True, buckets=(0.1, 1.0))
+    monkeypatch.setattr(metrics, "registry", registry)
+    return registry
+
+
+class Adapter:
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def get(self, key):
+        from pygluu.containerlib.metrics import record_bytes
+
+        record_bytes(sent=len(key), received=3)
+        if self.fail:
+            raise ValueError("backend is unreachable")
+        return "bar"
+
+
+def _instrumented_adapter(fail=False):
+    from pygluu.containerlib.metrics import instrument
+
+    class ConsulLike(Adapter):
+        get = instrument(Adapter.get)
+    return ConsulLike(fail)
+
+
+def test_instrument_records_call(metrics_registry):
+    adapter = _instrumented_adapter()
+    assert adapter.get("foo") == "bar"
+
+    snapshot = metrics_registry.snapshot()
+    assert snapshot["ConsulLike.get"]["calls"] == 1
+    assert snapshot["ConsulLike.get"]["errors"] == 0
+    assert snapshot["ConsulLike.get"]["bytes_sent"] == 3
+    assert snapshot["ConsulLike.get"]["bytes_received"] == 3
+    assert snapshot["ConsulLike.get"]["duration_count"] == 1
+
+
+def test_instrument_records_error(metrics_registry):
+    adapter = _instrumented_adapter(fail=True)
+
+    with pytest.raises(ValueError):
+        adapter.get("foo")
+    assert metrics_registry.snapshot()["ConsulLike.get"]["errors"] == 1
+
+
+def test_instrument_disabled(metrics_registry):
+    metrics_registry.enabled = False
+    adapter = _instrumented_adapter()
+
+    assert adapter.get("foo") == "bar"
+    assert metrics_registry.snapshot() == {}
+
+
+def test_record_bytes_outside_instrumented_call(metrics_registry):
+    from pygluu.containerlib.metrics import record_bytes
+
+    # no-op
+    record_bytes(sent=10)
+    assert metrics_registry.snapshot() == {}
+
+
+def test_record_bytes_in_worker_threads(metrics_registry):
+    from concurrent.futures import ThreadPoolExecutor
+    from pygluu.containerlib.metrics import in_current_context
+    from pygluu.containerlib.metrics import instrument
+
+    class ConcurrentAdapter(Adapter):
+        @instrument
+        def get_all(self, keys):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                return list(executor.map(in_current_context(self.get), keys))
+
+    assert ConcurrentAdapter().get_all(["foo", "lorem", "ipsum", "bar"]) == ["bar"] * 4
+
+    snapshot = metrics_registry.snapshot()["ConcurrentAdapter.get_all"]
+    assert snapshot["bytes_sent"] == 16
+    assert snapshot["bytes_received"] == 12
+
+
+def test_instrument_nested_calls(metrics_registry):
+    from pygluu.containerlib.metrics import instrument
+
+    class NestedAdapter(Adapter):
+        get = instrument(Adapter.get)
+
+        @instrument
+        def get_all(self, keys):
+            return [self.get(key) for key in keys]
+
+    assert NestedAdapter().get_all(["foo", "lorem"]) == ["bar"] * 2
+
+    # bytes of nested calls are reported by the outermost call only
+    snapshot = metrics_registry.snapshot()
+    assert list(snapshot) == ["NestedAdapter.get_all"]
+    assert snapshot["NestedAdapter.get_all"]["calls"] == 1
+    assert snapshot["NestedAdapter.get_all"]["bytes_sent"] == 8
+    assert snapshot["NestedAdapter.get_all"]["bytes_received"] == 6
+
+
+@pytest.mark.parametrize("stream, headers, content, expected", [
+    (False, {"Content-Length": "5"}, b"", 5),
+    (False, {}, "h\u00e9llo", 6),
+    (True, {}, b"hello", 0),
+])
+def test_record_response_bytes(metrics_registry, stream, headers, content, expected):
+    from types import SimpleNamespace
+    from pygluu.containerlib.metrics import instrument
+    from pygluu.containerlib.metrics import record_response_bytes
+
+    class Response:
+        request = SimpleNamespace(body="caf\u00e9", headers={})
+
+        def __init__(self):
+            self.headers = headers
+
+        @property
+        def content(self):
+            if stream:
+                raise AssertionError("streamed body must not be read")
+            return content
+
+    @instrument
+    def call():
+        record_response_bytes(Response(), stream=stream)
+
+    call()
+    snapshot = metrics_registry.snapshot()["test_record_response_bytes.<locals>.call"]
+    # str bodies are measured in bytes, not characters
+    assert snapshot["bytes_sent"] == 5
+    assert snapshot["bytes_received"] == expected
+
+
+def test_registry_sink(metrics_registry):
+    observations = []
+
+    def failing_sink(observation):
+        raise RuntimeError("sink is broken")
+
+    metrics_registry.add_sink(failing_sink)
+    metrics_registry.add_sink(observations.append)
+    metrics_registry.observe("SQLClient.get", 0.5, bytes_received=10)
+    metrics_registry.remove_sink(observations.append)
+    metrics_registry.observe("SQLClient.get", 0.5)
+
+    assert len(observations) == 1
+    assert observations[0].operation == "SQLClient.get"
+    assert observations[0].bytes_received == 10
+
+
+def test_registry_render_prometheus(metrics_registry):
+    metrics_registry.observe("SQLClient.get", 0.05, bytes_sent=4)
+    metrics_registry.observe("SQLClient.get", 0.5)
+    metrics_registry.observe("SQLClient.get", 5, error=True)
+
+    text = metrics_registry.render_prometheus()
+    assert 'gluu_backend_calls_total{operation="SQLClient.get",status="ok"} 2' in text
+    assert 'gluu_backend_calls_total{operation="SQLClient.get",status="error"} 1' in text
+    assert 'gluu_backend_bytes_total{operation="SQLClient.get",direction="sent"} 4' in text
+    assert 'gluu_backend_call_duration_seconds_bucket{operation="SQLClient.get",le="0.1"} 1' in text
+    assert 'gluu_backend_call_duration_seconds_bucket{operation="SQLClient.get",le="1.0"} 2' in text
+    assert 'gluu_backend_call_duration_seconds_bucket{operation="SQLClient.get",le="+Inf"} 3' in text
+    assert 'gluu_backend_call_duration_seconds_count{operation="SQLClient.get"} 3' in text
+
+
+def test_registry_reset(metrics_registry):
+    metrics_registry.observe("SQLClient.get", 0.05)
+    metrics_registry.reset()
+    assert metrics_registry.snapshot() == {}
+
+
+def test_aws_secret_instrumented(gaws_secret, metrics_registry):
+    gaws_secret.set_all({"foo": "bar"})
+
+    snapshot = metrics_registry.snapshot()
+    assert snapshot["AwsSecret.set_all"]["calls"] == 1
+    # bytes sent by helpers are reported by the operation
+    assert snapshot["AwsSecret.set_all"]["bytes_sent"] > 0
+    assert "AwsSecret._update_secret_multipart" not in snapshot
@@ -611,6 +611,25 @@ def test_sql_client_init(monkeypatch, dialect):
     assert client.adapter.dialect == dialect
 
 
+def test_sql_client_row_exists_reflect_single_table():
+    from sqlalchemy import create_engine
+    from pygluu.containerlib.persistence.sql import SQLClient
+
+    client = SQLClient()
+    client._engine = create_engine("sqlite://")
+    client.engine.execute("CREATE TABLE oxAuthClient (doc_id VARCHAR(64) PRIMARY KEY)")
+    client.engine.execute("CREATE TABLE other (doc_id VARCHAR(64) PRIMARY KEY)")
+    client.engine.execute("INSERT INTO oxAuthClient (doc_id) VALUES ('1234')")
+
+    assert client.row_exists("oxAuthClient", "1234") is True
+    assert client.row_exists("oxAuthClient", "5678") is False
+    assert client.row_exists("random", "1234") is False
+
+    # whole schema is never reflected
+    assert client._metadata is None
+    assert list(client._tables) == ["oxAuthClient"]
+
+
 # =======
 # SPANNER
 # =======
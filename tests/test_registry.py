@@ -0,0 +1,153 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+
+class Client:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_registry_get_memoized():
+    from pygluu.containerlib.registry import ClientRegistry
+
+    registry = ClientRegistry()
+    client = registry.get(("consul", "localhost", 8500), Client)
+
+    assert registry.get(("consul", "localhost", 8500), Client) is client
+    assert registry.get(("consul", "localhost", 8501), Client) is not client
+    assert len(registry) == 2
+
+
+def test_registry_close():
+    from pygluu.containerlib.registry import ClientRegistry
+
+    class BrokenClient:
+        def close(self):
+            raise RuntimeError("connection is broken")
+
+    registry = ClientRegistry()
+    client = registry.get("client", Client)
+    registry.get("broken", BrokenClient)
+    registry.get("no-close", object)
+
+    registry.close()
+    assert client.closed is True
+    assert len(registry) == 0
+    assert registry.get("client", Client) is not client
+
+
+def test_registry_close_transport():
+    from pygluu.containerlib.registry import ClientRegistry
+
+    class GrpcClient:
+        def __init__(self):
+            self.transport = Client()
+
+    registry = ClientRegistry()
+    client = registry.get("google", GrpcClient)
+    registry.close()
+    assert client.transport.closed is True
+
+
+def test_registry_reset():
+    from pygluu.containerlib.registry import ClientRegistry
+
+    registry = ClientRegistry()
+    client = registry.get("client", Client)
+
+    registry.reset()
+    assert client.closed is False
+    assert "client" not in registry
+
+
+def test_registry_close_log_without_credentials(caplog):
+    from pygluu.containerlib.registry import ClientRegistry
+    from pygluu.containerlib.registry import credentials_digest
+
+    class BrokenClient:
+        def close(self):
+            raise RuntimeError("connection is broken")
+
+    registry = ClientRegistry()
+    key = ("consul", "localhost", credentials_digest("s3cr3t"))
+    registry.get(key, BrokenClient)
+    registry.discard(key)
+
+    assert "Unable to close consul client" in caplog.text
+    assert credentials_digest("s3cr3t") not in caplog.text
+    assert "s3cr3t" not in credentials_digest("s3cr3t")
+
+
+def test_get_kubernetes_api_client_shared(monkeypatch):
+    from pygluu.containerlib import registry
+
+    monkeypatch.setattr(registry, "clients", registry.ClientRegistry())
+    api_client = registry.clients.get(("kubernetes", "incluster"), object)
+
+    # in-cluster config is resolved beforehand, hence the client is shared
+    monkeypatch.setattr(registry, "_incluster_available", lambda: True)
+    assert registry.get_kubernetes_api_client("/root/.kube/config") is api_client
+    assert registry.get_kubernetes_api_client("/root/.kube/config", use_kube_config=False) is api_client
+
+
+def test_get_kubernetes_api_client_no_assert_hostname(monkeypatch):
+    from pygluu.containerlib import registry
+
+    monkeypatch.setattr(registry, "clients", registry.ClientRegistry())
+    monkeypatch.setattr(registry, "_incluster_available", lambda: True)
+    monkeypatch.setattr("kubernetes.config.load_incluster_config", lambda client_configuration: None)
+    monkeypatch.setattr("kubernetes.client.ApiClient", lambda configuration: SimpleNamespace(configuration=configuration))
+    shared = registry.clients.get(("kubernetes", "incluster"), object)
+
+    api_client = registry.get_kubernetes_api_client("/root/.kube/config", assert_hostname=False)
+    # client that skips hostname verification has its own configuration
+    assert api_client is not shared
+    assert api_client.configuration.assert_hostname is False
+    assert ("kubernetes", "incluster", "no-assert-hostname") in registry.clients
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not supported")
+def test_registry_reset_after_fork():
+    from pygluu.containerlib.registry import clients
+
+    clients.get("client", Client)
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        os._exit(0 if "client" not in clients else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+    assert "client" in clients
+
+
+def test_get_manager_memoized(monkeypatch):
+    from pygluu.containerlib.manager import get_manager
+
+    monkeypatch.setenv("GLUU_CONFIG_ADAPTER", "random")
+    monkeypatch.setenv("GLUU_SECRET_ADAPTER", "random")
+
+    manager = get_manager()
+    assert get_manager() is manager
+
+    # different settings yield different manager
+    monkeypatch.setenv("GLUU_SECRET_ENCODE_MODE", "aes-gcm")
+    assert get_manager() is not manager
+
+
+def test_get_async_manager_shares_manager(monkeypatch):
+    from pygluu.containerlib.manager import get_async_manager
+    from pygluu.containerlib.manager import get_manager
+
+    monkeypatch.setenv("GLUU_CONFIG_ADAPTER", "random")
+    monkeypatch.setenv("GLUU_SECRET_ADAPTER", "random")
+
+    async_manager = get_async_manager()
+    assert get_async_manager() is async_manager
+    assert async_manager.config.manager is get_manager().config
+    assert async_manager.secret.manager is get_manager().secret
@@ -5,6 +5,8 @@ import pytest
 
 
 KubeResult = namedtuple("KubeResult", ["data"])
+KubeObject = namedtuple("KubeObject", ["data", "metadata"])
+KubeMetadata = namedtuple("KubeMetadata", ["resource_version"])
 
 
 # ===========
@@ -170,6 +172,308 @@ def test_vault_secret_get_all(gvault_secret, monkeypatch):
     assert gvault_secret.get_all() == {"foo": "bar"}
 
 
+def test_vault_secret_get_all_authenticate_once(gvault_secret, monkeypatch):
+    calls = []
+
+    def is_authenticated(cls):
+        calls.append(1)
+        return True
+
+    monkeypatch.setattr("hvac.Client.is_authenticated", is_authenticated)
+    monkeypatch.setattr(
+        "hvac.Client.list",
+        lambda cls, key: {"data": {"keys": [f"key_{i}" for i in range(20)]}},
+    )
+    monkeypatch.setattr(
+        "hvac.Client.read",
+        lambda cls, key: {"data": {"value": key.rsplit("/", 1)[-1].upper()}},
+    )
+
+    result = gvault_secret.get_all()
+    assert result == {f"key_{i}": f"KEY_{i}" for i in range(20)}
+    assert list(result) == [f"key_{i}" for i in range(20)]
+    assert len(calls) == 1
+
+
+def test_vault_secret_token_lease_reused(gvault_secret, monkeypatch):
+    calls = {"is_authenticated": 0, "login": 0}
+
+    def is_authenticated(cls):
+        calls["is_authenticated"] += 1
+        return False
+
+    def login(cls, role_id, secret_id, use_token):
+        calls["login"] += 1
+        return {"auth": {"client_token": "token", "lease_duration": 3600, "renewable": False}}
+
+    monkeypatch.setattr("hvac.Client.is_authenticated", is_authenticated)
+    monkeypatch.setattr("hvac.api.auth_methods.approle.AppRole.login", login)
+    monkeypatch.setattr("hvac.Client.read", lambda cls, key: {"data": {"value": "bar"}})
+
+    for _ in range(3):
+        assert gvault_secret.get("foo") == "bar"
+
+    # token is checked and issued only once
+    assert calls == {"is_authenticated": 1, "login": 1}
+    assert gvault_secret.client.token == "token"
+
+
+def test_vault_secret_token_lease_expired(gvault_secret, monkeypatch):
+    now = [0]
+    tokens = iter(["token-1", "token-2"])
+
+    monkeypatch.setattr("hvac.Client.is_authenticated", lambda cls: False)
+    monkeypatch.setattr(
+        "hvac.api.auth_methods.approle.AppRole.login",
+        lambda cls, role_id, secret_id, use_token: {
+            "auth": {"client_token": next(tokens), "lease_duration": 60, "renewable": False},
+        },
+    )
+    gvault_secret._lease.timer = lambda: now[0]
+
+    gvault_secret._authenticate()
+    assert gvault_secret.client.token == "token-1"
+
+    now[0] = 30
+    gvault_secret._authenticate()
+    assert gvault_secret.client.token == "token-1"
+
+    # token is re-issued shortly before it expires
+    now[0] = 58
+    gvault_secret._authenticate()
+    assert gvault_secret.client.token == "token-2"
+
+
+def test_vault_secret_external_token_rechecked(gvault_secret, monkeypatch, tmpdir):
+    now = [0]
+    calls = {"is_authenticated": 0}
+
+    def is_authenticated(cls):
+        calls["is_authenticated"] += 1
+        return True
+
+    def login(cls, role_id, secret_id, use_token):
+        raise AssertionError("externally issued token must not be replaced by AppRole login")
+
+    # no role ID and secret ID files
+    gvault_secret.settings["GLUU_SECRET_VAULT_ROLE_ID_FILE"] = str(tmpdir.join("role_id"))
+    gvault_secret.settings["GLUU_SECRET_VAULT_SECRET_ID_FILE"] = str(tmpdir.join("secret_id"))
+    gvault_secret._lease.timer = lambda: now[0]
+
+    monkeypatch.setattr("hvac.Client.is_authenticated", is_authenticated)
+    monkeypatch.setattr("hvac.api.auth_methods.approle.AppRole.login", login)
+
+    gvault_secret._authenticate()
+    assert calls["is_authenticated"] == 1
+
+    # token is checked again once the check interval has passed
+    now[0] = 61
+    gvault_secret._authenticate()
+    assert calls["is_authenticated"] == 2
+    assert gvault_secret._lease.is_valid() is True
+
+
+def test_vault_secret_token_forbidden_retry(gvault_secret, monkeypatch):
+    import hvac.exceptions
+
+    responses = iter([hvac.exceptions.Forbidden(), {"data": {"value": "bar"}}])
+    logins = []
+
+    def read(cls, key):
+        resp = next(responses)
+        if isinstance(resp, Exception):
+            raise resp
+        return resp
+
+    def login(cls, role_id, secret_id, use_token):
+        logins.append(1)
+        return {"auth": {"client_token": "token", "lease_duration": 3600}}
+
+    monkeypatch.setattr("hvac.Client.is_authenticated", lambda cls: False)
+    monkeypatch.setattr("hvac.api.auth_methods.approle.AppRole.login", login)
+    monkeypatch.setattr("hvac.Client.read", read)
+
+    # token revoked before its expiry is re-issued
+    assert gvault_secret.get("foo") == "bar"
+    assert len(logins) == 2
+
+
+def test_vault_secret_get_all_forbidden_retry(gvault_secret, monkeypatch):
+    import hvac.exceptions
+
+    revoked = [True]
+    logins = []
+
+    def read(cls, key):
+        # token is revoked in the middle of the batch
+        if key.endswith("key_5") and revoked[0]:
+            revoked[0] = False
+            raise hvac.exceptions.Forbidden()
+        return {"data": {"value": key.rsplit("/", 1)[-1].upper()}}
+
+    def login(cls, role_id, secret_id, use_token):
+        logins.append(1)
+        return {"auth": {"client_token": "token", "lease_duration": 3600}}
+
+    monkeypatch.setattr("hvac.Client.is_authenticated", lambda cls: False)
+    monkeypatch.setattr("hvac.api.auth_methods.approle.AppRole.login", login)
+    monkeypatch.setattr(
+        "hvac.Client.list",
+        lambda cls, key: {"data": {"keys": [f"key_{i}" for i in range(10)]}},
+    )
+    monkeypatch.setattr("hvac.Client.read", read)
+
+    assert gvault_secret.get_all() == {f"key_{i}": f"KEY_{i}" for i in range(10)}
+    assert len(logins) == 2
+
+
+def test_vault_secret_token_renew(gvault_secret, monkeypatch):
+    now = [0]
+    gvault_secret._lease.timer = lambda: now[0]
+    gvault_secret._lease.update({"lease_duration": 60, "renewable": True})
+
+    monkeypatch.setattr(
+        "hvac.api.auth_methods.token.Token.renew_self",
+        lambda cls: {"auth": {"lease_duration": 120, "renewable": False}},
+    )
+    # simulate elapsed time, so renewal is not delayed
+    now[0] = 60
+    gvault_secret._renew_loop()
+
+    assert gvault_secret._lease.expires_at == 180
+    assert gvault_secret._lease.renewable is False
+
+
+@pytest.mark.parametrize("auth, expected", [
+    ({}, 60),
+    ({"lease_duration": 0}, float("inf")),
+    ({"lease_duration": 30}, 30),
+])
+def test_vault_token_lease_update(auth, expected):
+    from pygluu.containerlib.secret.vault_secret import _TokenLease
+
+    lease = _TokenLease(timer=lambda: 0)
+    assert lease.is_valid() is False
+
+    lease.update(auth)
+    assert lease.expires_at == expected
+    assert lease.is_valid() is True
+
+    lease.invalidate()
+    assert lease.is_valid() is False
+
+
+class FakeKvV2:
+    def __init__(self):
+        self.documents = {}
+        self.requests = 0
+
+    def read_secret_version(self, cls, path, mount_point):
+        import hvac.exceptions
+
+        self.requests += 1
+        if path not in self.documents:
+            raise hvac.exceptions.InvalidPath()
+        data, version = self.documents[path]
+        return {"data": {"data": dict(data), "metadata": {"version": version}}}
+
+    def create_or_update_secret(self, cls, path, secret, cas, mount_point):
+        import hvac.exceptions
+
+        self.requests += 1
+        _, version = self.documents.get(path, ({}, 0))
+        if cas != version:
+            raise hvac.exceptions.InvalidRequest("check-and-set parameter did not match the current version")
+        self.documents[path] = (dict(secret), version + 1)
+        return {"data": {"version": version + 1}}
+
+
+@pytest.fixture
+def vault_kv_v2(gvault_secret, monkeypatch):
+    kv = FakeKvV2()
+
+    monkeypatch.setattr("hvac.Client.is_authenticated", lambda cls: True)
+    monkeypatch.setattr(
+        "hvac.api.secrets_engines.kv_v2.KvV2.read_secret_version",
+        lambda cls, path, mount_point: kv.read_secret_version(cls, path, mount_point),
+    )
+    monkeypatch.setattr(
+        "hvac.api.secrets_engines.kv_v2.KvV2.create_or_update_secret",
+        lambda cls, path, secret, cas, mount_point: kv.create_or_update_secret(cls, path, secret, cas, mount_point),
+    )
+    gvault_secret.settings["GLUU_SECRET_VAULT_LAYOUT"] = "document"
+    return kv
+
+
+def test_vault_secret_document_layout(gvault_secret, vault_kv_v2):
+    assert gvault_secret.get("foo", "default") == "default"
+    assert gvault_secret.set_all({"foo": "bar", "baz": 1}) is True
+    assert gvault_secret.set("qux", "quux") is True
+
+    assert vault_kv_v2.documents["gluu"] == ({"foo": "bar", "baz": "1", "qux": "quux"}, 2)
+    assert gvault_secret.get("foo") == "bar"
+    assert gvault_secret.get_all() == {"foo": "bar", "baz": "1", "qux": "quux"}
+
+
+def test_vault_secret_document_layout_sharded(gvault_secret, vault_kv_v2):
+    gvault_secret.settings["GLUU_SECRET_VAULT_DOCUMENT_SHARDS"] = 4
+    data = {f"key_{i}": f"value_{i}" for i in range(20)}
+
+    gvault_secret.set_all(data)
+    # each document is read once (as it's unknown), then written once
+    assert vault_kv_v2.requests == 2 * len(vault_kv_v2.documents)
+    assert set(vault_kv_v2.documents) <= {f"gluu/{i}" for i in range(4)}
+
+    vault_kv_v2.requests = 0
+    assert gvault_secret.get_all() == data
+    assert vault_kv_v2.requests == 4
+
+
+def test_vault_secret_document_layout_cas_conflict(gvault_secret, vault_kv_v2):
+    gvault_secret.set("foo", "bar")
+
+    # document changed by other client
+    vault_kv_v2.documents["gluu"] = ({"foo": "bar", "baz": "qux"}, 2)
+
+    gvault_secret.set("foo", "BAR")
+    assert vault_kv_v2.documents["gluu"] == ({"foo": "BAR", "baz": "qux"}, 3)
+
+
+def test_vault_secret_migrate_to_document(gvault_secret, vault_kv_v2, monkeypatch):
+    deleted = []
+
+    monkeypatch.setattr(
+        "hvac.Client.list",
+        lambda cls, key: {"data": {"keys": ["foo", "baz"]}},
+    )
+    monkeypatch.setattr(
+        "hvac.Client.read",
+        lambda cls, key: {"data": {"value": key.rsplit("/", 1)[-1].upper()}},
+    )
+    monkeypatch.setattr("hvac.Client.delete", lambda cls, key: deleted.append(key))
+
+    assert gvault_secret.migrate_to_document(delete=True) == ["baz", "foo"]
+    assert gvault_secret.get_all() == {"foo": "FOO", "baz": "BAZ"}
+    assert sorted(deleted) == ["secret/testing/baz", "secret/testing/foo"]
+
+
+def test_vault_secret_invalid_layout(gvault_secret):
+    gvault_secret.settings["GLUU_SECRET_VAULT_LAYOUT"] = "random"
+
+    with pytest.raises(ValueError):
+        gvault_secret.get("foo")
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("5", 5),
+    ("0", 1),
+    ("not_integer", 10),
+])
+def test_vault_secret_concurrency(gvault_secret, value, expected):
+    gvault_secret.settings["GLUU_SECRET_VAULT_CONCURRENCY"] = value
+    assert gvault_secret.concurrency == expected
+
+
 def test_vault_secret_all_empty(gvault_secret, monkeypatch):
     monkeypatch.setattr(
         "hvac.Client.is_authenticated",
@@ -294,6 +598,41 @@ def test_k8s_secret_incluster():
         secret.client
 
 
+def test_k8s_secret_watch_mirror(gk8s_secret, monkeypatch):
+    gk8s_secret.name_exists = True
+
+    monkeypatch.setattr(
+        "pygluu.containerlib.secret.kubernetes_secret.KubernetesSecret._watch_loop",
+        lambda cls, stop: None,
+    )
+    monkeypatch.setattr(
+        "kubernetes.client.CoreV1Api.read_namespaced_secret",
+        lambda cls, n, ns: KubeObject(
+            data={"foo": base64.b64encode(b"bar").decode()},
+            metadata=KubeMetadata("10"),
+        ),
+    )
+    gk8s_secret.watch()
+
+    def _raise_exc(*args, **kwargs):
+        raise AssertionError("reads must be served locally")
+
+    monkeypatch.setattr(
+        "kubernetes.client.CoreV1Api.read_namespaced_secret",
+        _raise_exc,
+    )
+    assert gk8s_secret.get("foo") == "bar"
+
+
+def test_k8s_secret_watch_callback(gk8s_secret):
+    changes = []
+    gk8s_secret.add_watch_callback(lambda k, v: changes.append((k, v)))
+
+    gk8s_secret._sync_mirror({"foo": base64.b64encode(b"bar").decode()})
+    gk8s_secret._sync_mirror({"lorem": base64.b64encode(b"ipsum").decode()})
+    assert sorted(changes) == [("foo", None), ("lorem", "ipsum")]
+
+
 def test_k8s_secret_set_all(gk8s_secret, monkeypatch):
     gk8s_secret.name_exists = True
 
@@ -302,3 +641,240 @@ def test_k8s_secret_set_all(gk8s_secret, monkeypatch):
         lambda cls, n, ns, body: True
     )
     assert gk8s_secret.set_all({"foo": "bar"}) is True
+
+
+# ==========
+# aws secret
+# ==========
+
+
+def test_aws_secret_get_all_unchanged(gaws_secret):
+    gaws_secret.set_all({"foo": "bar"})
+    gaws_secret.client.calls.clear()
+
+    assert gaws_secret.get("foo") == "bar"
+    assert gaws_secret.client.calls["list_secrets"] == 0
+    assert gaws_secret.client.calls["get_secret_value"] == 0
+
+
+def test_aws_secret_get_all_changed_part(gaws_secret, monkeypatch):
+    # uncompressed payload, so changes in a single part can be simulated
+    monkeypatch.setenv("GLUU_PAYLOAD_COMPRESSION", "none")
+    gaws_secret.max_payload_size = 16
+    gaws_secret.set_all({"foo": "bar", "lorem": "ipsum"})
+    parts = len(gaws_secret._versions)
+    assert parts > 1
+
+    # simulate changes made by other client on a single part only
+    name = [
+        name for name, fragment in gaws_secret._fragments.items()
+        if b"ipsum" in fragment
+    ][0]
+    fragment = gaws_secret.client.secrets[name]["SecretBinary"]
+    gaws_secret.client.update_secret(SecretId=name, SecretBinary=fragment.replace(b"ipsum", b"ipsun"))
+    gaws_secret.client.calls.clear()
+
+    assert gaws_secret.get("lorem") == "ipsun"
+    assert gaws_secret.client.calls["get_secret_value"] == 1
+
+
+def test_aws_secret_get_all_multipart_order(gaws_secret, monkeypatch):
+    monkeypatch.setenv("GLUU_PAYLOAD_COMPRESSION", "none")
+    gaws_secret.max_payload_size = 8
+    data = {f"key_{i}": f"value_{i}" for i in range(10)}
+    gaws_secret.set_all(data)
+    assert len(gaws_secret._versions) > 10
+
+    # fresh reader has no cached fragments, hence all parts are downloaded
+    gaws_secret._data = {}
+    gaws_secret._versions = {}
+    gaws_secret._fragments = {}
+    assert gaws_secret.get_all() == data
+
+
+def test_aws_secret_get_all_legacy_payload(gaws_secret):
+    import json
+
+    gaws_secret.set_all({})
+    gaws_secret.client.update_secret(SecretId=gaws_secret.basepath, SecretBinary=json.dumps({"foo": "bar"}))
+    assert gaws_secret.get("foo") == "bar"
+
+
+def test_aws_secret_set_all_uncompressed(gaws_secret):
+    import json
+
+    # plain JSON by default, so older readers can parse it
+    gaws_secret.set_all({"foo": "bar"})
+    assert json.loads(gaws_secret.client.secrets[gaws_secret.basepath]["SecretBinary"]) == {"foo": "bar"}
+
+
+def test_aws_secret_set_all_compressed(gaws_secret, monkeypatch):
+    from pygluu.containerlib.utils import PAYLOAD_MAGIC
+
+    monkeypatch.setenv("GLUU_PAYLOAD_COMPRESSION", "zlib")
+    gaws_secret.set_all({"foo": "bar"})
+    assert gaws_secret.client.secrets[gaws_secret.basepath]["SecretBinary"].startswith(PAYLOAD_MAGIC)
+    assert gaws_secret.get_all() == {"foo": "bar"}
+
+
+def test_aws_secret_set_all_shrink_parts(gaws_secret, monkeypatch):
+    monkeypatch.setenv("GLUU_PAYLOAD_COMPRESSION", "none")
+    gaws_secret.max_payload_size = 64
+    gaws_secret.set_all({f"key_{i}": "x" * 32 for i in range(10)})
+    parts = len(gaws_secret._versions)
+    assert parts > 2
+
+    # compressed payload fits into fewer parts
+    monkeypatch.setenv("GLUU_PAYLOAD_COMPRESSION", "zlib")
+    gaws_secret.set_all({})
+    trailing = [name for name, fragment in gaws_secret._fragments.items() if not fragment]
+    assert trailing
+    assert all(not gaws_secret.client.secrets[name]["SecretBinary"] for name in trailing)
+    assert len(gaws_secret._versions) == parts
+
+    # fresh reader joins all parts, including the emptied ones
+    data = gaws_secret.get_all()
+    gaws_secret._data = None
+    gaws_secret._versions = {}
+    gaws_secret._fragments = {}
+    assert gaws_secret.get_all() == data
+    assert len(data) == 10
+
+
+# ===================
+# google async secret
+# ===================
+
+
+Secret = namedtuple("Secret", ["name"])
+SecretVersion = namedtuple("SecretVersion", ["payload"])
+Payload = namedtuple("Payload", ["data"])
+
+
+class FakeGoogleAsyncClient:
+    """Fake ``SecretManagerServiceAsyncClient`` keeping the latest version of each secret."""
+
+    def __init__(self):
+        self.secrets = {}
+
+    async def list_secrets(self, request):
+        async def pager():
+            for name in list(self.secrets):
+                yield Secret(f"projects/testing/secrets/{name}")
+        return pager()
+
+    async def access_secret_version(self, request):
+        from google.api_core.exceptions import NotFound
+
+        name = request["name"].split("/")[3]
+        if name not in self.secrets:
+            raise NotFound(name)
+        return SecretVersion(Payload(self.secrets[name]))
+
+    async def create_secret(self, request):
+        self.secrets.setdefault(request["secret_id"], b"")
+        return Secret(f"projects/testing/secrets/{request['secret_id']}")
+
+    async def add_secret_version(self, request):
+        name = request["parent"].split("/")[3]
+        self.secrets[name] = request["payload"]["data"]
+        return Secret(f"{request['parent']}/versions/1")
+
+
+def test_async_google_secret_multipart(monkeypatch):
+    pytest.importorskip("google.cloud.secretmanager")
+    import asyncio
+    from pygluu.containerlib.secret import AsyncGoogleSecret
+    from pygluu.containerlib.secret import GoogleSecret
+
+    client = FakeGoogleAsyncClient()
+    monkeypatch.setattr(AsyncGoogleSecret, "client", property(lambda self: client))
+    monkeypatch.setenv("GOOGLE_PROJECT_ID", "testing")
+    secret = GoogleSecret()
+    secret.max_payload_size = 16
+    async_secret = AsyncGoogleSecret(secret)
+
+    data = {"foo": "bar", "lorem": "ipsum" * 4}
+    assert asyncio.run(async_secret.set_all(data)) is True
+    assert len(client.secrets) > 1
+    assert all(len(fragment) <= 16 for fragment in client.secrets.values())
+
+    # names of all parts are listed once the payload is written
+    secret._names = []
+    assert asyncio.run(async_secret.get_all()) == data
+    assert asyncio.run(async_secret.get("foo")) == "bar"
+
+
+# ===========
+# file secret
+# ===========
+
+
+def test_file_secret_dir(tmpdir, monkeypatch):
+    from pygluu.containerlib.secret.file_secret import FileSecret
+
+    tmpdir.join("foo").write("bar")
+    tmpdir.join(".hidden").write("secret")
+    monkeypatch.setenv("GLUU_SECRET_FILE_PATH", str(tmpdir))
+    secret = FileSecret()
+
+    assert secret.get_all() == {"foo": "bar"}
+    assert secret.set_all({"lorem": "ipsum"}) is True
+    assert tmpdir.join("lorem").read() == "ipsum"
+    assert tmpdir.join("lorem").stat().mode & 0o777 == 0o600
+    assert secret.get("lorem") == "ipsum"
+
+    with pytest.raises(ValueError):
+        secret.set("../escape", "value")
+
+
+def test_file_secret_json_mode(tmpdir, monkeypatch):
+    from pygluu.containerlib.secret.file_secret import FileSecret
+
+    path = tmpdir.join("secret.json")
+    monkeypatch.setenv("GLUU_SECRET_FILE_PATH", str(path))
+
+    assert FileSecret().set("foo", "bar") is True
+    assert path.stat().mode & 0o777 == 0o600
+
+
+def test_file_secret_kubernetes_volume(tmpdir, monkeypatch):
+    import os
+    from pygluu.containerlib.secret.file_secret import FileSecret
+
+    # mimic layout of projected volume managed by kubelet
+    tmpdir.mkdir("..2024_01_01").join("foo").write("bar")
+    os.symlink("..2024_01_01", str(tmpdir.join("..data")))
+    os.symlink("..data/foo", str(tmpdir.join("foo")))
+
+    monkeypatch.setenv("GLUU_SECRET_FILE_PATH", str(tmpdir))
+    secret = FileSecret()
+    assert secret.get_all() == {"foo": "bar"}
+
+    # kubelet swaps the ``..data`` symlink atomically
+    tmpdir.mkdir("..2024_01_02").join("foo").write("baz")
+    os.symlink("..2024_01_02", str(tmpdir.join("..data_tmp")))
+    os.replace(str(tmpdir.join("..data_tmp")), str(tmpdir.join("..data")))
+    assert secret.get("foo") == "baz"
+
+
+def test_k8s_secret_wait_for_key(gk8s_secret, monkeypatch):
+    class Client:
+        def read_namespaced_secret(self, name, namespace):
+            return KubeObject(
+                data={"ssl_cert": base64.b64encode(b"cert").decode()},
+                metadata=KubeMetadata(resource_version="1"),
+            )
+
+    def _raise_exc(*args, **kwargs):
+        raise AssertionError("key is set, hence Secret must not be watched")
+
+    monkeypatch.setattr("kubernetes.watch.Watch", _raise_exc)
+    gk8s_secret._client = Client()
+    assert gk8s_secret.wait_for_key("ssl_cert", timeout=60) == "cert"
+
+
+def test_secret_wait_for_key_poll(gvault_secret, monkeypatch):
+    # adapter without change notifications checks the key once
+    monkeypatch.setattr(gvault_secret, "get", lambda key, default="": "")
+    assert gvault_secret.wait_for_key("ssl_cert", timeout=60, default="default") == "default"
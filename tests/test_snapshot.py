@@ -0,0 +1,143 @@
+import time
+
+import pytest
+
+
+class FailingAdapter(object):
+    def __init__(self, data=None):
+        self.data = dict(data or {})
+        self.failing = False
+        self.calls = 0
+
+    def get(self, k, default=None):
+        return self.data.get(k) or default
+
+    def get_all(self):
+        self.calls += 1
+        if self.failing:
+            raise RuntimeError("backend is unreachable")
+        return dict(self.data)
+
+
+@pytest.fixture()
+def key_file(tmpdir):
+    file_ = tmpdir.join("salt")
+    file_.write("encode_salt = " + "a" * 24)
+    return str(file_)
+
+
+@pytest.fixture()
+def snapshot_env(monkeypatch, tmpdir, key_file):
+    monkeypatch.setenv("GLUU_MANAGER_SNAPSHOT_DIR", str(tmpdir.mkdir("snapshots")))
+    monkeypatch.setenv("GLUU_MANAGER_SNAPSHOT_KEY_FILE", key_file)
+    return tmpdir
+
+
+def test_snapshot_save_load(tmpdir, key_file):
+    from pygluu.containerlib.snapshot import Snapshot
+
+    path = str(tmpdir.join("config.snapshot"))
+    snapshot = Snapshot(path, key_file=key_file)
+    assert snapshot.load() is None
+
+    assert snapshot.save({"foo": "bar"}) is True
+    # unchanged data is not rewritten
+    assert snapshot.save({"foo": "bar"}) is False
+
+    # stored data is encrypted
+    assert b"bar" not in tmpdir.join("config.snapshot").read_binary()
+
+    loaded = Snapshot(path, key_file=key_file).load()
+    assert loaded.data == {"foo": "bar"}
+    assert loaded.digest
+
+
+def test_snapshot_save_unchanged_refresh_created_at(tmpdir, key_file):
+    from pygluu.containerlib.snapshot import Snapshot
+
+    path = str(tmpdir.join("config.snapshot"))
+    now = [1000]
+    snapshot = Snapshot(path, key_file=key_file, max_staleness=60, timer=lambda: now[0])
+    snapshot.save({"foo": "bar"})
+    token = tmpdir.join("config.snapshot").read_binary()
+
+    now[0] += 50
+    assert snapshot.save({"foo": "bar"}) is False
+    # payload is not rewritten
+    assert tmpdir.join("config.snapshot").read_binary() == token
+
+    now[0] += 50
+    loaded = Snapshot(path, key_file=key_file, max_staleness=60, timer=lambda: now[0]).load()
+    assert loaded.created_at == 1050
+    assert snapshot.is_stale(loaded) is False
+
+
+def test_snapshot_load_wrong_key(tmpdir, key_file):
+    from pygluu.containerlib.snapshot import Snapshot
+
+    path = str(tmpdir.join("config.snapshot"))
+    Snapshot(path, key_file=key_file).save({"foo": "bar"})
+
+    other_key = tmpdir.join("other_salt")
+    other_key.write("b" * 24)
+    assert Snapshot(path, key_file=str(other_key)).load() is None
+
+
+def test_snapshot_stale(tmpdir, key_file):
+    from pygluu.containerlib.snapshot import Snapshot
+
+    now = [1000]
+    snapshot = Snapshot(str(tmpdir.join("config.snapshot")), key_file=key_file, max_staleness=60, timer=lambda: now[0])
+    snapshot.save({"foo": "bar"})
+
+    loaded = snapshot.load()
+    now[0] += 61
+    assert snapshot.is_stale(loaded)
+
+
+def test_manager_boot_from_snapshot(snapshot_env):
+    from pygluu.containerlib.manager import ConfigManager
+
+    manager = ConfigManager()
+    manager.adapter = FailingAdapter({"foo": "bar"})
+    assert manager.get("foo") == "bar"
+
+    # next start serves the first read from snapshot and revalidates in background
+    manager = ConfigManager()
+    adapter = FailingAdapter({"foo": "baz"})
+    manager.adapter = adapter
+    assert manager.get("foo") == "bar"
+
+    deadline = time.monotonic() + 5
+    while manager.get("foo") != "baz" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert manager.get("foo") == "baz"
+    assert adapter.calls == 1
+
+
+def test_manager_snapshot_fallback(snapshot_env):
+    from pygluu.containerlib.manager import SecretManager
+
+    manager = SecretManager()
+    adapter = FailingAdapter({"foo": "bar"})
+    manager.adapter = adapter
+    assert manager.get("foo") == "bar"
+
+    adapter.failing = True
+    manager.invalidate()
+    assert manager.get("foo") == "bar"
+
+
+def test_manager_snapshot_fallback_stale(snapshot_env, monkeypatch):
+    from pygluu.containerlib.manager import SecretManager
+
+    monkeypatch.setenv("GLUU_MANAGER_SNAPSHOT_MAX_STALENESS", "0")
+    manager = SecretManager()
+    adapter = FailingAdapter({"foo": "bar"})
+    manager.adapter = adapter
+    assert manager.get("foo") == "bar"
+
+    adapter.failing = True
+    manager.invalidate()
+    with pytest.raises(RuntimeError):
+        manager.get("foo")
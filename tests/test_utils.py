@@ -1,3 +1,5 @@
+import json
+import lzma
 import os
 import shutil
 import distro
@@ -117,6 +119,117 @@ def test_decode_text(encoded_text, key, expected):
     assert decode_text(encoded_text, key) == expected
 
 
+def test_codec_encode_decode_many():
+    from pygluu.containerlib.utils import Codec
+    from pygluu.containerlib.utils import encode_text
+
+    codec = Codec("a" * 24)
+    texts = ["abcd", b"secret text", b"", "x" * 100]
+
+    encoded = codec.encode_many(texts)
+    assert encoded == [encode_text(text, "a" * 24) for text in texts]
+    assert codec.decode_many(encoded) == [
+        text.encode() if isinstance(text, str) else text for text in texts
+    ]
+
+
+def test_codec_thread_safe():
+    from concurrent.futures import ThreadPoolExecutor
+    from pygluu.containerlib.utils import Codec
+
+    codec = Codec(b"a" * 24)
+    texts = [f"text-{i}" * i for i in range(200)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda text: codec.decode(codec.encode(text)), texts))
+    assert results == [text.encode() for text in texts]
+
+
+def test_codec_decode_invalid():
+    from pygluu.containerlib.utils import Codec
+
+    with pytest.raises(ValueError):
+        Codec("a" * 24).decode("YWJj")
+
+
+def test_codec_aes_gcm():
+    from pygluu.containerlib.utils import AES_GCM_PREFIX
+    from pygluu.containerlib.utils import Codec
+
+    codec = Codec("a" * 24, mode="aes-gcm")
+    encoded = codec.encode("secret text")
+
+    assert encoded.startswith(AES_GCM_PREFIX)
+    # random nonce produces different ciphertext for the same text
+    assert encoded != codec.encode("secret text")
+    assert codec.decode(encoded) == b"secret text"
+
+    with pytest.raises(ValueError):
+        Codec("b" * 24).decode(encoded)
+
+
+def test_codec_decode_detect_mode():
+    from pygluu.containerlib.utils import Codec
+    from pygluu.containerlib.utils import decode_text
+    from pygluu.containerlib.utils import encode_text
+
+    gcm_text = encode_text("abcd", "a" * 24, mode="aes-gcm")
+    assert decode_text(gcm_text, "a" * 24) == b"abcd"
+    assert Codec("a" * 24).decode_many([gcm_text, "YgH8NDxhxmA=", gcm_text]) == [b"abcd"] * 3
+
+
+def test_codec_invalid_mode():
+    from pygluu.containerlib.utils import Codec
+
+    with pytest.raises(ValueError):
+        Codec("a" * 24, mode="rot13")
+
+
+@pytest.mark.parametrize("compression", ["zlib", "lzma", "none"])
+def test_dump_load_payload(compression):
+    from pygluu.containerlib.utils import dump_payload
+    from pygluu.containerlib.utils import load_payload
+
+    data = {"foo": "bar", "keystore": "QUJD" * 1024}
+    payload = dump_payload(data, compression)
+
+    if compression != "none":
+        assert len(payload) < len(json.dumps(data))
+    assert load_payload(payload) == data
+
+
+@pytest.mark.parametrize("payload", [
+    '{"foo": "bar"}',  # plain JSON
+    b'{"foo": "bar"}',
+    lzma.compress(b'{"foo": "bar"}'),  # lzma without envelope
+])
+def test_load_payload_legacy(payload):
+    from pygluu.containerlib.utils import load_payload
+    assert load_payload(payload) == {"foo": "bar"}
+
+
+def test_load_payload_truncated():
+    from pygluu.containerlib.utils import dump_payload
+    from pygluu.containerlib.utils import load_payload
+
+    with pytest.raises(ValueError):
+        load_payload(dump_payload({"foo": "bar" * 100})[:-4])
+
+
+def test_get_payload_compression(monkeypatch):
+    from pygluu.containerlib.utils import get_payload_compression
+
+    # compression is opt-in
+    assert get_payload_compression() == "none"
+
+    monkeypatch.setenv("GLUU_PAYLOAD_COMPRESSION", "zlib")
+    assert get_payload_compression() == "zlib"
+
+    monkeypatch.setenv("GLUU_PAYLOAD_COMPRESSION", "snappy")
+    with pytest.raises(ValueError):
+        get_payload_compression()
+
+
 @pytest.mark.skipif(
     shutil.which("keytool") is None,
     reason="requires keytool executable"
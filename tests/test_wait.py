@@ -53,3 +53,288 @@ def test_on_giveup(caplog):
     details = {"kwargs": {"label": "Service"}, "elapsed": 10.0}
     on_giveup(details)
     assert "is not ready after" in caplog.records[0].message
+
+
+def test_wait_for_concurrent(monkeypatch):
+    import threading
+    from pygluu.containerlib import wait
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def check(manager, **kwargs):
+        # both checks must be running at the same time to pass the barrier
+        barrier.wait()
+
+    monkeypatch.setattr(wait, "wait_for_oxauth", check)
+    monkeypatch.setattr(wait, "wait_for_oxtrust", check)
+    wait.wait_for(None, ["oxauth", "oxtrust"])
+
+
+def test_wait_for_requirements_order(monkeypatch):
+    from pygluu.containerlib import wait
+
+    calls = []
+
+    def check(manager, **kwargs):
+        calls.append(kwargs["label"])
+
+    for name in ("wait_for_config", "wait_for_secret", "wait_for_ldap"):
+        monkeypatch.setattr(wait, name, check)
+
+    wait.wait_for(None, ["ldap", "config", "secret"])
+    assert calls[-1] == "LDAP"
+    assert sorted(calls[:2]) == ["Config", "Secret"]
+
+
+def test_wait_for_combined_error(monkeypatch):
+    from pygluu.containerlib import wait
+
+    calls = []
+
+    def failing_check(manager, **kwargs):
+        raise wait.WaitError(f"{kwargs['label']} is down")
+
+    monkeypatch.setattr(wait, "wait_for_config", failing_check)
+    monkeypatch.setattr(wait, "wait_for_oxauth", failing_check)
+    monkeypatch.setattr(wait, "wait_for_couchbase", lambda manager, **kwargs: calls.append(1))
+
+    with pytest.raises(wait.WaitError) as exc:
+        wait.wait_for(None, ["config", "couchbase", "oxauth", "random"])
+
+    assert set(exc.value.errors) == {"config", "couchbase", "oxauth"}
+    assert "skipped as config is not ready" in str(exc.value.errors["couchbase"]).lower()
+    # couchbase is never checked as config is not ready
+    assert calls == []
+
+
+def test_wait_for_deadline_per_check_max_time(monkeypatch):
+    from pygluu.containerlib import wait
+
+    monkeypatch.setenv("GLUU_WAIT_MAX_TIME", "10")
+    monkeypatch.setenv("GLUU_WAIT_MAX_TIME_OXAUTH", "600")
+    max_times = {}
+
+    @wait.retry_on_exception
+    def wait_for_oxauth(manager, **kwargs):
+        max_times["oxauth"] = wait.get_wait_max_time()
+
+    @wait.retry_on_exception
+    def wait_for_oxtrust(manager, **kwargs):
+        max_times["oxtrust"] = wait.get_wait_max_time()
+
+    monkeypatch.setattr(wait, "wait_for_oxauth", wait_for_oxauth)
+    monkeypatch.setattr(wait, "wait_for_oxtrust", wait_for_oxtrust)
+    wait.wait_for(None, ["oxauth", "oxtrust"])
+
+    # per-check max. time is not capped by the global one
+    assert max_times["oxauth"] > 500
+    assert max_times["oxtrust"] == 10
+
+
+def test_get_wait_max_time_deadline(monkeypatch):
+    import time
+    from pygluu.containerlib import wait
+
+    monkeypatch.setattr(wait._local, "deadline", time.monotonic() + 29.5, raising=False)
+    assert wait.get_wait_max_time() == 30
+
+
+def test_wait_for_sql_reuse_client(monkeypatch):
+    from pygluu.containerlib import wait
+    from pygluu.containerlib.registry import clients
+
+    created = []
+
+    class FakeSQLClient:
+        def __init__(self):
+            created.append(self)
+
+        def row_exists(self, table_name, id_):
+            if len(created) == 1:
+                raise ConnectionError("connection is dropped")
+            return len(created) > 1 and id_ == "1234"
+
+    class FakeManager:
+        class config:
+            def get(key):
+                return "1234"
+
+    monkeypatch.setattr("pygluu.containerlib.persistence.sql.SQLClient", FakeSQLClient)
+    wait_for_sql = wait.wait_for_sql.__wrapped__
+
+    # broken client is discarded
+    with pytest.raises(ConnectionError):
+        wait_for_sql(FakeManager)
+    assert wait._sql_client_key() not in clients
+
+    # new client is created, then kept across retries
+    wait_for_sql(FakeManager)
+    wait_for_sql(FakeManager)
+    assert len(created) == 2
+
+
+def test_wait_for_ldap_client_key_without_password(monkeypatch):
+    from pygluu.containerlib import wait
+    from pygluu.containerlib.registry import clients
+
+    class FakeLdapClient:
+        def __init__(self, manager):
+            self.conn = type("Connection", (), {"bound": True})()
+
+    class FakeManager:
+        class config:
+            def get(key, default=""):
+                return "cn=directory manager"
+
+        class secret:
+            def get(key, default=""):
+                return "s3cr3t"
+
+    monkeypatch.setattr("pygluu.containerlib.persistence.ldap.LdapClient", FakeLdapClient)
+    monkeypatch.setattr(clients, "_objects", {})
+
+    with wait._ldap_probe_client(FakeManager):
+        pass
+
+    [key] = clients._objects
+    assert key[:2] == ("wait", "ldap")
+    assert "s3cr3t" not in key
+
+
+def test_wait_for_oxauth_session_reused(monkeypatch):
+    from collections import namedtuple
+    from pygluu.containerlib import wait
+
+    Response = namedtuple("Response", ["ok", "reason"])
+    urls = []
+
+    def get(self, url, **kwargs):
+        urls.append(url)
+        return Response(True, "OK")
+
+    monkeypatch.setattr("requests.Session.get", get)
+    wait.wait_for_oxauth.__wrapped__(None)
+    wait.wait_for_oxauth.__wrapped__(None)
+
+    assert len(urls) == 2
+    assert wait._http_session() is wait._http_session()
+
+
+def test_wait_for_oxauth_request_timeout(monkeypatch):
+    import time
+    from collections import namedtuple
+    from pygluu.containerlib import wait
+
+    Response = namedtuple("Response", ["ok", "reason"])
+    timeouts = []
+
+    def get(self, url, **kwargs):
+        timeouts.append(kwargs["timeout"])
+        return Response(True, "OK")
+
+    monkeypatch.setattr("requests.Session.get", get)
+    with wait.wait_deadline(time.monotonic() + 2):
+        wait.wait_for_oxauth.__wrapped__(None)
+
+    # request is bounded by the remaining time of the deadline
+    assert 0 < timeouts[0] <= 2
+
+
+def _intervals(count):
+    from pygluu.containerlib.wait import wait_gen
+
+    gen = wait_gen()
+    gen.send(None)
+    return [next(gen) for _ in range(count)]
+
+
+@pytest.mark.parametrize("strategy", ["constant", "random"])
+def test_wait_gen_constant(monkeypatch, strategy):
+    monkeypatch.setenv("GLUU_WAIT_STRATEGY", strategy)
+    monkeypatch.setenv("GLUU_WAIT_SLEEP_DURATION", "5")
+    assert _intervals(3) == [5, 5, 5]
+
+
+def test_wait_gen_expo(monkeypatch):
+    monkeypatch.setenv("GLUU_WAIT_STRATEGY", "expo")
+    monkeypatch.setenv("GLUU_WAIT_SLEEP_DURATION", "5")
+    # no jitter, so upper bounds are returned
+    monkeypatch.setattr("random.uniform", lambda a, b: b)
+    assert _intervals(5) == [1, 2, 4, 5, 5]
+
+
+def test_wait_gen_decorrelated(monkeypatch):
+    monkeypatch.setenv("GLUU_WAIT_STRATEGY", "decorrelated")
+    monkeypatch.setenv("GLUU_WAIT_BASE_INTERVAL", "0.5")
+    monkeypatch.setenv("GLUU_WAIT_SLEEP_DURATION", "10")
+
+    intervals = _intervals(50)
+    assert all(0.5 <= interval <= 10 for interval in intervals)
+
+
+def test_wait_settings_per_check(monkeypatch):
+    from pygluu.containerlib import wait
+
+    monkeypatch.setenv("GLUU_WAIT_MAX_TIME", "100")
+    monkeypatch.setenv("GLUU_WAIT_MAX_TIME_COUCHBASE", "20")
+    monkeypatch.setenv("GLUU_WAIT_SLEEP_DURATION_COUCHBASE", "not_integer")
+
+    settings = {}
+
+    @wait.retry_on_exception
+    def wait_for_couchbase(manager, **kwargs):
+        settings.update(max_time=wait.get_wait_max_time(), interval=wait.get_wait_interval())
+
+    wait_for_couchbase(None, label="Couchbase")
+    assert settings == {"max_time": 20, "interval": 10}
+    # global settings are used outside the check
+    assert wait.get_wait_max_time() == 100
+
+
+def test_retry_budget():
+    from pygluu.containerlib.wait import RetryBudget
+
+    now = [0.0]
+    sleeps = []
+
+    def sleep(delay):
+        sleeps.append(delay)
+
+    budget = RetryBudget(rate=2, burst=2, timer=lambda: now[0], sleep=sleep)
+    assert budget.acquire() == 0
+    assert budget.acquire() == 0
+    # bucket is empty
+    assert budget.acquire() == 0.5
+    assert budget.acquire() == 1.0
+
+    # refilled after 2 seconds
+    now[0] = 2.5
+    assert budget.acquire() == 0
+    assert sleeps == [0.5, 1.0]
+
+
+def test_retry_budget_disabled(monkeypatch):
+    from pygluu.containerlib.wait import get_retry_budget
+
+    monkeypatch.setenv("GLUU_WAIT_RETRY_RATE", "not_float")
+    budget = get_retry_budget()
+    assert budget.rate == 0
+    assert all(budget.acquire() == 0 for _ in range(100))
+
+
+def test_wait_for_config_wait_for_key(monkeypatch):
+    from pygluu.containerlib import wait
+
+    timeouts = []
+
+    class Config:
+        def wait_for_key(self, key, timeout):
+            timeouts.append(timeout)
+            return "demoexample.gluu.org"
+
+    class Manager:
+        config = Config()
+
+    monkeypatch.setenv("GLUU_WAIT_MAX_TIME_CONFIG", "30")
+    wait.wait_for_config(Manager(), label="Config")
+    assert timeouts == [30]